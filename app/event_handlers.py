@@ -1,18 +1,23 @@
 """Event handlers for the murder mystery game."""
 
 import os
+import contextvars
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Tuple
 import gradio as gr
 from mystery_config import get_settings_for_era, create_validated_config
 from game.state_manager import get_or_create_state, mystery_images
 from game.startup import start_new_game_staged, refresh_voices
 from services.game_memory import reset_game_memory
+from services.agent_history import reset_conversation_history
 from services.mystery_oracle import reset_mystery_oracle
+from services.media_scheduler import get_media_scheduler
 from game.handlers import process_player_action, run_action_logic
 from game.media import generate_turn_media
 from services.tts_service import transcribe_audio
+from services.speech_stream import peek_speech_stream
 from services.perf_tracker import perf
 from ui.formatters import (
     format_suspects_list_html,
@@ -28,6 +33,11 @@ from app.utils import convert_alignment_to_subtitles
 
 logger = logging.getLogger(__name__)
 
+# How often the voice handler checks for finished speech segments
+_SPEECH_POLL_SECONDS = 0.1
+# Longest wait for the last streamed segments once the turn logic is done
+_SPEECH_DRAIN_TIMEOUT = 30.0
+
 
 def normalize_session_id(sess_id) -> str:
     """Ensure we always use a *stable* string session id.
@@ -90,6 +100,33 @@ def format_accusations_html(state) -> str:
     )
 
 
+def format_contradiction_notifications_html(state) -> str:
+    """Banner for contradictions found by background timeline checks.
+
+    Drains the state's notifications, so each one is shown once. Checks
+    usually finish during the turn that started them, so they appear with
+    that turn's final update (or the next one).
+    """
+    notifications = state.pop_contradiction_notifications()
+    banners = []
+    for notification in notifications:
+        logger.info("⚠️ [UI] Contradiction notification for %s", notification["suspect_name"])
+        banners.append(f'''
+        <div class="contradiction-notification" style="
+            background: linear-gradient(135deg, #4e1b1b 0%, #1a1a2e 100%);
+            border: 2px solid #e74c3c;
+            border-radius: 8px;
+            padding: 12px 16px;
+            margin: 8px 0;
+        ">
+            <span style="font-size: 1.2em;">⚠️</span>
+            <strong style="color: #ff6b6b;">{notification["suspect_name"]}</strong>
+            <span style="color: #e0e0e0;"> contradicted an earlier statement!</span>
+            <div style="color: #aaa; font-size: 0.9em; margin-top: 4px;">{notification["explanation"] or "Check the Timeline to compare their stories."}</div>
+        </div>''')
+    return "".join(banners)
+
+
 def on_config_generic_change(setting, era, difficulty, tone, sess_id):
     """Update config for non-era fields (setting/difficulty/tone)."""
     state = ensure_config(sess_id)
@@ -652,7 +689,8 @@ def on_custom_message(message: str, sess_id: str):
             audio_update = gr.update(value=audio_path)
 
     return [
-        f'<div class="speaker-name" style="padding: 16px 0 !important;">🗣️ {speaker} SPEAKING...</div>',
+        f'<div class="speaker-name" style="padding: 16px 0 !important;">🗣️ {speaker} SPEAKING...</div>'
+        + format_contradiction_notifications_html(state),
         audio_update,
         portrait_update,
         format_suspects_list_html(
@@ -733,14 +771,49 @@ def infer_voice_action_type(message: str, state) -> Tuple[str, str]:
     return action_type, target
 
 
+def _run_action_logic_with_live_speech(action_type, target, message, sess_id):
+    """Run run_action_logic on a worker thread, yielding speech segments as they finish.
+
+    The agent feeds the session's SpeechStream while it generates; once the
+    reply is known to be the Game Master's, each sentence's audio path is
+    yielded (in order) as soon as it is synthesized.
+    Returns (run_action_logic result, the turn's SpeechStream or None).
+    """
+    previous_stream = peek_speech_stream(sess_id)
+    context = contextvars.copy_context()
+    stream = None
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="turn-logic") as pool:
+        future = pool.submit(
+            context.run, run_action_logic, action_type, target, message, sess_id
+        )
+        while True:
+            wait([future], timeout=_SPEECH_POLL_SECONDS)
+            finished = future.done()
+            if stream is None:
+                current = peek_speech_stream(sess_id)
+                if current is not previous_stream:
+                    stream = current
+            if stream is not None:
+                for segment_path in stream.take_ready():
+                    logger.info("[TTS] Playing streamed segment %s", segment_path)
+                    yield segment_path
+            if finished:
+                break
+    return future.result(), stream
+
+
 def on_voice_input(audio_path: str, sess_id, progress=gr.Progress()):
     """Handle voice input with two-stage yield for faster perceived response.
 
-    Stage 1 (fast): Transcribe + run LLM logic, yield text/panels immediately
+    Stage 1 (fast): Transcribe + run LLM logic, yield text/panels immediately.
+        Game Master sentences are synthesized while the LLM is still
+        generating and streamed to the live audio player once the reply is
+        known to be the Game Master's (suspects speak with their own voice).
     Stage 2 (slow): Generate TTS audio + images, yield final update with audio
+        (the merged clip only autoplays if nothing was played live)
     """
     if not audio_path:
-        yield [gr.update()] * 15  # Must match game_outputs count
+        yield [gr.update()] * 16  # Must match game_outputs count
         return
 
     # Normalize session id so it matches what on_start_game used
@@ -752,12 +825,12 @@ def on_voice_input(audio_path: str, sess_id, progress=gr.Progress()):
         state_before, "premise_setting", None
     ):
         logger.warning("[APP] Voice input received but no game started yet")
-        yield [gr.update()] * 15  # Must match game_outputs count
+        yield [gr.update()] * 16  # Must match game_outputs count
         return
 
     # Show progress indicator while processing
     progress(0, desc="🗣️ Transcribing...")
-    yield [gr.update()] * 15  # Must match game_outputs count
+    yield [gr.update()] * 16  # Must match game_outputs count
 
     # Store previous state to detect what changed
     # IMPORTANT: Make copies of the lists since state is mutated in place
@@ -784,7 +857,7 @@ def on_voice_input(audio_path: str, sess_id, progress=gr.Progress()):
     logger.info("[PERF] Transcription took %.2fs", t1 - t0)
 
     if not text.strip():
-        yield [gr.update()] * 15  # Must match game_outputs count
+        yield [gr.update()] * 16  # Must match game_outputs count
         return
 
     # Infer high-level action type from the transcribed text
@@ -795,14 +868,22 @@ def on_voice_input(audio_path: str, sess_id, progress=gr.Progress()):
     progress(0.5, desc="🧠 Figuring out what happens...")
 
     t2 = time.perf_counter()
-    clean_response, speaker, state, actions, audio_path_from_tool = (
-        run_action_logic(
-            action_type,
-            target,
-            text if action_type == "custom" else "",
-            sess_id,
-        )
+    # Game Master sentences are played once the reply is known to be the GM's
+    speech_stream = None
+    live_speech = _run_action_logic_with_live_speech(
+        action_type,
+        target,
+        text if action_type == "custom" else "",
+        sess_id,
     )
+    while True:
+        try:
+            segment_path = next(live_speech)
+        except StopIteration as done:
+            result, speech_stream = done.value
+            break
+        yield [gr.update()] * 15 + [segment_path]
+    clean_response, speaker, state, actions, audio_path_from_tool = result
     t3 = time.perf_counter()
     logger.info("[PERF] Action logic took %.2fs", t3 - t2)
     progress(1.0, desc="🧠 Figuring out what happens...")
@@ -972,8 +1053,19 @@ def on_voice_input(audio_path: str, sess_id, progress=gr.Progress()):
             state.suspect_states,
             state.wrong_accusations
         ),
+        gr.update(),  # Live speech stream
     ]
 
+    # Play the sentences still being synthesized when the logic finished
+    if speech_stream is not None:
+        deadline = time.perf_counter() + _SPEECH_DRAIN_TIMEOUT
+        while speech_stream.pending() and time.perf_counter() < deadline:
+            for segment_path in speech_stream.take_ready():
+                yield [gr.update()] * 15 + [segment_path]
+            time.sleep(_SPEECH_POLL_SECONDS)
+        for segment_path in speech_stream.take_ready():
+            yield [gr.update()] * 15 + [segment_path]
+
     # ========== STAGE 2: SLOW - Generate audio + images ==========
     # Restart the progress counter for the voice generation phase
     progress(0, desc="🔊 Generating voice...")
@@ -1102,22 +1194,35 @@ def on_voice_input(audio_path: str, sess_id, progress=gr.Progress()):
         else gr.update()
     )
 
+    # If the merged clip was already heard live, it is only there for replay
+    # and subtitles; otherwise it is the turn's audio and plays now
+    played_live = bool(
+        speech_stream is not None
+        and speech_stream.delivered
+        and audio_resp
+        and audio_resp == speech_stream.merged_path
+    )
+    autoplay = not played_live
+
     # Update audio with subtitles if available
     audio_update = None
     if audio_resp:
         if subtitles:
             logger.info(f"[APP] Subtitles available: {len(subtitles)} entries, attempting to pass to audio component")
             try:
-                audio_update = gr.update(value=audio_resp, subtitles=subtitles, autoplay=True)
+                audio_update = gr.update(value=audio_resp, subtitles=subtitles, autoplay=autoplay)
                 logger.info("[APP] Successfully created audio update with subtitles")
             except TypeError as e:
                 logger.warning(f"[APP] Subtitles parameter not supported: {e}, falling back to audio only")
-                audio_update = gr.update(value=audio_resp, autoplay=True)
+                audio_update = gr.update(value=audio_resp, autoplay=autoplay)
         else:
-            audio_update = gr.update(value=audio_resp, autoplay=True)
+            audio_update = gr.update(value=audio_resp, autoplay=autoplay)
+
+    # Contradictions found by this turn's background checks (or earlier ones)
+    speaker_html += format_contradiction_notifications_html(state)
 
     yield [
-        speaker_html,  # Includes secret reveal notification if applicable
+        speaker_html,  # Includes secret reveal / contradiction notifications
         audio_update,
         portrait_update,
         format_suspects_list_html(
@@ -1170,6 +1275,7 @@ def on_voice_input(audio_path: str, sess_id, progress=gr.Progress()):
             state.suspect_states,
             state.wrong_accusations
         ),
+        gr.update(),  # Live speech stream
     ]
 
 
@@ -1467,8 +1573,11 @@ def on_restart_game(sess_id: str):
     state.reset_game()
     
     # Clear game memory and oracle
-    reset_game_memory()
-    reset_mystery_oracle()
+    reset_game_memory(sess_id)
+    reset_conversation_history(sess_id)
+    reset_mystery_oracle(sess_id)
+    # Drop queued image jobs; running ones discard their results
+    get_media_scheduler().cancel_session(sess_id)
     
     # Clear images for this session
     if sess_id in mystery_images:
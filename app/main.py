@@ -129,6 +129,7 @@ def create_app():
         main_tabs = components["main_tabs"]
         speaker_html = components["speaker_html"]
         audio_output = components["audio_output"]
+        stream_audio_output = components["stream_audio_output"]
         portrait_image = components["portrait_image"]
         input_row = components["input_row"]
         start_btn = components["start_btn"]
@@ -187,6 +188,7 @@ def create_app():
             timeline_html_tab,
             case_file_html_main,  # Case File (main tab)
             dashboard_html_main,  # Dashboard (main tab)
+            stream_audio_output,  # Live Game Master speech (voice turns)
         ]
 
         # ====== WIZARD EVENT HANDLERS ======
@@ -339,18 +341,19 @@ def create_app():
 
         # Hide speaker name when audio finishes playing
         # Use getattr to access the stop event (works across Gradio versions)
-        if hasattr(audio_output, "stop"):
-            getattr(audio_output, "stop")(
-                fn=on_audio_stop,
-                inputs=[session_id],
-                outputs=[speaker_html],
-            )
-        elif hasattr(audio_output, "pause"):
-            getattr(audio_output, "pause")(
-                fn=on_audio_stop,
-                inputs=[session_id],
-                outputs=[speaker_html],
-            )
+        for player in (audio_output, stream_audio_output):
+            if hasattr(player, "stop"):
+                getattr(player, "stop")(
+                    fn=on_audio_stop,
+                    inputs=[session_id],
+                    outputs=[speaker_html],
+                )
+            elif hasattr(player, "pause"):
+                getattr(player, "pause")(
+                    fn=on_audio_stop,
+                    inputs=[session_id],
+                    outputs=[speaker_html],
+                )
 
         # Info tabs select - refresh suspects portraits on tab click (lazy loading)
         getattr(info_tabs, "select")(
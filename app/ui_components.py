@@ -122,6 +122,17 @@ def create_ui_components() -> dict:
                             elem_id="mm-audio-player",
                             elem_classes="audio-player",
                         )
+
+                        # Live player: Game Master sentences stream in as they are synthesized
+                        stream_audio_output = gr.Audio(
+                            label=None,
+                            show_label=False,
+                            streaming=True,
+                            autoplay=True,
+                            format="mp3",
+                            elem_id="mm-stream-audio-player",
+                            elem_classes=["audio-player", "stream-audio-player"],
+                        )
                         
                         # Record button - inside the stage for reliable positioning
                         with gr.Column(
@@ -377,6 +388,7 @@ def create_ui_components() -> dict:
         "main_tabs": main_tabs,
         "speaker_html": speaker_html,
         "audio_output": audio_output,
+        "stream_audio_output": stream_audio_output,
         "portrait_image": portrait_image,
         "input_row": input_row,
         "start_btn": start_btn,
@@ -13,8 +13,9 @@ import re
 import json
 from typing import Optional, Tuple, List, Dict
 
-from services.agent import create_game_master_agent, process_message
+from services.agent import get_game_master_agent, process_message
 from game.parser import parse_game_actions, clean_response_markers
+from game.suspect_resolver import resolve_suspect_mention
 from game.state import GameState
 from game.state_manager import (
     mystery_images,
@@ -89,122 +90,13 @@ def process_player_action(
                 suspect_to_assign = s
                 break
     elif action_type == "custom" and custom_message:
-        # Custom message - first try heuristic suspect matching (fast, offline)
-        message_lower = custom_message.lower()
-        message_words = set(message_lower.split())
-
-        for s in state.mystery.suspects:
-            name_parts = s.name.lower().split()
-
-            # Check if full name is in message
-            if s.name.lower() in message_lower:
-                suspect_to_assign = s
-                logger.info("Detected suspect mention (full name): %s", s.name)
-                break
-
-            # Check if 2+ consecutive name parts appear
-            for i in range(len(name_parts) - 1):
-                partial_name = f"{name_parts[i]} {name_parts[i+1]}"
-                if partial_name in message_lower:
-                    suspect_to_assign = s
-                    logger.info("Detected suspect mention (partial name): %s", s.name)
-                    break
-            if suspect_to_assign:
-                break
-
-            # Check if any significant name part (3+ chars) matches a word in the message
-            # This handles cases like "Ada" matching "Ada Syntax"
-            for part in name_parts:
-                if len(part) >= 3:  # Only match meaningful name parts
-                    # Check exact word match
-                    if part in message_words:
-                        suspect_to_assign = s
-                        logger.info(
-                            "Detected suspect mention (name part '%s'): %s",
-                            part,
-                            s.name,
-                        )
-                        break
-            if suspect_to_assign:
-                break
-
-        # Hybrid fallback: if heuristics failed, ask a small LLM to resolve
-        if not suspect_to_assign and state.mystery:
-            try:
-                from langchain_openai import ChatOpenAI
-                from langchain_core.prompts import ChatPromptTemplate
-
-                suspects = state.mystery.suspects
-                suspects_summary = "\n".join(
-                    f"- {s.name} ({s.role})" for s in suspects
-                )
-
-                llm = ChatOpenAI(
-                    model=os.getenv("SUSPECT_RESOLVER_MODEL", "gpt-4o-mini"),
-                    temperature=0,
-                    api_key=os.getenv("OPENAI_API_KEY"),
-                )
-
-                prompt = ChatPromptTemplate.from_messages(
-                    [
-                        (
-                            "system",
-                            (
-                                "You map a player's message to ONE suspect from a list.\n"
-                                "You MUST answer with exactly one suspect name from the list, "
-                                "or the word NONE if no suspect clearly matches.\n"
-                                "Do not add any explanation."
-                            ),
-                        ),
-                        (
-                            "human",
-                            (
-                                "Suspects:\n"
-                                "{suspect_list}\n\n"
-                                "Player message:\n"
-                                "{player_message}\n\n"
-                                "Answer with exactly one suspect name from the list above, "
-                                "or NONE if you are not sure."
-                            ),
-                        ),
-                    ]
-                )
-
-                chain = prompt | llm
-                result = chain.invoke(
-                    {
-                        "suspect_list": suspects_summary,
-                        "player_message": custom_message,
-                    }
-                )
-                choice = (result.content or "").strip()
-                first_line = choice.splitlines()[0].strip()
-                # Strip bullets or quotes if present
-                first_line = first_line.lstrip("-• ").strip().strip('"').strip("'")
-
-                if first_line and first_line.upper() != "NONE":
-                    for s in suspects:
-                        if s.name.lower() == first_line.lower():
-                            suspect_to_assign = s
-                            logger.info(
-                                "AI-resolved suspect mention: %s (from '%s')",
-                                s.name,
-                                custom_message,
-                            )
-                            break
-                    else:
-                        logger.info(
-                            "AI suspect resolver returned '%s', which did not match any known suspect",
-                            first_line,
-                        )
-                else:
-                    logger.info(
-                        "AI suspect resolver chose NONE for message: %s", custom_message
-                    )
-            except Exception:
-                logger.exception(
-                    "Error resolving suspect name via AI; falling back to heuristics only"
-                )
+        # Local alias index + fuzzy matching; the LLM resolver is only asked
+        # when the local match is not confident enough
+        match = resolve_suspect_mention(custom_message, state.mystery.suspects)
+        if match:
+            suspect_to_assign = next(
+                (s for s in state.mystery.suspects if s.name == match.name), None
+            )
 
     if suspect_to_assign and _is_invalid_voice_id(
         getattr(suspect_to_assign, "voice_id", None)
@@ -218,20 +110,19 @@ def process_player_action(
         ]
         assign_voice_to_suspect(suspect_to_assign, used_voice_ids)
 
-    # Get or create agent
-    if not hasattr(process_player_action, "agent"):
-        process_player_action.agent = create_game_master_agent()
-
-    # Update system prompt (will include newly assigned voice_id if any)
-    state.system_prompt = state.get_continue_prompt()
+    # Update system prompt (will include newly assigned voice_id if any).
+    # The static part stays identical across turns for prompt caching; the
+    # per-turn investigation state is sent separately after the history.
+    state.system_prompt, turn_context = state.get_prompt_parts()
 
     # Process with agent
     response, speaker = process_message(
-        process_player_action.agent,
+        get_game_master_agent(),
         message,
         state.system_prompt,
         session_id,
         thread_id=session_id,
+        turn_context=turn_context,
     )
 
     # Handle empty or placeholder responses from the LLM
@@ -562,114 +453,13 @@ def run_action_logic(
                 suspect_to_assign = s
                 break
     elif action_type == "custom" and custom_message:
-        # Reuse the same heuristic + AI resolver logic as process_player_action
-        message_lower = custom_message.lower()
-        message_words = set(message_lower.split())
-
-        for s in state.mystery.suspects:
-            name_parts = s.name.lower().split()
-
-            if s.name.lower() in message_lower:
-                suspect_to_assign = s
-                logger.info("Detected suspect mention (full name): %s", s.name)
-                break
-
-            for i in range(len(name_parts) - 1):
-                partial_name = f"{name_parts[i]} {name_parts[i+1]}"
-                if partial_name in message_lower:
-                    suspect_to_assign = s
-                    logger.info("Detected suspect mention (partial name): %s", s.name)
-                    break
-            if suspect_to_assign:
-                break
-
-            for part in name_parts:
-                if len(part) >= 3 and part in message_words:
-                    suspect_to_assign = s
-                    logger.info(
-                        "Detected suspect mention (name part '%s'): %s",
-                        part,
-                        s.name,
-                    )
-                    break
-            if suspect_to_assign:
-                break
-
-        if not suspect_to_assign and state.mystery:
-            try:
-                from langchain_openai import ChatOpenAI
-                from langchain_core.prompts import ChatPromptTemplate
-
-                suspects = state.mystery.suspects
-                suspects_summary = "\n".join(
-                    f"- {s.name} ({s.role})" for s in suspects
-                )
-
-                llm = ChatOpenAI(
-                    model=os.getenv("SUSPECT_RESOLVER_MODEL", "gpt-4o-mini"),
-                    temperature=0,
-                    api_key=os.getenv("OPENAI_API_KEY"),
-                )
-
-                prompt = ChatPromptTemplate.from_messages(
-                    [
-                        (
-                            "system",
-                            (
-                                "You map a player's message to ONE suspect from a list.\n"
-                                "You MUST answer with exactly one suspect name from the list, "
-                                "or the word NONE if no suspect clearly matches.\n"
-                                "Do not add any explanation."
-                            ),
-                        ),
-                        (
-                            "human",
-                            (
-                                "Suspects:\n"
-                                "{suspect_list}\n\n"
-                                "Player message:\n"
-                                "{player_message}\n\n"
-                                "Answer with exactly one suspect name from the list above, "
-                                "or NONE if you are not sure."
-                            ),
-                        ),
-                    ]
-                )
-
-                chain = prompt | llm
-                result = chain.invoke(
-                    {
-                        "suspect_list": suspects_summary,
-                        "player_message": custom_message,
-                    }
-                )
-                choice = (result.content or "").strip()
-                first_line = choice.splitlines()[0].strip()
-                first_line = first_line.lstrip("-• ").strip().strip('"').strip("'")
-
-                if first_line and first_line.upper() != "NONE":
-                    for s in suspects:
-                        if s.name.lower() == first_line.lower():
-                            suspect_to_assign = s
-                            logger.info(
-                                "AI-resolved suspect mention: %s (from '%s')",
-                                s.name,
-                                custom_message,
-                            )
-                            break
-                    else:
-                        logger.info(
-                            "AI suspect resolver returned '%s', which did not match any known suspect",
-                            first_line,
-                        )
-                else:
-                    logger.info(
-                        "AI suspect resolver chose NONE for message: %s", custom_message
-                    )
-            except Exception:
-                logger.exception(
-                    "Error resolving suspect name via AI; falling back to heuristics only"
-                )
+        # Local alias index + fuzzy matching; the LLM resolver is only asked
+        # when the local match is not confident enough
+        match = resolve_suspect_mention(custom_message, state.mystery.suspects)
+        if match:
+            suspect_to_assign = next(
+                (s for s in state.mystery.suspects if s.name == match.name), None
+            )
 
     if suspect_to_assign and not suspect_to_assign.voice_id:
         logger.info("Assigning voice on-demand for suspect: %s", suspect_to_assign.name)
@@ -680,20 +470,19 @@ def run_action_logic(
         ]
         assign_voice_to_suspect(suspect_to_assign, used_voice_ids)
 
-    # Get or create agent
-    if not hasattr(run_action_logic, "agent"):
-        run_action_logic.agent = create_game_master_agent()
-
-    # Update system prompt (will include newly assigned voice_id if any)
-    state.system_prompt = state.get_continue_prompt()
+    # Update system prompt (will include newly assigned voice_id if any).
+    # The static part stays identical across turns for prompt caching; the
+    # per-turn investigation state is sent separately after the history.
+    state.system_prompt, turn_context = state.get_prompt_parts()
 
     # Process with agent
     response, speaker = process_message(
-        run_action_logic.agent,
+        get_game_master_agent(),
         message,
         state.system_prompt,
         session_id,
         thread_id=session_id,
+        turn_context=turn_context,
     )
 
     # Handle empty or placeholder responses
@@ -4,11 +4,24 @@ Instead of brittle regex/string matching, we use the LLM to determine
 if two statements actually contradict each other.
 """
 
+import asyncio
+import concurrent.futures
+import hashlib
+import json
 import logging
-from typing import Optional, Tuple
-from langchain_openai import ChatOpenAI
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from pydantic import BaseModel, Field
 
+from game.encounter_graph import TimeSlot, time_slots_for
+from services.llm_clients import get_chat_model, run_async, submit_async
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,8 +32,187 @@ class ContradictionResult(BaseModel):
     explanation: str = Field(description="Brief explanation of why they do/don't contradict")
 
 
-# Cache to avoid repeated LLM calls for same comparisons
-_contradiction_cache: dict[tuple[str, str], ContradictionResult] = {}
+class PairVerdict(BaseModel):
+    """Verdict for one numbered statement in a batched check."""
+    index: int = Field(description="Number of the PAST statement being judged")
+    is_contradiction: bool = Field(description="True if it contradicts the NEW statement")
+    confidence: float = Field(description="Confidence level 0-1")
+    explanation: str = Field(description="Brief explanation of why they do/don't contradict")
+
+
+class BatchContradictionResult(BaseModel):
+    """Verdicts for every past statement compared against one new statement."""
+    verdicts: List[PairVerdict] = Field(description="One verdict per numbered past statement")
+
+
+# Model used for every contradiction verdict (part of the cache key)
+CONTRADICTION_MODEL = "gpt-4o-mini"
+
+# Background checks submitted from timeline inserts (off the turn's critical
+# path) that may run at once on the shared LLM loop
+_background_limit = asyncio.Semaphore(int(os.getenv("CONTRADICTION_WORKERS", "2")))
+
+_RULES = """A contradiction means:
+- The statements CANNOT both be true at the same time
+- They claim different things about the SAME situation/time/place
+- One statement directly conflicts with the other
+
+NOT a contradiction:
+- Different statements about DIFFERENT people or times
+- Additional information that doesn't conflict
+- Witness seeing different things at different times
+- One statement being more detailed than another
+
+Be conservative - only mark as contradiction if they genuinely conflict."""
+
+
+# =============================================================================
+# VERDICT CACHE
+# =============================================================================
+
+
+def _normalize_statement(statement: str) -> str:
+    return re.sub(r"\s+", " ", statement.lower()).strip()
+
+
+def verdict_key(model: str, statement1: str, statement2: str) -> str:
+    """Order-independent content hash for a statement pair under a model."""
+    a, b = sorted((_normalize_statement(statement1), _normalize_statement(statement2)))
+    return hashlib.sha256(f"{model}\x00{a}\x00{b}".encode("utf-8")).hexdigest()
+
+
+class VerdictCache:
+    """Thread-safe LRU of contradiction verdicts with TTL and optional SQLite store.
+    
+    Verdicts are shared by all sessions (the same pair of statements gets the
+    same answer), so the in-memory LRU is bounded and entries expire after
+    ``ttl_seconds``. With ``db_path`` set, verdicts also survive restarts.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 5000,
+        ttl_seconds: float = 7 * 24 * 3600,
+        db_path: Optional[str] = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self._entries: "OrderedDict[str, Tuple[float, ContradictionResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        
+        if db_path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+                self._db = sqlite3.connect(db_path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS verdicts "
+                    "(key TEXT PRIMARY KEY, created REAL, verdict TEXT)"
+                )
+                self._db.commit()
+                logger.info("[CONTRADICTION] Verdict disk cache at %s", db_path)
+            except sqlite3.Error as e:
+                logger.warning("[CONTRADICTION] Verdict disk cache unavailable (%s): %s", db_path, e)
+                self._db = None
+    
+    def get(self, key: str) -> Optional[ContradictionResult]:
+        """Return a fresh cached verdict, or None."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+            if entry is None and self._db is not None:
+                entry = self._load_locked(key, now)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def put(self, key: str, result: ContradictionResult):
+        """Store a verdict in memory and on disk."""
+        created = time.time()
+        with self._lock:
+            self._entries[key] = (created, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO verdicts (key, created, verdict) VALUES (?, ?, ?)",
+                        (key, created, json.dumps(result.model_dump())),
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning("[CONTRADICTION] Failed to persist verdict: %s", e)
+    
+    def _load_locked(self, key: str, now: float) -> Optional[Tuple[float, ContradictionResult]]:
+        try:
+            row = self._db.execute(
+                "SELECT created, verdict FROM verdicts WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("[CONTRADICTION] Failed to read verdict: %s", e)
+            return None
+        if not row or now - row[0] > self.ttl_seconds:
+            return None
+        return row[0], ContradictionResult(**json.loads(row[1]))
+    
+    def clear(self):
+        """Drop every cached verdict, including the disk store."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM verdicts")
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning("[CONTRADICTION] Failed to clear verdict store: %s", e)
+    
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters for logging."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+            }
+
+
+_verdict_cache: Optional[VerdictCache] = None
+_verdict_cache_lock = threading.Lock()
+
+
+def get_verdict_cache() -> VerdictCache:
+    """Get the process-wide verdict cache (created on first use)."""
+    global _verdict_cache
+    with _verdict_cache_lock:
+        if _verdict_cache is None:
+            _verdict_cache = VerdictCache(
+                max_entries=int(os.getenv("CONTRADICTION_CACHE_SIZE", "5000")),
+                ttl_seconds=float(os.getenv("CONTRADICTION_CACHE_TTL", str(7 * 24 * 3600))),
+                db_path=os.getenv("CONTRADICTION_CACHE") or None,
+            )
+        return _verdict_cache
+
+
+def _get_cached(statement1: str, statement2: str) -> Optional[ContradictionResult]:
+    """Look up a verdict in either statement order."""
+    return get_verdict_cache().get(verdict_key(CONTRADICTION_MODEL, statement1, statement2))
+
+
+def _set_cached(statement1: str, statement2: str, result: ContradictionResult):
+    get_verdict_cache().put(verdict_key(CONTRADICTION_MODEL, statement1, statement2), result)
 
 
 async def check_contradiction_async(
@@ -38,18 +230,13 @@ async def check_contradiction_async(
     Returns:
         ContradictionResult with is_contradiction, confidence, explanation
     """
-    # Check cache first
-    cache_key = (statement1.lower().strip(), statement2.lower().strip())
-    if cache_key in _contradiction_cache:
-        return _contradiction_cache[cache_key]
-    
-    # Reverse key also
-    reverse_key = (cache_key[1], cache_key[0])
-    if reverse_key in _contradiction_cache:
-        return _contradiction_cache[reverse_key]
+    # Check cache first (either order)
+    cached = _get_cached(statement1, statement2)
+    if cached is not None:
+        return cached
     
     try:
-        llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+        llm = get_chat_model(CONTRADICTION_MODEL, temperature=0)
         structured_llm = llm.with_structured_output(ContradictionResult)
         
         context = f" (regarding {suspect_name})" if suspect_name else ""
@@ -59,23 +246,12 @@ async def check_contradiction_async(
 Statement 1: "{statement1}"
 Statement 2: "{statement2}"
 
-A contradiction means:
-- The statements CANNOT both be true at the same time
-- They claim different things about the SAME situation/time/place
-- One statement directly conflicts with the other
-
-NOT a contradiction:
-- Different statements about DIFFERENT people or times
-- Additional information that doesn't conflict
-- Witness seeing different things at different times
-- One statement being more detailed than another
-
-Be conservative - only mark as contradiction if they genuinely conflict."""
+{_RULES}"""
 
         result = await structured_llm.ainvoke(prompt)
         
         # Cache the result
-        _contradiction_cache[cache_key] = result
+        _set_cached(statement1, statement2, result)
         
         logger.info(
             "[CONTRADICTION] %s vs %s → %s (%.0f%% confidence): %s",
@@ -103,31 +279,15 @@ def check_contradiction_sync(
     suspect_name: Optional[str] = None,
 ) -> ContradictionResult:
     """Synchronous version of check_contradiction_async."""
-    import asyncio
-    
     # Check cache first (avoid async overhead)
-    cache_key = (statement1.lower().strip(), statement2.lower().strip())
-    if cache_key in _contradiction_cache:
-        return _contradiction_cache[cache_key]
-    reverse_key = (cache_key[1], cache_key[0])
-    if reverse_key in _contradiction_cache:
-        return _contradiction_cache[reverse_key]
+    cached = _get_cached(statement1, statement2)
+    if cached is not None:
+        return cached
     
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If already in async context, run in thread
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(
-                    asyncio.run,
-                    check_contradiction_async(statement1, statement2, suspect_name)
-                )
-                return future.result(timeout=10)
-        else:
-            return loop.run_until_complete(
-                check_contradiction_async(statement1, statement2, suspect_name)
-            )
+        return run_async(
+            check_contradiction_async(statement1, statement2, suspect_name), timeout=10
+        )
     except Exception as e:
         logger.warning("[CONTRADICTION] Sync check failed: %s", e)
         return ContradictionResult(
@@ -137,10 +297,169 @@ def check_contradiction_sync(
         )
 
 
+async def check_contradictions_batch_async(
+    new_statement: str,
+    past_statements: List[str],
+    suspect_name: Optional[str] = None,
+) -> List[ContradictionResult]:
+    """Check one new statement against many past statements in a single LLM call.
+    
+    Cached pairs are answered locally; all remaining pairs are judged together
+    with one structured-output request. If the model's answer doesn't cover
+    every pair, the missing ones are checked individually and concurrently.
+    
+    Args:
+        new_statement: The statement just added
+        past_statements: Earlier statements to compare against
+        suspect_name: Optional suspect name for context
+        
+    Returns:
+        One ContradictionResult per past statement, in the same order.
+    """
+    results: List[Optional[ContradictionResult]] = [
+        _get_cached(past, new_statement) for past in past_statements
+    ]
+    pending = [i for i, r in enumerate(results) if r is None]
+    if not pending:
+        return results
+    
+    if len(pending) > 1:
+        try:
+            llm = get_chat_model(CONTRADICTION_MODEL, temperature=0)
+            structured_llm = llm.with_structured_output(BatchContradictionResult)
+            
+            context = f" (regarding {suspect_name})" if suspect_name else ""
+            numbered = "\n".join(
+                f'{n}. "{past_statements[i]}"' for n, i in enumerate(pending, 1)
+            )
+            prompt = f"""Compare a NEW statement{context} against each numbered PAST statement and determine, for each one, whether the two CONTRADICT each other.
+
+NEW statement: "{new_statement}"
+
+PAST statements:
+{numbered}
+
+{_RULES}
+
+Return exactly one verdict per numbered PAST statement, using its number as the index."""
+
+            batch = await structured_llm.ainvoke(prompt)
+            for verdict in batch.verdicts:
+                if 1 <= verdict.index <= len(pending):
+                    i = pending[verdict.index - 1]
+                    result = ContradictionResult(
+                        is_contradiction=verdict.is_contradiction,
+                        confidence=verdict.confidence,
+                        explanation=verdict.explanation,
+                    )
+                    results[i] = result
+                    _set_cached(past_statements[i], new_statement, result)
+            
+            logger.info(
+                "[CONTRADICTION] Batch of %d pairs for %s → %d contradiction(s)",
+                len(pending), suspect_name or "?",
+                sum(1 for i in pending if results[i] and results[i].is_contradiction)
+            )
+        except Exception as e:
+            logger.warning("[CONTRADICTION] Batch check failed, falling back to per-pair: %s", e)
+    
+    # Anything the batch didn't answer: fan out concurrently
+    missing = [i for i in pending if results[i] is None]
+    if missing:
+        checked = await asyncio.gather(*(
+            check_contradiction_async(past_statements[i], new_statement, suspect_name)
+            for i in missing
+        ))
+        for i, result in zip(missing, checked):
+            results[i] = result
+    
+    return results
+
+
+def submit_contradictions_batch(
+    new_statement: str,
+    past_statements: List[str],
+    suspect_name: Optional[str] = None,
+) -> "concurrent.futures.Future[List[ContradictionResult]]":
+    """Run check_contradictions_batch_async in the background on the shared LLM loop.
+    
+    Returns immediately; the future resolves to one ContradictionResult per
+    past statement (the batch check never raises for LLM errors).
+    """
+    async def _limited():
+        async with _background_limit:
+            return await check_contradictions_batch_async(
+                new_statement, past_statements, suspect_name
+            )
+
+    return submit_async(_limited())
+
+
+# =============================================================================
+# DETERMINISTIC PRE-FILTER
+# =============================================================================
+# Two timeline events can only contradict if they talk about the same suspect
+# at overlapping times. Normalizing events to (suspect, time slots) lets us
+# drop impossible pairs before spending an LLM call on them.
+
+
+@dataclass(frozen=True)
+class TimelineFacts:
+    """A timeline event reduced to the encounter-graph vocabulary."""
+    suspect: str
+    time_slots: FrozenSet[TimeSlot]  # empty = time unknown
+
+
+def normalize_timeline_event(event: Dict) -> TimelineFacts:
+    """Reduce a GameState timeline event dict to TimelineFacts.
+    
+    Uses the event's explicit ``time_range`` when present and falls back to
+    parsing ``time_slot`` and ``description``.
+    """
+    time_text = event.get("time_range") or event.get("time_slot")
+    slots = time_slots_for(time_text) or time_slots_for(event.get("description"))
+    return TimelineFacts(
+        suspect=event.get("suspect_name") or "",
+        time_slots=slots,
+    )
+
+
+def could_contradict(a: TimelineFacts, b: TimelineFacts) -> bool:
+    """Cheap structural check: can these two events possibly contradict?
+    
+    False only when they are about different suspects or about disjoint time
+    slots. Events at the same place and time are still checked: they can
+    conflict on what happened there (alone vs. with someone, reading vs.
+    arguing). Anything with unknown time stays ambiguous and returns True.
+    """
+    if a.suspect != b.suspect:
+        return False
+    if a.time_slots and b.time_slots and not a.time_slots & b.time_slots:
+        return False
+    return True
+
+
+def prefilter_contradiction_candidates(
+    new_event: Dict,
+    candidates: List[Dict],
+) -> List[Dict]:
+    """Keep only the candidate events that could contradict ``new_event``."""
+    new_facts = normalize_timeline_event(new_event)
+    kept = [
+        event for event in candidates
+        if could_contradict(new_facts, normalize_timeline_event(event))
+    ]
+    if len(kept) < len(candidates):
+        logger.info(
+            "[CONTRADICTION] Pre-filter kept %d of %d pairs for %s",
+            len(kept), len(candidates), new_facts.suspect
+        )
+    return kept
+
+
 def clear_cache():
     """Clear the contradiction cache."""
-    global _contradiction_cache
-    _contradiction_cache = {}
+    get_verdict_cache().clear()
     logger.info("[CONTRADICTION] Cache cleared")
 
 
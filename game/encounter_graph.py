@@ -19,7 +19,8 @@ Architecture:
 - The Game Master agent NEVER sees the full graph - only player-discovered info
 """
 
-from typing import Dict, List, Optional, Set, Tuple
+import re
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 from pydantic import BaseModel, Field
 from enum import Enum
 
@@ -38,6 +39,101 @@ class TimeSlot(str, Enum):
     LATE_EVENING = "late_evening"        # 9:45 PM+ - Police arrive
 
 
+# Clock windows for each slot, in minutes after midnight. The first and last
+# slots are open-ended so any evening time maps somewhere.
+TIME_SLOT_WINDOWS: Dict[TimeSlot, Tuple[float, float]] = {
+    TimeSlot.EARLY_EVENING: (float("-inf"), 19 * 60 + 30),
+    TimeSlot.DINNER_START: (19 * 60 + 30, 20 * 60),
+    TimeSlot.DINNER_MAIN: (20 * 60, 20 * 60 + 45),
+    TimeSlot.CRITICAL_WINDOW: (20 * 60 + 45, 21 * 60 + 15),
+    TimeSlot.POST_DISCOVERY: (21 * 60 + 15, 21 * 60 + 45),
+    TimeSlot.LATE_EVENING: (21 * 60 + 45, float("inf")),
+}
+
+# Phrases that name a slot without a clock time
+_SLOT_PHRASES: Dict[str, Tuple[TimeSlot, ...]] = {
+    "early evening": (TimeSlot.EARLY_EVENING,),
+    "cocktail": (TimeSlot.EARLY_EVENING,),
+    "dinner": (TimeSlot.DINNER_START, TimeSlot.DINNER_MAIN),
+    "main course": (TimeSlot.DINNER_MAIN,),
+    "time of the murder": (TimeSlot.CRITICAL_WINDOW,),
+    "murder time": (TimeSlot.CRITICAL_WINDOW,),
+    "body was found": (TimeSlot.POST_DISCOVERY,),
+    "discovery": (TimeSlot.POST_DISCOVERY,),
+    "midnight": (TimeSlot.LATE_EVENING,),
+    "police arrived": (TimeSlot.LATE_EVENING,),
+}
+
+_CLOCK_RE = re.compile(
+    r"\b(\d{1,2})(?::(\d{2}))?\s*(a\.?m\.?|p\.?m\.?|o'clock)"
+    r"|\b(\d{1,2}):(\d{2})\b",
+    re.IGNORECASE,
+)
+
+# Bare numbers left over once clock times are removed ("from 8 till 9 o'clock")
+_BARE_HOUR_RE = re.compile(r"\b(\d{1,2})\b")
+
+# A single clock time ("around 9 PM") is treated as +/- this many minutes
+_POINT_TOLERANCE_MINUTES = 10
+
+
+def _clock_minutes(hour: int, minute: int, meridiem: Optional[str]) -> int:
+    """Minutes after midnight, assuming an evening mystery when AM/PM is missing."""
+    meridiem = (meridiem or "").lower().replace(".", "")
+    if hour >= 13:
+        pass  # Already 24-hour ("21:00")
+    elif meridiem == "am":
+        hour = 24 if hour == 12 else hour + 24 if hour < 6 else hour
+    elif meridiem == "pm":
+        hour = hour if hour == 12 else hour + 12
+    elif hour in (0, 12):  # bare "12:xx" in an evening mystery means midnight
+        hour = 24
+    else:
+        hour += 12
+    return hour * 60 + minute
+
+
+def time_slots_for(text: Optional[str]) -> FrozenSet[TimeSlot]:
+    """Map free-text time phrases to the TimeSlot vocabulary.
+    
+    Handles clock times ("9:00 PM", "around 9pm", "8:30", "21:00"), ranges
+    ("8:00 PM - 9:30 PM" covers every slot in between), slot names
+    ("critical_window") and a few phrases ("during dinner", "midnight").
+    
+    Returns:
+        The slots the text could refer to; empty if no time was recognised,
+        or if part of it looks like a time that could not be parsed (so a
+        partial parse never narrows the answer).
+    """
+    if not text:
+        return frozenset()
+    lowered = text.lower()
+    slots: Set[TimeSlot] = {slot for slot in TimeSlot if slot.value in lowered}
+    for phrase, phrase_slots in _SLOT_PHRASES.items():
+        if phrase in lowered:
+            slots.update(phrase_slots)
+
+    minutes = []
+    for match in _CLOCK_RE.finditer(lowered):
+        hour, minute, meridiem, hour24, minute24 = match.groups()
+        if hour is not None:
+            minutes.append(_clock_minutes(int(hour), int(minute or 0), meridiem))
+        else:
+            minutes.append(_clock_minutes(int(hour24), int(minute24), None))
+    leftover = _CLOCK_RE.sub(" ", lowered)
+    if any(int(n) <= 24 for n in _BARE_HOUR_RE.findall(leftover)):
+        return frozenset()  # e.g. the "8" in "from 8 till 9 o'clock"
+    if minutes:
+        start, end = min(minutes), max(minutes)
+        if start == end:
+            start -= _POINT_TOLERANCE_MINUTES
+            end += _POINT_TOLERANCE_MINUTES
+        slots.update(
+            slot for slot, (lo, hi) in TIME_SLOT_WINDOWS.items() if start < hi and end > lo
+        )
+    return frozenset(slots)
+
+
 class LocationNode(BaseModel):
     """A physical location in the mystery setting."""
     id: str = Field(description="Unique location ID like 'library' or 'garden'")
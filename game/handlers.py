@@ -4,7 +4,6 @@ import os
 import json
 import logging
 import time
-import threading
 from typing import Optional, Tuple, List, Dict
 
 from game.state import GameState
@@ -15,8 +14,13 @@ from services.image_service import (
 from game.mystery_generator import (
     assign_voice_to_suspect,
 )
-from services.agent import create_game_master_agent, process_message
+from services.agent import get_game_master_agent, process_message, record_turn
 from game.parser import parse_game_actions, clean_response_markers
+from game.suspect_resolver import (
+    SUSPECT_RESOLVER_MIN_CONFIDENCE,
+    resolve_suspect,
+    resolve_suspect_mention,
+)
 from services.tts_service import text_to_speech
 from game.state_manager import (
     mystery_images,
@@ -30,9 +34,10 @@ from game.state_manager import (
     get_tool_output_store,
     clear_tool_outputs,
 )
-from game.media import _generate_portrait_background
+from game.media import start_turn_speech, submit_portrait
 from services.game_memory import get_game_memory
 from services.perf_tracker import perf
+from services.media_scheduler import PRIORITY_NEXT
 
 logger = logging.getLogger(__name__)
 
@@ -77,21 +82,11 @@ def _detect_accusation_intent(message: str, state: GameState) -> Optional[str]:
     if not has_accusation_keyword:
         return None
     
-    # Check if a suspect name is mentioned or if we're talking to someone
-    for suspect in state.mystery.suspects:
-        suspect_lower = suspect.name.lower()
-        name_parts = suspect_lower.split()
-        
-        # Check full name
-        if suspect_lower in message_lower:
-            logger.info("[ACCUSE] Detected accusation against: %s (full name match)", suspect.name)
-            return suspect.name
-        
-        # Check any significant name part (2+ chars)
-        for part in name_parts:
-            if len(part) >= 3 and part in message_lower:
-                logger.info("[ACCUSE] Detected accusation against: %s (name part '%s')", suspect.name, part)
-                return suspect.name
+    # Check if a suspect is named (full name, name part, role or a close misspelling)
+    match = resolve_suspect(message, state.mystery.suspects)
+    if match and match.confidence >= SUSPECT_RESOLVER_MIN_CONFIDENCE:
+        logger.info("[ACCUSE] Detected accusation against: %s (%s)", match.name, match.reason)
+        return match.name
     
     # If message uses "you" (second person), try to find the last suspect talked to
     second_person_words = ["you", "you're", "your"]
@@ -370,182 +365,16 @@ def process_player_action(
                 suspect_to_assign = s
                 break
     elif action_type == "custom" and custom_message:
-        # Custom message - first try heuristic suspect matching (fast, offline)
-        message_lower = custom_message.lower()
-        message_words = set(message_lower.split())
-        
-        # EARLY FOLLOW-UP DETECTION: Check for second-person pronouns or follow-up patterns
-        # This can skip the expensive AI resolver call
-        follow_up_indicators = ["you", "you're", "your", "yourself"]
-        follow_up_phrases = ["tell me more", "what about", "why did you", "what do you", 
-                           "how did you", "where were you", "go on", "continue", "and then",
-                           "really", "are you sure", "explain", "what else"]
-        
-        has_second_person = any(word in message_words for word in follow_up_indicators)
-        has_follow_up_phrase = any(phrase in message_lower for phrase in follow_up_phrases)
-        
-        if has_second_person or has_follow_up_phrase:
-            last_speaker = _get_last_suspect_speaker(state)
-            if last_speaker:
-                # Check if any OTHER suspect is explicitly mentioned
-                explicit_other = False
-                for s in state.mystery.suspects:
-                    if s.name == last_speaker:
-                        continue
-                    if s.name.lower() in message_lower:
-                        explicit_other = True
-                        break
-                
-                if not explicit_other:
-                    for s in state.mystery.suspects:
-                        if s.name == last_speaker:
-                            suspect_to_assign = s
-                            is_follow_up = True
-                            logger.info(
-                                "🔄 [EARLY FOLLOW-UP] Detected via %s - targeting: %s",
-                                "second-person pronoun" if has_second_person else "follow-up phrase",
-                                last_speaker,
-                            )
-                            break
-
-        # Only continue with name matching if early follow-up detection didn't find anything
-        if not suspect_to_assign:
-            for s in state.mystery.suspects:
-                name_parts = s.name.lower().split()
-
-                # Check if full name is in message
-                if s.name.lower() in message_lower:
-                    suspect_to_assign = s
-                    logger.info("Detected suspect mention (full name): %s", s.name)
-                    break
-
-                # Check if 2+ consecutive name parts appear
-                for i in range(len(name_parts) - 1):
-                    partial_name = f"{name_parts[i]} {name_parts[i+1]}"
-                    if partial_name in message_lower:
-                        suspect_to_assign = s
-                        logger.info("Detected suspect mention (partial name): %s", s.name)
-                        break
-                if suspect_to_assign:
-                    break
-
-                # Check if any significant name part (3+ chars) matches a word in the message
-                # This handles cases like "Ada" matching "Ada Syntax"
-                for part in name_parts:
-                    if len(part) >= 3:  # Only match meaningful name parts
-                        # Check exact word match
-                        if part in message_words:
-                            suspect_to_assign = s
-                            logger.info(
-                                "Detected suspect mention (name part '%s'): %s",
-                                part,
-                                s.name,
-                            )
-                            break
-                if suspect_to_assign:
-                    break
-
-        # Hybrid fallback: if heuristics failed, ask a small LLM to resolve
-        if not suspect_to_assign and state.mystery:
-            try:
-                from langchain_openai import ChatOpenAI
-                from langchain_core.prompts import ChatPromptTemplate
-
-                suspects = state.mystery.suspects
-                suspects_summary = "\n".join(
-                    f"- {s.name} ({s.role})" for s in suspects
-                )
-
-                llm = ChatOpenAI(
-                    model=os.getenv("SUSPECT_RESOLVER_MODEL", "gpt-4o-mini"),
-                    temperature=0,
-                    api_key=os.getenv("OPENAI_API_KEY"),
-                )
-
-                prompt = ChatPromptTemplate.from_messages(
-                    [
-                        (
-                            "system",
-                            (
-                                "You map a player's message to ONE suspect from a list.\n"
-                                "You MUST answer with exactly one suspect name from the list, "
-                                "or the word NONE if no suspect clearly matches.\n"
-                                "Do not add any explanation."
-                            ),
-                        ),
-                        (
-                            "human",
-                            (
-                                "Suspects:\n"
-                                "{suspect_list}\n\n"
-                                "Player message:\n"
-                                "{player_message}\n\n"
-                                "Answer with exactly one suspect name from the list above, "
-                                "or NONE if you are not sure."
-                            ),
-                        ),
-                    ]
-                )
-
-                chain = prompt | llm
-                result = chain.invoke(
-                    {
-                        "suspect_list": suspects_summary,
-                        "player_message": custom_message,
-                    }
-                )
-                choice = (result.content or "").strip()
-                first_line = choice.splitlines()[0].strip()
-                # Strip bullets or quotes if present
-                first_line = first_line.lstrip("-• ").strip().strip('"').strip("'")
-
-                if first_line and first_line.upper() != "NONE":
-                    for s in suspects:
-                        if s.name.lower() == first_line.lower():
-                            suspect_to_assign = s
-                            logger.info(
-                                "AI-resolved suspect mention: %s (from '%s')",
-                                s.name,
-                                custom_message,
-                            )
-                            break
-                    else:
-                        logger.info(
-                            "AI suspect resolver returned '%s', which did not match any known suspect",
-                            first_line,
-                        )
-                else:
-                    logger.info(
-                        "AI suspect resolver chose NONE for message: %s", custom_message
-                    )
-            except Exception:
-                logger.exception(
-                    "Error resolving suspect name via AI; falling back to heuristics only"
-                )
-
-        # Final fallback: treat as follow-up to the last suspect who spoke,
-        # as long as the message doesn't clearly mention a different suspect.
-        if not suspect_to_assign and state.mystery:
-            last_speaker = _get_last_suspect_speaker(state)
-            if last_speaker:
-                # Avoid overriding when the message explicitly names someone else
-                explicit_other = False
-                for s in state.mystery.suspects:
-                    if s.name == last_speaker:
-                        continue
-                    if s.name.lower() in message_lower:
-                        explicit_other = True
-                        break
-                if not explicit_other:
-                    for s in state.mystery.suspects:
-                        if s.name == last_speaker:
-                            suspect_to_assign = s
-                            is_follow_up = True
-                            logger.info(
-                                "🔄 [FOLLOW-UP] Detected follow-up question to last suspect speaker: %s",
-                                last_speaker,
-                            )
-                            break
+        # Local alias index + fuzzy matching; the LLM resolver is only asked
+        # when the local match is not confident enough
+        match = resolve_suspect_mention(
+            custom_message, state.mystery.suspects, _get_last_suspect_speaker(state)
+        )
+        if match:
+            suspect_to_assign = next(
+                (s for s in state.mystery.suspects if s.name == match.name), None
+            )
+            is_follow_up = match.is_follow_up
     
     if suspect_to_assign and _is_invalid_voice_id(getattr(suspect_to_assign, "voice_id", None)):
         logger.info("Assigning voice on-demand for suspect: %s", suspect_to_assign.name)
@@ -584,20 +413,19 @@ def process_player_action(
                 "[GAME] Failed to update stored custom message content on state"
             )
 
-    # Get or create agent
-    if not hasattr(process_player_action, "agent"):
-        process_player_action.agent = create_game_master_agent()
-
-    # Update system prompt (will include newly assigned voice_id if any)
-    state.system_prompt = state.get_continue_prompt()
+    # Update system prompt (will include newly assigned voice_id if any).
+    # The static part stays identical across turns for prompt caching; the
+    # per-turn investigation state is sent separately after the history.
+    state.system_prompt, turn_context = state.get_prompt_parts()
 
     # Process with agent
     response, speaker = process_message(
-        process_player_action.agent,
+        get_game_master_agent(),
         message,
         state.system_prompt,
         session_id,
         thread_id=session_id,
+        turn_context=turn_context,
     )
 
     # Handle empty or placeholder responses from the LLM
@@ -952,6 +780,92 @@ def process_player_action(
 # ============================================================================
 
 
+# Structured button actions go straight to their tool instead of through the agent
+ACTION_FAST_PATH = os.getenv("ACTION_FAST_PATH", "true").lower() == "true"
+
+
+def _dispatch_direct_action(
+    action_type: str,
+    target: str,
+    accused_suspect: Optional[str],
+    message: str,
+    state: GameState,
+) -> Optional[Tuple[str, Optional[str]]]:
+    """Run a structured action's tool directly, skipping the Game Master LLM.
+
+    Talk, search and accuse buttons always map to one known tool call, so
+    routing them through the agent only adds a model round trip. Returns
+    (response, speaker) or None when the target doesn't resolve cleanly, in
+    which case the agent handles the turn as before.
+    """
+    if not ACTION_FAST_PATH or not state.mystery or not target:
+        return None
+
+    from game.tools import describe_scene_for_image, interrogate_suspect, make_accusation
+
+    target_lower = target.lower()
+    if action_type == "talk":
+        suspect = next(
+            (s for s in state.mystery.suspects if s.name.lower() == target_lower), None
+        )
+        if not suspect:
+            return None
+        tool, args, speaker = interrogate_suspect, {
+            "suspect_name": suspect.name,
+            "player_question": message,
+        }, suspect.name
+    elif action_type == "search":
+        # Compare canonical names; anything short of one clear match goes to the agent
+        wanted = normalize_location_name(target, state).lower()
+        matches = [
+            loc for loc in state.unlocked_locations
+            if normalize_location_name(loc, state).lower() == wanted
+        ]
+        if len(matches) != 1:
+            return None
+        location = matches[0]
+        tool, args, speaker = describe_scene_for_image, {"location_name": location}, None
+    elif action_type == "accuse":
+        if not any(s.name == accused_suspect for s in state.mystery.suspects):
+            return None
+        tool, args, speaker = make_accusation, {"suspect_name": accused_suspect}, None
+    else:
+        return None
+
+    logger.info("[GAME] Fast path: %s %s -> %s", action_type, target, tool.name)
+    progress = _turn_progress(state)
+    try:
+        response = tool.invoke(args)
+    except Exception:
+        if _turn_progress(state) != progress:
+            # The tool already changed the game; replaying it through the agent
+            # would search, interrogate or accuse a second time
+            logger.exception("[GAME] Fast path %s failed part-way", tool.name)
+            return "Something went wrong there. Please try that again.", None
+        logger.exception("[GAME] Fast path %s failed, falling back to agent", tool.name)
+        return None
+    return str(response or ""), speaker
+
+
+def _turn_progress(state: GameState) -> Tuple:
+    """Fingerprint of everything a talk/search/accuse tool records for the turn."""
+    store = get_tool_output_store()
+    return (
+        len(state.clue_ids_found),
+        len(state.searched_locations),
+        len(state.unlocked_locations),
+        len(state.accusation_history),
+        state.wrong_accusations,
+        state.game_over,
+        len(state.discovered_timeline),
+        sum(len(s.conversations) for s in state.suspect_states.values()),
+        store.scene_brief is not None,
+        store.interrogation is not None,
+        store.accusation is not None,
+        store.audio_path,
+    )
+
+
 def run_action_logic(
     action_type: str, target: str, custom_message: str, session_id: str
 ) -> Tuple[str, str, GameState, Dict, Optional[str]]:
@@ -1036,187 +950,21 @@ def run_action_logic(
                 suspect_to_assign = s
                 break
     elif action_type == "custom" and custom_message:
-        # Reuse the same heuristic + AI resolver logic as process_player_action
-        message_lower = custom_message.lower()
-        message_words = set(message_lower.split())
-        
-        # EARLY FOLLOW-UP DETECTION: Check for second-person pronouns or follow-up patterns
-        # This can skip the expensive AI resolver call
-        follow_up_indicators = ["you", "you're", "your", "yourself"]
-        follow_up_phrases = ["tell me more", "what about", "why did you", "what do you", 
-                           "how did you", "where were you", "go on", "continue", "and then",
-                           "really", "are you sure", "explain", "what else"]
-        
-        has_second_person = any(word in message_words for word in follow_up_indicators)
-        has_follow_up_phrase = any(phrase in message_lower for phrase in follow_up_phrases)
-        
-        if has_second_person or has_follow_up_phrase:
-            last_speaker = _get_last_suspect_speaker(state)
-            if last_speaker:
-                # Check if any OTHER suspect is explicitly mentioned
-                explicit_other = False
-                for s in state.mystery.suspects:
-                    if s.name == last_speaker:
-                        continue
-                    if s.name.lower() in message_lower:
-                        explicit_other = True
-                        break
-                
-                if not explicit_other:
-                    for s in state.mystery.suspects:
-                        if s.name == last_speaker:
-                            suspect_to_assign = s
-                            is_follow_up = True
-                            logger.info(
-                                "🔄 [EARLY FOLLOW-UP] Detected via %s - targeting: %s",
-                                "second-person pronoun" if has_second_person else "follow-up phrase",
-                                last_speaker,
-                            )
-                            break
-
-        for s in state.mystery.suspects:
-            name_parts = s.name.lower().split()
-
-            if s.name.lower() in message_lower:
-                suspect_to_assign = s
-                logger.info("Detected suspect mention (full name): %s", s.name)
-                break
-
-            for i in range(len(name_parts) - 1):
-                partial_name = f"{name_parts[i]} {name_parts[i+1]}"
-                if partial_name in message_lower:
-                    suspect_to_assign = s
-                    logger.info("Detected suspect mention (partial name): %s", s.name)
-                    break
-            if suspect_to_assign:
-                break
-
-            for part in name_parts:
-                if len(part) >= 3 and part in message_words:
-                    suspect_to_assign = s
-                    logger.info(
-                        "Detected suspect mention (name part '%s'): %s",
-                        part,
-                        s.name,
-                    )
-                    break
-            if suspect_to_assign:
-                break
-
-        if not suspect_to_assign and state.mystery:
-            try:
-                from langchain_openai import ChatOpenAI
-                from langchain_core.prompts import ChatPromptTemplate
-
-                suspects = state.mystery.suspects
-                suspects_summary = "\n".join(
-                    f"- {s.name} ({s.role})" for s in suspects
-                )
-
-                llm = ChatOpenAI(
-                    model=os.getenv("SUSPECT_RESOLVER_MODEL", "gpt-4o-mini"),
-                    temperature=0,
-                    api_key=os.getenv("OPENAI_API_KEY"),
-                )
-
-                prompt = ChatPromptTemplate.from_messages(
-                    [
-                        (
-                            "system",
-                            (
-                                "You map a player's message to ONE suspect from a list.\n"
-                                "You MUST answer with exactly one suspect name from the list, "
-                                "or the word NONE if no suspect clearly matches.\n"
-                                "Do not add any explanation."
-                            ),
-                        ),
-                        (
-                            "human",
-                            (
-                                "Suspects:\n"
-                                "{suspect_list}\n\n"
-                                "Player message:\n"
-                                "{player_message}\n\n"
-                                "Answer with exactly one suspect name from the list above, "
-                                "or NONE if you are not sure."
-                            ),
-                        ),
-                    ]
-                )
-
-                chain = prompt | llm
-                perf.start("suspect_resolver", details="gpt-4o-mini")
-                result = chain.invoke(
-                    {
-                        "suspect_list": suspects_summary,
-                        "player_message": custom_message,
-                    }
-                )
-                perf.end("suspect_resolver", details="resolved")
-                choice = (result.content or "").strip()
-                first_line = choice.splitlines()[0].strip()
-                first_line = first_line.lstrip("-• ").strip().strip('"').strip("'")
-
-                if first_line and first_line.upper() != "NONE":
-                    for s in suspects:
-                        if s.name.lower() == first_line.lower():
-                            suspect_to_assign = s
-                            logger.info(
-                                "AI-resolved suspect mention: %s (from '%s')",
-                                s.name,
-                                custom_message,
-                            )
-                            break
-                    else:
-                        logger.info(
-                            "AI suspect resolver returned '%s', which did not match any known suspect",
-                            first_line,
-                        )
-                else:
-                    logger.info(
-                        "AI suspect resolver chose NONE for message: %s", custom_message
-                    )
-            except Exception:
-                perf.end("suspect_resolver", status="error", details="exception")
-                logger.exception(
-                    "Error resolving suspect name via AI; falling back to heuristics only"
-                )
-
-        # Final fallback: treat as follow-up to the last suspect who spoke,
-        # as long as the message doesn't clearly mention a different suspect.
-        if not suspect_to_assign and state.mystery:
-            last_speaker = _get_last_suspect_speaker(state)
-            if last_speaker:
-                explicit_other = False
-                for s in state.mystery.suspects:
-                    if s.name == last_speaker:
-                        continue
-                    if s.name.lower() in message_lower:
-                        explicit_other = True
-                        break
-                if not explicit_other:
-                    for s in state.mystery.suspects:
-                        if s.name == last_speaker:
-                            suspect_to_assign = s
-                            # Mark this as a detected follow-up for message rewriting
-                            is_follow_up = True
-                            logger.info(
-                                "🔄 [FOLLOW-UP] Detected follow-up question to last suspect speaker: %s",
-                                last_speaker,
-                            )
-                            break
-
-    # Perf: measure how long suspect resolution (heuristics + resolver) took
-    # (t_resolve_start is captured just before heuristics; if we didn't set it, this is a no-op)
-    try:
-        t_resolve_end = time.perf_counter()
-        if "t_resolve_start" in locals():
-            logger.info(
-                "[PERF] run_action_logic: suspect resolution took %.2fs",
-                t_resolve_end - t_resolve_start,
+        # Local alias index + fuzzy matching; the LLM resolver is only asked
+        # when the local match is not confident enough
+        t_resolve_start = time.perf_counter()
+        match = resolve_suspect_mention(
+            custom_message, state.mystery.suspects, _get_last_suspect_speaker(state)
+        )
+        if match:
+            suspect_to_assign = next(
+                (s for s in state.mystery.suspects if s.name == match.name), None
             )
-    except Exception:
-        logger.exception("[PERF] Failed to log suspect resolution timing")
+            is_follow_up = match.is_follow_up
+        logger.info(
+            "[PERF] run_action_logic: suspect resolution took %.2fs",
+            time.perf_counter() - t_resolve_start,
+        )
 
     if suspect_to_assign and not suspect_to_assign.voice_id:
         logger.info("Assigning voice on-demand for suspect: %s", suspect_to_assign.name)
@@ -1263,45 +1011,78 @@ def run_action_logic(
                     "[GAME] Pre-warming portrait in background for suspect: %s",
                     suspect_to_assign.name,
                 )
-                threading.Thread(
-                    target=_generate_portrait_background,
-                    args=(
-                        suspect_to_assign.name,
-                        suspect_to_assign,
-                        mystery_setting,
-                        session_id,
-                    ),
-                    daemon=True,
-                ).start()
+                submit_portrait(
+                    session_id,
+                    suspect_to_assign.name,
+                    suspect_to_assign,
+                    mystery_setting,
+                    priority=PRIORITY_NEXT,
+                )
         except Exception:
             logger.exception(
                 "[GAME] Failed to start background portrait generation for %s",
                 getattr(suspect_to_assign, "name", "unknown"),
             )
 
-    # Get or create agent
-    if not hasattr(run_action_logic, "agent"):
-        run_action_logic.agent = create_game_master_agent()
-
-    # Update system prompt (will include newly assigned voice_id if any)
-    state.system_prompt = state.get_continue_prompt()
+    # Update system prompt (will include newly assigned voice_id if any).
+    # The static part stays identical across turns for prompt caching; the
+    # per-turn investigation state is sent separately after the history.
+    state.system_prompt, turn_context = state.get_prompt_parts()
 
-    # Process with agent (Game Master + tools) - TRACKED
-    perf.start("gameplay_agent", details=f"action={action_type}")
+    # Button actions (talk/search/accuse) call their tool directly - TRACKED
     t_agent_start = time.perf_counter()
-    response, speaker = process_message(
-        run_action_logic.agent,
-        message,
-        state.system_prompt,
-        session_id,
-        thread_id=session_id,
-    )
-    t_agent_end = time.perf_counter()
-    perf.end("gameplay_agent", details=f"{len(response)} chars, speaker={speaker}")
-    logger.info(
-        "[PERF] run_action_logic: agent + tools took %.2fs",
-        t_agent_end - t_agent_start,
-    )
+    direct = None
+    if action_type != "custom":
+        perf.start("gameplay_direct_tool", details=f"action={action_type}")
+        direct = _dispatch_direct_action(
+            action_type, target, accused_suspect, message, state
+        )
+        perf.end(
+            "gameplay_direct_tool",
+            status="success" if direct else "skipped",
+            details="dispatched" if direct else "fell back to agent",
+        )
+
+    if direct:
+        response, speaker = direct
+        # Keep the Game Master's conversation aware of the turn
+        record_turn(get_game_master_agent(), message, response, session_id, thread_id=session_id)
+        logger.info(
+            "[PERF] run_action_logic: direct tool took %.2fs",
+            time.perf_counter() - t_agent_start,
+        )
+    else:
+        # Process with agent (Game Master + tools) - TRACKED
+        perf.start("gameplay_agent", details=f"action={action_type}")
+        # Game Master narration is synthesized sentence by sentence while the
+        # agent is still generating; generate_turn_media picks up the segments.
+        speech_stream = start_turn_speech(session_id, state)
+        response, speaker = process_message(
+            get_game_master_agent(),
+            message,
+            state.system_prompt,
+            session_id,
+            thread_id=session_id,
+            turn_context=turn_context,
+            on_token=speech_stream.feed if speech_stream else None,
+            # Release streamed sentences for live playback as soon as the
+            # final Game Master message is complete
+            on_reply_end=speech_stream.finish if speech_stream else None,
+        )
+        if speech_stream:
+            # Only Game Master narration is played live (already released by
+            # on_reply_end); a suspect's reply comes with its own voice
+            tool_audio = get_tool_output_store(session_id).audio_path
+            if (speaker and speaker != "Game Master") or tool_audio:
+                speech_stream.cancel()
+            else:
+                speech_stream.finish()
+        t_agent_end = time.perf_counter()
+        perf.end("gameplay_agent", details=f"{len(response)} chars, speaker={speaker}")
+        logger.info(
+            "[PERF] run_action_logic: agent + tools took %.2fs",
+            t_agent_end - t_agent_start,
+        )
 
     # Handle empty or placeholder responses
     empty_responses = ["", "Empty", "I'm processing your request", "No content"]
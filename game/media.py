@@ -5,13 +5,19 @@ from __future__ import annotations
 import logging
 import os
 import threading
-import queue
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Dict, List, Optional, Tuple
 
 from game.state import GameState
 from services.image_service import smart_generate_portrait, smart_generate_scene
 from services.tts_service import text_to_speech
+from services.speech_stream import (
+    GM_STREAM_TTS,
+    SpeechStream,
+    pop_speech_stream,
+    start_speech_stream,
+)
 from game.state_manager import (
     mystery_images,
     get_or_create_state,
@@ -21,9 +27,18 @@ from game.state_manager import (
     normalize_location_name,
 )
 from services.perf_tracker import perf
+from services.media_scheduler import (
+    PRIORITY_NOW,
+    PRIORITY_PREWARM,
+    current_job_cancelled,
+    get_media_scheduler,
+)
 
 logger = logging.getLogger(__name__)
 
+# How long a turn waits for its on-screen portrait/scene (seconds)
+FOREGROUND_IMAGE_TIMEOUT = float(os.getenv("FOREGROUND_IMAGE_TIMEOUT", "45"))
+
 
 def _generate_portrait_background(
     suspect_name: str,
@@ -36,6 +51,10 @@ def _generate_portrait_background(
         logger.info("[BG] Generating portrait for %s...", suspect_name)
         perf.start(f"portrait_{suspect_name}", is_parallel=True, parallel_count=1, details="background")
         portrait_path = smart_generate_portrait(suspect, mystery_setting)
+        if current_job_cancelled():
+            perf.end(f"portrait_{suspect_name}", status="cancelled", details="session restarted")
+            logger.info("[BG] Discarding portrait for %s - session restarted", suspect_name)
+            return
         if portrait_path:
             if session_id not in mystery_images:
                 mystery_images[session_id] = {}
@@ -70,6 +89,10 @@ def _generate_scene_background(
             mood=mood,
             context=context_text,
         )
+        if current_job_cancelled():
+            perf.end(f"scene_{safe_loc}", status="cancelled", details="session restarted")
+            logger.info("[BG] Discarding scene for %s - session restarted", location)
+            return
         if scene_path:
             if session_id not in mystery_images:
                 mystery_images[session_id] = {}
@@ -84,11 +107,101 @@ def _generate_scene_background(
         logger.error("[BG] Error generating scene for %s: %s", location, e)
 
 
+def submit_portrait(
+    session_id: str,
+    suspect_name: str,
+    suspect,
+    mystery_setting: str,
+    priority: int = PRIORITY_NOW,
+):
+    """Queue a suspect portrait on the shared media scheduler (deduplicated)."""
+    return get_media_scheduler().submit(
+        session_id,
+        f"portrait:{suspect_name}",
+        _generate_portrait_background,
+        suspect_name,
+        suspect,
+        mystery_setting,
+        session_id,
+        priority=priority,
+    )
+
+
+def submit_scene(
+    session_id: str,
+    location: str,
+    mystery_setting: str,
+    context_text: str,
+    priority: int = PRIORITY_NOW,
+):
+    """Queue a scene image on the shared media scheduler (deduplicated)."""
+    return get_media_scheduler().submit(
+        session_id,
+        f"scene:{location}",
+        _generate_scene_background,
+        location,
+        mystery_setting,
+        context_text,
+        session_id,
+        priority=priority,
+    )
+
+
+def _await_image(
+    session_id: str, image_keys, submit, timeout: float, attempts: int = 2
+) -> Tuple[Optional[str], str]:
+    """Wait on the scheduler's job for an image needed on screen this turn.
+
+    `submit` queues the job at PRIORITY_NOW and returns the scheduler's
+    Future. A prewarm already queued or running for the same key is moved up
+    and shared instead of generating the image a second time. A job that
+    finishes without an image is resubmitted, up to `attempts` in total.
+    Returns (path or None, outcome for the perf entry).
+    """
+    import time
+
+    deadline = time.monotonic() + timeout
+    for attempt in range(1, attempts + 1):
+        try:
+            submit().result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            return None, f"timeout_{timeout:.0f}s"
+        except CancelledError:
+            return None, "cancelled"
+        except Exception as e:
+            logger.error("[GAME] ❌ Image job failed on attempt %d: %s", attempt, e)
+        session_imgs = mystery_images.get(session_id, {})
+        for key in image_keys:
+            if key in session_imgs:
+                return session_imgs[key], f"attempt_{attempt}"
+        if attempt < attempts:
+            logger.warning("[GAME] Image job for %s produced nothing, retrying", image_keys[0])
+    return None, f"failed_after_{attempts}_attempts"
+
+
+def _end_when_done(futures, perf_name: str, label: str):
+    """End a prewarm's perf entry once all of its jobs have finished."""
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def _done(_future):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        completed = sum(1 for f in futures if not f.cancelled() and f.exception() is None)
+        perf.end(perf_name, details=f"{completed}/{len(futures)} completed")
+        logger.info("[BG] %s complete: %d/%d", label, completed, len(futures))
+
+    for future in futures:
+        future.add_done_callback(_done)
+
+
 def _prewarm_suspect_portraits(session_id: str, mystery):
     """Pre-generate portraits for all suspects in the background.
 
-    Uses a small bounded worker pool (max 3 concurrent workers) so we don't
-    overwhelm the image API but still parallelize enough to be snappy.
+    Jobs run at prewarm priority on the shared media scheduler, so they only
+    use image API capacity that on-screen images don't need.
     """
     if not mystery or not getattr(mystery, "suspects", None):
         logger.info(
@@ -117,67 +230,24 @@ def _prewarm_suspect_portraits(session_id: str, mystery):
 
     perf.start("prewarm_portraits", is_parallel=True, parallel_count=len(tasks), 
                details=f"{len(tasks)} suspects")
-    
-    task_queue: "queue.Queue[Tuple[str, object]]" = queue.Queue()
-    completed_count = [0]  # Use list for mutable closure
-    
-    for task in tasks:
-        task_queue.put(task)
-
-    def _worker():
-        while True:
-            try:
-                name, suspect = task_queue.get_nowait()
-                try:
-                    logger.info(
-                        "[BG] Worker generating prewarm portrait for %s in session %s",
-                        name,
-                        session_id,
-                    )
-                    _generate_portrait_background(name, suspect, setting, session_id)
-                    completed_count[0] += 1
-                finally:
-                    # Ensure task is marked done even if generation fails
-                    task_queue.task_done()
-            except queue.Empty:
-                break
-            except Exception as e:  # noqa: BLE001
-                logger.error(
-                    "[BG] Worker error generating portrait for %s in session %s: %s",
-                    name if "name" in locals() else "<unknown>",
-                    session_id,
-                    e,
-                )
-
-    max_workers = 3
-    num_workers = min(max_workers, len(tasks))
-    threads = []
-    for _ in range(num_workers):
-        t = threading.Thread(target=_worker, daemon=True)
-        t.start()
-        threads.append(t)
 
+    futures = [
+        submit_portrait(session_id, name, suspect, setting, priority=PRIORITY_PREWARM)
+        for name, suspect in tasks
+    ]
     logger.info(
-        "[BG] Launched %d prewarm portrait workers for session %s (tasks=%d)",
-        num_workers,
-        session_id,
-        len(tasks),
+        "[BG] Queued %d prewarm portraits for session %s", len(futures), session_id
     )
-    
-    # Wait for all tasks to complete, then end perf tracking
-    def _track_completion():
-        task_queue.join()  # Wait for all tasks
-        perf.end("prewarm_portraits", details=f"{completed_count[0]}/{len(tasks)} completed")
-        logger.info("[BG] Portrait prewarm complete: %d/%d", completed_count[0], len(tasks))
-    
-    threading.Thread(target=_track_completion, daemon=True).start()
+    _end_when_done(futures, "prewarm_portraits", "Portrait prewarm")
 
 
 def _prewarm_scene_images(session_id: str, mystery):
     """Pre-generate scene images for all clue locations in the background.
 
-    Runs concurrently with portrait prewarming. Uses clue info to generate
-    focused scene images that are ready when the player searches.
+    Queued at prewarm priority on the shared media scheduler; a search that
+    reaches a location before its prewarm job has started moves it up. Uses
+    clue info to generate focused scene images that are ready when the player
+    searches.
     
     This eliminates the ~4-5s wait during gameplay when searching locations.
     """
@@ -207,70 +277,32 @@ def _prewarm_scene_images(session_id: str, mystery):
 
     perf.start("prewarm_scenes", is_parallel=True, parallel_count=len(location_clues),
                details=f"{len(location_clues)} locations")
-    
-    # Queue contains (location, clue) tuples for context
-    task_queue: "queue.Queue[Tuple[str, object]]" = queue.Queue()
-    completed_count = [0]  # Use list for mutable closure
-    
-    for location, clue in location_clues.items():
-        task_queue.put((location, clue))
-
-    def _worker():
-        while True:
-            try:
-                location, clue = task_queue.get_nowait()
-                try:
-                    logger.info(
-                        "[BG] Worker generating prewarm scene for %s in session %s",
-                        location,
-                        session_id,
-                    )
-                    # Build clue-focused context for better image quality
-                    clue_desc = getattr(clue, "description", "") or ""
-                    clue_type = getattr(clue, "type", "") or ""
-                    context = f"Focus: {clue_desc}. Type: {clue_type}." if clue_desc else ""
-                    
-                    _generate_scene_background(
-                        location=location,
-                        mystery_setting=setting,
-                        context_text=context,
-                        session_id=session_id,
-                    )
-                    completed_count[0] += 1
-                finally:
-                    task_queue.task_done()
-            except queue.Empty:
-                break
-            except Exception as e:  # noqa: BLE001
-                logger.error(
-                    "[BG] Worker error generating scene for %s in session %s: %s",
-                    location if "location" in locals() else "<unknown>",
-                    session_id,
-                    e,
-                )
-
-    max_workers = 3
-    num_workers = min(max_workers, len(location_clues))
-    threads = []
-    for _ in range(num_workers):
-        t = threading.Thread(target=_worker, daemon=True)
-        t.start()
-        threads.append(t)
 
+    futures = []
+    for location, clue in location_clues.items():
+        # Build clue-focused context for better image quality
+        clue_desc = getattr(clue, "description", "") or ""
+        clue_type = getattr(clue, "type", "") or ""
+        context = f"Focus: {clue_desc}. Type: {clue_type}." if clue_desc else ""
+        futures.append(
+            submit_scene(session_id, location, setting, context, priority=PRIORITY_PREWARM)
+        )
     logger.info(
-        "[BG] Launched %d prewarm scene workers for session %s (locations=%d)",
-        num_workers,
-        session_id,
-        len(location_clues),
+        "[BG] Queued %d prewarm scenes for session %s", len(futures), session_id
     )
-    
-    # Wait for all tasks to complete, then end perf tracking
-    def _track_completion():
-        task_queue.join()  # Wait for all tasks
-        perf.end("prewarm_scenes", details=f"{completed_count[0]}/{len(location_clues)} completed")
-        logger.info("[BG] Scene prewarm complete: %d/%d", completed_count[0], len(location_clues))
-    
-    threading.Thread(target=_track_completion, daemon=True).start()
+    _end_when_done(futures, "prewarm_scenes", "Scene prewarm")
+
+
+def start_turn_speech(session_id: str, state: GameState) -> Optional[SpeechStream]:
+    """Start streaming Game Master TTS for this turn (None if disabled).
+
+    Feed it the agent's tokens (process_message(on_token=stream.feed)) and call
+    finish() afterwards; generate_turn_media picks up the finished segments.
+    """
+    if not GM_STREAM_TTS:
+        return None
+    voice_id = getattr(state, "game_master_voice_id", None) or GAME_MASTER_VOICE_ID
+    return start_speech_stream(session_id, voice_id)
 
 
 def generate_turn_media(
@@ -316,6 +348,7 @@ def generate_turn_media(
     
     tts_text = clean_response.replace("**", "").replace("*", "")
     speaker_name = speaker or "Game Master"
+    speech_stream = pop_speech_stream(session_id)
     
     # Collect image generation tasks
     image_tasks = []
@@ -365,24 +398,17 @@ def generate_turn_media(
         if portrait_suspect:
             mystery_setting = state.mystery.setting if state.mystery else ""
             logger.info("[GAME] Starting background portrait generation for: %s", speaker)
-            threading.Thread(
-                target=_generate_portrait_background,
-                args=(speaker, portrait_suspect, mystery_setting, session_id),
-                daemon=True,
-            ).start()
+            submit_portrait(session_id, speaker, portrait_suspect, mystery_setting)
         
         if scene_info:
             location, normalized_location, mystery_setting, context_text = scene_info
             logger.info("[GAME] Starting background scene generation for: %s", normalized_location)
-            threading.Thread(
-                target=_generate_scene_background,
-                args=(normalized_location, mystery_setting, context_text, session_id),
-                daemon=True,
-            ).start()
+            submit_scene(session_id, normalized_location, mystery_setting, context_text)
         
         # TTS runs in foreground
         audio_path, alignment_data = _generate_tts(
-            tts_text, voice_id, speaker_name, audio_path_from_tool, alignment_data_from_tool
+            tts_text, voice_id, speaker_name, audio_path_from_tool, alignment_data_from_tool,
+            speech_stream,
         )
         return audio_path, alignment_data
     
@@ -396,7 +422,10 @@ def generate_turn_media(
     alignment_data = None
     
     def _tts_task():
-        return _generate_tts(tts_text, voice_id, speaker_name, audio_path_from_tool, alignment_data_from_tool)
+        return _generate_tts(
+            tts_text, voice_id, speaker_name, audio_path_from_tool, alignment_data_from_tool,
+            speech_stream,
+        )
     
     def _portrait_task():
         if not portrait_suspect:
@@ -407,17 +436,11 @@ def generate_turn_media(
         
         # =====================================================================
         # WAIT/RETRY LOGIC FOR PORTRAIT GENERATION
-        # 1. Check if already exists (background thread may have finished)
-        # 2. Wait up to 10s for background thread to complete
-        # 3. If still not ready, generate with up to 2 retries
+        # 1. Check if already exists (background job may have finished)
+        # 2. Otherwise wait on the scheduler's job for it, moved up to NOW
+        #    (the pre-warm queued in run_action_logic, or a fresh one)
         # =====================================================================
-        
-        import time
-        
-        MAX_WAIT_SECONDS = 10
-        POLL_INTERVAL = 0.5
-        MAX_RETRIES = 2
-        
+
         # Check if portrait already exists
         session_imgs = mystery_images.get(session_id, {})
         if speaker in session_imgs:
@@ -425,47 +448,21 @@ def generate_turn_media(
             logger.info("[GAME] ✅ Portrait already ready for %s (from background)", speaker)
             perf.end(f"parallel_portrait_{speaker}", details="already_ready")
             return portrait_path
-        
-        # Wait for background thread (it was started in run_action_logic)
-        logger.info("[GAME] ⏳ Waiting up to %ds for portrait background thread: %s", MAX_WAIT_SECONDS, speaker)
-        wait_start = time.time()
-        while time.time() - wait_start < MAX_WAIT_SECONDS:
-            session_imgs = mystery_images.get(session_id, {})
-            if speaker in session_imgs:
-                portrait_path = session_imgs[speaker]
-                wait_time = time.time() - wait_start
-                logger.info("[GAME] ✅ Portrait ready after %.1fs wait: %s", wait_time, speaker)
-                perf.end(f"parallel_portrait_{speaker}", details=f"waited_{wait_time:.1f}s")
-                return portrait_path
-            time.sleep(POLL_INTERVAL)
-        
-        logger.warning("[GAME] ⚠️ Background portrait not ready after %ds, generating now: %s", MAX_WAIT_SECONDS, speaker)
-        
-        # Generate ourselves with retries
-        portrait_path = None
-        for attempt in range(1, MAX_RETRIES + 1):
-            try:
-                logger.info("[GAME] 🔄 Portrait generation attempt %d/%d for %s", attempt, MAX_RETRIES, speaker)
-                portrait_path = smart_generate_portrait(portrait_suspect, mystery_setting)
-                if portrait_path:
-                    if session_id not in mystery_images:
-                        mystery_images[session_id] = {}
-                    mystery_images[session_id][speaker] = portrait_path
-                    logger.info("[GAME] ✅ Portrait generated on attempt %d: %s", attempt, speaker)
-                    perf.end(f"parallel_portrait_{speaker}", details=f"generated_attempt_{attempt}")
-                    return portrait_path
-                else:
-                    logger.warning("[GAME] ❌ Portrait generation returned None on attempt %d: %s", attempt, speaker)
-            except Exception as e:
-                logger.error("[GAME] ❌ Portrait generation error on attempt %d: %s - %s", attempt, speaker, e)
-            
-            if attempt < MAX_RETRIES:
-                logger.info("[GAME] Retrying portrait in 1s...")
-                time.sleep(1)
-        
-        logger.error("[GAME] ❌ Portrait generation failed after %d attempts: %s", MAX_RETRIES, speaker)
-        perf.end(f"parallel_portrait_{speaker}", status="error", details=f"failed_after_{MAX_RETRIES}_attempts")
-        return None
+
+        logger.info("[GAME] ⏳ Waiting up to %.0fs for portrait: %s", FOREGROUND_IMAGE_TIMEOUT, speaker)
+        portrait_path, outcome = _await_image(
+            session_id,
+            [speaker],
+            lambda: submit_portrait(session_id, speaker, portrait_suspect, mystery_setting),
+            FOREGROUND_IMAGE_TIMEOUT,
+        )
+        if portrait_path:
+            logger.info("[GAME] ✅ Portrait ready (%s): %s", outcome, speaker)
+            perf.end(f"parallel_portrait_{speaker}", details=outcome)
+        else:
+            logger.error("[GAME] ❌ Portrait not ready (%s): %s", outcome, speaker)
+            perf.end(f"parallel_portrait_{speaker}", status="error", details=outcome)
+        return portrait_path
     
     def _scene_task():
         if not scene_info:
@@ -478,76 +475,43 @@ def generate_turn_media(
         # =====================================================================
         # WAIT/RETRY LOGIC FOR SCENE GENERATION
         # 1. Check if already exists (prewarmed in background)
-        # 2. Wait up to 8s for prewarm to complete
-        # 3. If still not ready, generate with up to 2 retries
+        # 2. Otherwise wait on the scheduler's job for it, moved up to NOW
+        #    (the prewarm under either name, or a fresh one)
         # =====================================================================
-        
-        import time
-        
-        MAX_WAIT_SECONDS = 8
-        POLL_INTERVAL = 0.5
-        MAX_RETRIES = 2
-        
+
         # Check if scene already exists (from prewarm)
         session_imgs = mystery_images.get(session_id, {})
-        if normalized_location in session_imgs:
-            scene_path = session_imgs[normalized_location]
-            logger.info("[GAME] ✅ Scene already ready for %s (from prewarm)", normalized_location)
-            perf.end(f"parallel_scene_{safe_loc}", details="already_ready")
-            return scene_path
-        if location in session_imgs:
-            scene_path = session_imgs[location]
-            logger.info("[GAME] ✅ Scene already ready for %s (from prewarm)", location)
-            perf.end(f"parallel_scene_{safe_loc}", details="already_ready")
-            return scene_path
-        
-        # Wait for prewarm thread
-        logger.info("[GAME] ⏳ Waiting up to %ds for scene prewarm: %s", MAX_WAIT_SECONDS, normalized_location)
-        wait_start = time.time()
-        while time.time() - wait_start < MAX_WAIT_SECONDS:
-            session_imgs = mystery_images.get(session_id, {})
-            if normalized_location in session_imgs or location in session_imgs:
-                scene_path = session_imgs.get(normalized_location) or session_imgs.get(location)
-                wait_time = time.time() - wait_start
-                logger.info("[GAME] ✅ Scene ready after %.1fs wait: %s", wait_time, normalized_location)
-                perf.end(f"parallel_scene_{safe_loc}", details=f"waited_{wait_time:.1f}s")
-                return scene_path
-            time.sleep(POLL_INTERVAL)
-        
-        logger.warning("[GAME] ⚠️ Scene prewarm not ready after %ds, generating now: %s", MAX_WAIT_SECONDS, normalized_location)
-        
-        # Generate ourselves with retries
-        scene_path = None
-        for attempt in range(1, MAX_RETRIES + 1):
-            try:
-                logger.info("[GAME] 🔄 Scene generation attempt %d/%d for %s", attempt, MAX_RETRIES, normalized_location)
-                scene_path = smart_generate_scene(
-                    location=normalized_location,
-                    setting=mystery_setting,
-                    mood="mysterious",
-                    context=context_text,
-                )
-                if scene_path:
-                    if session_id not in mystery_images:
-                        mystery_images[session_id] = {}
-                    mystery_images[session_id][normalized_location] = scene_path
-                    if normalized_location != location:
-                        mystery_images[session_id][location] = scene_path
-                    logger.info("[GAME] ✅ Scene generated on attempt %d: %s", attempt, normalized_location)
-                    perf.end(f"parallel_scene_{safe_loc}", details=f"generated_attempt_{attempt}")
-                    return scene_path
-                else:
-                    logger.warning("[GAME] ❌ Scene generation returned None on attempt %d: %s", attempt, normalized_location)
-            except Exception as e:
-                logger.error("[GAME] ❌ Scene generation error on attempt %d: %s - %s", attempt, normalized_location, e)
-            
-            if attempt < MAX_RETRIES:
-                logger.info("[GAME] Retrying scene in 1s...")
-                time.sleep(1)
-        
-        logger.error("[GAME] ❌ Scene generation failed after %d attempts: %s", MAX_RETRIES, normalized_location)
-        perf.end(f"parallel_scene_{safe_loc}", status="error", details=f"failed_after_{MAX_RETRIES}_attempts")
-        return None
+        for key in (normalized_location, location):
+            if key in session_imgs:
+                logger.info("[GAME] ✅ Scene already ready for %s (from prewarm)", key)
+                perf.end(f"parallel_scene_{safe_loc}", details="already_ready")
+                return session_imgs[key]
+
+        def _submit():
+            # A prewarm may be keyed by either name; share it rather than
+            # generating the same location twice
+            scheduler = get_media_scheduler()
+            for key in (normalized_location, location):
+                future = scheduler.promote(session_id, f"scene:{key}")
+                if future is not None:
+                    return future
+            return submit_scene(session_id, normalized_location, mystery_setting, context_text)
+
+        logger.info("[GAME] ⏳ Waiting up to %.0fs for scene: %s", FOREGROUND_IMAGE_TIMEOUT, normalized_location)
+        scene_path, outcome = _await_image(
+            session_id, [normalized_location, location], _submit, FOREGROUND_IMAGE_TIMEOUT
+        )
+        if scene_path:
+            # Later turns may look the scene up under either name
+            session_imgs = mystery_images.setdefault(session_id, {})
+            session_imgs.setdefault(normalized_location, scene_path)
+            session_imgs.setdefault(location, scene_path)
+            logger.info("[GAME] ✅ Scene ready (%s): %s", outcome, normalized_location)
+            perf.end(f"parallel_scene_{safe_loc}", details=outcome)
+        else:
+            logger.error("[GAME] ❌ Scene not ready (%s): %s", outcome, normalized_location)
+            perf.end(f"parallel_scene_{safe_loc}", status="error", details=outcome)
+        return scene_path
     
     # Run all tasks in parallel
     with ThreadPoolExecutor(max_workers=3) as executor:
@@ -578,8 +542,30 @@ def _generate_tts(
     speaker_name: str,
     audio_path_from_tool: Optional[str],
     alignment_data_from_tool: Optional[List[Dict]] = None,
+    speech_stream: Optional[SpeechStream] = None,
 ) -> Tuple[Optional[str], Optional[List[Dict]]]:
-    """Generate TTS audio (extracted for parallel execution)."""
+    """Generate TTS audio (extracted for parallel execution).
+
+    Game Master narration that was already synthesized sentence by sentence
+    while the agent streamed (see start_turn_speech) is reused when it matches.
+    """
+    if speech_stream is not None:
+        if (
+            not audio_path_from_tool
+            and speaker_name == "Game Master"
+            and speech_stream.matches(tts_text)
+        ):
+            perf.start("gameplay_tts", details=f"{len(tts_text)} chars, streamed")
+            audio_path, alignment_data = speech_stream.merged()
+            perf.end("gameplay_tts", details=f"streamed audio={bool(audio_path)}")
+            if audio_path:
+                logger.info("[GAME] ✅ Using streamed TTS: %s", audio_path)
+                return audio_path, alignment_data
+            logger.warning("[GAME] Streamed TTS incomplete, synthesizing full response")
+        else:
+            logger.info("[GAME] Streamed TTS not used for this turn (speaker=%s)", speaker_name)
+            speech_stream.cancel()
+
     if audio_path_from_tool:
         # Prefer alignment data passed directly from ToolOutputStore
         alignment_data = alignment_data_from_tool
@@ -15,8 +15,8 @@ import re
 import json
 import random
 import logging
-from typing import Optional, TYPE_CHECKING
-from langchain_openai import ChatOpenAI
+from typing import Optional, Tuple, TYPE_CHECKING
+from services.llm_clients import get_chat_model
 
 if TYPE_CHECKING:
     from game.public_mystery import PublicMystery
@@ -126,11 +126,7 @@ TONE: {tone_instruction}
         # Pick a random setting type to force variety
         setting_type = random.choice(SETTING_TYPES)
 
-    llm = ChatOpenAI(
-        model="gpt-4o",
-        temperature=0.8,
-        api_key=os.getenv("OPENAI_API_KEY"),
-    )
+    llm = get_chat_model("gpt-4o", temperature=0.8)
 
     parser = PydanticOutputParser(pydantic_object=MysteryPremise)
 
@@ -207,11 +203,7 @@ def generate_location_descriptions(mystery: Mystery) -> dict:
     Returns a dict: {location_name: visual_description}.
     """
     try:
-        llm = ChatOpenAI(
-            model="gpt-4o-mini",
-            temperature=0.8,
-            api_key=os.getenv("OPENAI_API_KEY"),
-        )
+        llm = get_chat_model("gpt-4o-mini", temperature=0.8)
 
         # Collect unique locations from the clues
         locations = sorted({clue.location for clue in mystery.clues})
@@ -373,11 +365,7 @@ def _generate_mystery_monolithic(
     the available voices and assign voice_id directly to each suspect.
     """
 
-    llm = ChatOpenAI(
-        model="gpt-4o",
-        temperature=0.9,
-        api_key=os.getenv("OPENAI_API_KEY"),
-    )
+    llm = get_chat_model("gpt-4o", temperature=0.9)
 
     parser = PydanticOutputParser(pydantic_object=Mystery)
 
@@ -865,18 +853,38 @@ def prepare_secure_game_prompt(
         public_mystery: The sanitized public view of the mystery
         tone_instruction: Optional tone guidance
     """
-    from game.public_mystery import build_gm_context
-    
-    # Get the context from public mystery
-    case_context = build_gm_context(public_mystery)
+    static_prompt, turn_context = prepare_secure_game_prompt_parts(
+        public_mystery, tone_instruction
+    )
+    return f"{static_prompt}\n\n{turn_context}"
+
+
+def prepare_secure_game_prompt_parts(
+    public_mystery: "PublicMystery",
+    tone_instruction: Optional[str] = None,
+) -> Tuple[str, str]:
+    """Same prompt as prepare_secure_game_prompt, split into (static prefix, per-turn context).
+
+    The static prefix is identical on every turn of a game, so it can be
+    served from the provider's prompt cache; pass the per-turn context to
+    process_message(turn_context=...) so it is sent after the history.
+    """
+    from game.public_mystery import build_gm_case_context, build_gm_progress
     
     # Build suspect profiles from public info only
-    # Alibis are only revealed after interrogation
     suspect_profiles = "\n".join(
         f"""
 ### {s.name}
 Role: {s.role}
 Personality: {s.personality}
+"""
+        for s in public_mystery.suspects
+    )
+    
+    # Alibis are only revealed after interrogation
+    suspect_status = "\n".join(
+        f"""
+### {s.name}
 Alibi claim: {f'"{s.alibi}"' if s.has_been_interrogated else "(Not yet revealed - interrogate this suspect to learn their alibi)"}
 Status: {"INTERROGATED" if s.has_been_interrogated else "Not yet questioned"}
 """
@@ -887,9 +895,9 @@ Status: {"INTERROGATED" if s.has_been_interrogated else "Not yet questioned"}
     if tone_instruction:
         tone_block = f"\n## TONE\n{tone_instruction}\n"
     
-    return f"""You are the Game Master for a murder mystery game.
+    static_prompt = f"""You are the Game Master for a murder mystery game.
 
-{case_context}
+{build_gm_case_context(public_mystery)}
 
 ## SUSPECT PROFILES (for interrogate_suspect tool)
 {suspect_profiles}
@@ -929,5 +937,14 @@ CRITICAL: You can ONLY reveal information the player has EARNED through investig
 - TALK: ~60-80 words
 - SEARCH: ~50 words (just what they SEE)
 - Be atmospheric and conversational
-{tone_block}
+{tone_block}"""
+
+    turn_context = f"""# CURRENT INVESTIGATION STATE
+
+{build_gm_progress(public_mystery)}
+
+## SUSPECT STATUS
+{suspect_status}
 Continue the investigation based on the player's message."""
+
+    return static_prompt, turn_context
@@ -17,11 +17,10 @@ game start to generate the mystery content.
 
 import asyncio
 import logging
-import os
 import random
 from typing import Dict, List, Optional, Tuple
 
-from langchain_openai import ChatOpenAI
+from services.llm_clients import get_chat_model, run_async
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
 
@@ -215,11 +214,7 @@ async def _generate_skeleton_impl(
     from game.mystery_generator import SETTING_TYPES
     
     # Use structured output - LLM is constrained to output valid Pydantic
-    llm = ChatOpenAI(
-        model="gpt-4o-mini",
-        temperature=0.9,
-        api_key=os.getenv("OPENAI_API_KEY"),
-    ).with_structured_output(MysterySkeleton)
+    llm = get_chat_model("gpt-4o-mini", temperature=0.9).with_structured_output(MysterySkeleton)
     
     # Use premise if provided, otherwise generate setting
     if premise:
@@ -370,11 +365,7 @@ async def _generate_encounter_graph_impl(
 ) -> EncounterGraph:
     """Internal: Generate the encounter graph based on skeleton."""
     
-    llm = ChatOpenAI(
-        model="gpt-4o",
-        temperature=0.7,
-        api_key=os.getenv("OPENAI_API_KEY"),
-    ).with_structured_output(EncounterGraphOutput)
+    llm = get_chat_model("gpt-4o", temperature=0.7).with_structured_output(EncounterGraphOutput)
     
     # Time slots explanation
     time_slots_desc = """
@@ -563,11 +554,7 @@ async def _generate_suspect_impl(
 ) -> SuspectDraft:
     """Internal implementation of suspect generation with structured output."""
     # Use structured output - LLM is constrained to output valid Pydantic
-    llm = ChatOpenAI(
-        model="gpt-4o",
-        temperature=0.9,
-        api_key=os.getenv("OPENAI_API_KEY"),
-    ).with_structured_output(SuspectDraft)
+    llm = get_chat_model("gpt-4o", temperature=0.9).with_structured_output(SuspectDraft)
     
     # Get the predetermined name/role from skeleton (for UI consistency)
     # These were shown to the player BEFORE full generation, so we MUST use them
@@ -815,11 +802,7 @@ async def _generate_clues_impl(
 ) -> ClueSet:
     """Internal implementation of clue generation with structured output."""
     # Use structured output - LLM is constrained to output valid Pydantic
-    llm = ChatOpenAI(
-        model="gpt-4o",
-        temperature=0.8,
-        api_key=os.getenv("OPENAI_API_KEY"),
-    ).with_structured_output(ClueSet)
+    llm = get_chat_model("gpt-4o", temperature=0.8).with_structured_output(ClueSet)
     
     # Get all suspect roles for alibi verification
     all_suspect_roles = ", ".join(skeleton.suspect_briefs)
@@ -1353,20 +1336,7 @@ def generate_skeleton_sync(
     Returns:
         MysterySkeleton with suspect_previews for immediate display
     """
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    asyncio.run,
-                    generate_skeleton(config=config, premise=premise)
-                )
-                return future.result()
-        else:
-            return loop.run_until_complete(generate_skeleton(config=config, premise=premise))
-    except RuntimeError:
-        return asyncio.run(generate_skeleton(config=config, premise=premise))
+    return run_async(generate_skeleton(config=config, premise=premise))
 
 
 def generate_mystery_parallel_sync(
@@ -1386,31 +1356,21 @@ def generate_mystery_parallel_sync(
     NOTE: Returns only the Mystery for backward compatibility.
     The encounter graph is initialized in the MysteryOracle internally.
     """
+    from game.state_manager import get_current_session_id
+
+    # Resolved here: the coroutine may run on a helper thread without our context
+    session_id = get_current_session_id()
+
     async def _generate_and_init_oracle():
         mystery, encounter_graph = await generate_mystery_parallel(premise, config, voice_summary, skeleton)
         
         # Initialize the MysteryOracle with the truth
         # This is the ONLY place where the full truth is stored
         from services.mystery_oracle import initialize_mystery_oracle
-        initialize_mystery_oracle(mystery, encounter_graph)
+        initialize_mystery_oracle(mystery, encounter_graph, session_id=session_id)
         
         return mystery
     
-    try:
-        # Try to get existing event loop
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # We're inside an async context, need to use nest_asyncio or thread
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    asyncio.run,
-                    _generate_and_init_oracle()
-                )
-                return future.result()
-        else:
-            return loop.run_until_complete(_generate_and_init_oracle())
-    except RuntimeError:
-        # No event loop exists, create one
-        return asyncio.run(_generate_and_init_oracle())
+    # Shared LLM loop: async clients keep their connection pool between games
+    return run_async(_generate_and_init_oracle())
 
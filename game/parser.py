@@ -13,6 +13,7 @@ import re
 from typing import Optional, List, Tuple
 
 from game.state import GameState
+from game.suspect_resolver import SUSPECT_RESOLVER_MIN_CONFIDENCE, resolve_suspect
 
 logger = logging.getLogger(__name__)
 
@@ -203,19 +204,7 @@ def find_suspect_in_message(message_lower: str, state: GameState) -> Optional[st
     if not state.mystery:
         return None
 
-    for suspect in state.mystery.suspects:
-        name_lower = suspect.name.lower()
-        # Check full name
-        if name_lower in message_lower:
-            return suspect.name
-        # Check first/last name parts
-        name_parts = name_lower.split()
-        for part in name_parts:
-            if len(part) > 2 and part in message_lower:
-                return suspect.name
-        # Check role (butler, heiress, etc.)
-        role_lower = suspect.role.lower()
-        if role_lower in message_lower:
-            return suspect.name
-
+    match = resolve_suspect(message_lower, state.mystery.suspects)
+    if match and match.confidence >= SUSPECT_RESOLVER_MIN_CONFIDENCE:
+        return match.name
     return None
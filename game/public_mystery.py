@@ -143,21 +143,17 @@ def build_gm_context(public: PublicMystery) -> str:
     
     This is what the GM agent can see - ONLY discovered information.
     """
-    suspect_list = "\n".join(
-        f"- {s.name} ({s.role})" + 
-        (" [INTERROGATED]" if s.has_been_interrogated else "")
-        for s in public.suspects
-    )
-    
-    location_list = "\n".join(
-        f'- "{loc}"' + (" [SEARCHED]" if loc in public.searched_locations else "")
-        for loc in public.available_locations
-    )
-    
-    clue_list = "\n".join(
-        f"- {c.description} (found at {c.location})"
-        for c in public.discovered_clues
-    ) or "None yet"
+    return f"{build_gm_case_context(public)}\n\n{build_gm_progress(public)}"
+
+
+def build_gm_case_context(public: PublicMystery) -> str:
+    """The part of the GM context that is fixed for the whole game.
+
+    Kept separate from build_gm_progress so the prompt prefix stays identical
+    between turns and can be served from the provider's prompt cache.
+    """
+    suspect_list = "\n".join(f"- {s.name} ({s.role})" for s in public.suspects)
+    location_list = "\n".join(f'- "{loc}"' for loc in public.available_locations)
     
     return f"""## THE CASE
 {public.setting}
@@ -169,7 +165,30 @@ def build_gm_context(public: PublicMystery) -> str:
 {suspect_list}
 
 ## KNOWN LOCATIONS
-{location_list}
+{location_list}"""
+
+
+def build_gm_progress(public: PublicMystery) -> str:
+    """The part of the GM context that changes as the player investigates."""
+    interrogated = "\n".join(
+        f"- {s.name}" for s in public.suspects if s.has_been_interrogated
+    ) or "None yet"
+    
+    searched = "\n".join(
+        f'- "{loc}"' for loc in public.available_locations
+        if loc in public.searched_locations
+    ) or "None yet"
+    
+    clue_list = "\n".join(
+        f"- {c.description} (found at {c.location})"
+        for c in public.discovered_clues
+    ) or "None yet"
+    
+    return f"""## SUSPECTS INTERROGATED
+{interrogated}
+
+## LOCATIONS SEARCHED
+{searched}
 
 ## DISCOVERED CLUES
 {clue_list}
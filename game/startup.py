@@ -26,16 +26,19 @@ from game.mystery_generator import (
 from game.parallel_mystery import generate_skeleton_sync
 from game.media import _prewarm_scene_images
 from mystery_config import create_validated_config
-from services.agent import create_game_master_agent, process_message
+from services.agent import get_game_master_agent, process_message
 from services.tts_service import text_to_speech
 from game.state_manager import (
     mystery_images,
     GAME_MASTER_VOICE_ID,
     get_or_create_state,
+    run_in_session,
 )
 from services.game_memory import initialize_game_memory, reset_game_memory
+from services.agent_history import reset_conversation_history
 from services.voice_service import get_voice_service, Voice
 from services.mystery_oracle import initialize_mystery_oracle, reset_mystery_oracle
+from services.media_scheduler import PRIORITY_NOW, current_job_cancelled, get_media_scheduler
 from game.public_mystery import create_public_mystery
 
 logger = logging.getLogger(__name__)
@@ -106,7 +109,12 @@ def _background_generate_title_card_from_premise(session_id: str):
     This can run before the full mystery is ready. It uses the stored
     ``premise_setting`` and ``premise_victim_name`` on the GameState to
     build a lightweight mystery-like object for the image service.
+
+    Runs as a media scheduler job and ends the ``bg_title_card`` perf entry
+    on every exit path.
     """
+    from services.perf_tracker import perf
+
     try:
         # If another process (e.g. the foreground fallback) has already
         # generated the opening scene, don't do duplicate work.
@@ -116,6 +124,7 @@ def _background_generate_title_card_from_premise(session_id: str):
                 "[BG] Title-card prewarm: opening scene already exists for %s, skipping",
                 session_id,
             )
+            perf.end("bg_title_card", status="skipped", details="already generated")
             return
 
         bg_state = get_or_create_state(session_id)
@@ -126,6 +135,7 @@ def _background_generate_title_card_from_premise(session_id: str):
                 "[BG] Title-card prewarm: missing premise data for session %s, skipping",
                 session_id,
             )
+            perf.end("bg_title_card", status="skipped", details="no premise")
             return
 
         from types import SimpleNamespace
@@ -141,11 +151,16 @@ def _background_generate_title_card_from_premise(session_id: str):
         # Use fast_mode=True to skip LLM prompt enhancement (~6s faster)
         # This ensures the image is ready before/with the welcome speech
         portrait = generate_title_card_on_demand(mystery_like, fast_mode=True)
+        if current_job_cancelled():
+            logger.info("[BG] Discarding opening scene for %s - session restarted", session_id)
+            perf.end("bg_title_card", status="cancelled", details="session restarted")
+            return
         if not portrait:
             logger.warning(
                 "[BG] Failed to generate opening scene image for session %s",
                 session_id,
             )
+            perf.end("bg_title_card", status="error", details="no image")
             return
 
         # Ensure session image dict exists without clobbering any existing images
@@ -157,10 +172,12 @@ def _background_generate_title_card_from_premise(session_id: str):
             session_id,
             portrait,
         )
-    except Exception:
+        perf.end("bg_title_card", details="ready")
+    except Exception as e:
         logger.exception(
             "[BG] Error prewarming opening scene image for session %s", session_id
         )
+        perf.end("bg_title_card", status="error", details=str(e))
 
 
 def fetch_voices_for_session(session_id: str) -> Tuple[List, str, str]:
@@ -283,11 +300,15 @@ def start_new_game(session_id: str):
     
     state = get_or_create_state(session_id)
     state.reset_game()
+    # New game in the same session - start the GM conversation from scratch
+    reset_conversation_history(session_id)
+    # Images still queued for the previous game would only waste API capacity
+    get_media_scheduler().cancel_session(session_id)
 
     # Initialize RAG memory for semantic search (Phase 2 AI Enhancement)
     perf.start("init_rag_memory")
-    reset_game_memory()
-    if initialize_game_memory():
+    reset_game_memory(session_id)
+    if initialize_game_memory(session_id):
         logger.info("[RAG] Game memory initialized successfully")
         perf.end("init_rag_memory", details="success")
     else:
@@ -371,29 +392,29 @@ system or background tasks. Stay purely in-world."""
     # we have the premise (victim + setting). This runs concurrently with
     # the welcome LLM + TTS so the image is often ready by the time we show
     # the first screen, without blocking startup.
-    perf.start("bg_title_card", is_parallel=True, parallel_count=1, details="Background thread")
+    perf.start("bg_title_card", is_parallel=True, parallel_count=1, details="Media scheduler")
     try:
-        threading.Thread(
-            target=_background_generate_title_card_from_premise,
-            args=(session_id,),
-            daemon=True,
-        ).start()
-        # Note: We mark this as "started" - completion is tracked separately
+        # The opening scene is the first thing on screen - highest priority
+        get_media_scheduler().submit(
+            session_id,
+            "title_card",
+            _background_generate_title_card_from_premise,
+            session_id,
+            priority=PRIORITY_NOW,
+        )
+        # The job itself ends the perf entry when the image is ready (or not)
     except Exception as e:  # noqa: BLE001
         logger.error(
-            "[BG] Error starting title-card prewarm thread for %s: %s",
+            "[BG] Error queueing title-card prewarm for %s: %s",
             session_id,
             e,
         )
         perf.end("bg_title_card", status="error", details=str(e))
 
-    # Create or reuse shared agent and get narration immediately (no waiting for images)
-    if not hasattr(start_new_game, "agent"):
-        start_new_game.agent = create_game_master_agent()
-
+    # Get narration immediately from the shared agent (no waiting for images)
     perf.start("welcome_llm", details="Game Master greeting")
     response, _speaker = process_message(
-        start_new_game.agent,
+        get_game_master_agent(),
         (
             "The player has just arrived. Welcome them briefly "
             "(2-3 sentences, max 50 words) with atmosphere, "
@@ -546,7 +567,7 @@ system or background tasks. Stay purely in-world."""
             # SECURE ARCHITECTURE: Initialize truth authority and public view
             # - MysteryOracle holds full truth (murderer, secrets, alibis)
             # - PublicMystery is sanitized view for GM agent (no secrets!)
-            initialize_mystery_oracle(full_mystery, encounter_graph=None)
+            initialize_mystery_oracle(full_mystery, encounter_graph=None, session_id=sess_id)
             bg_state.public_mystery = create_public_mystery(full_mystery)
             logger.info("[BG] Initialized MysteryOracle and PublicMystery for session %s", sess_id)
             
@@ -584,7 +605,7 @@ system or background tasks. Stay purely in-world."""
             logger.info("[BG] Starting scene image prewarming for session %s...", sess_id)
             perf.start("bg_prewarm_images", is_parallel=True, parallel_count=1, details="scenes only")
             try:
-                # Prewarm scene images for all clue locations (3 parallel workers)
+                # Prewarm scene images for all clue locations (media scheduler, prewarm priority)
                 # Uses clue info for focused images - eliminates ~4-5s wait during gameplay
                 # NOTE: Suspect portraits are NOT prewarmed - they load when you question someone
                 _prewarm_scene_images(sess_id, full_mystery)
@@ -597,13 +618,11 @@ system or background tasks. Stay purely in-world."""
             logger.error("[BG] Error generating full mystery in background: %s", e)
             perf.end("bg_full_mystery", status="error", details=str(e))
 
-    # Mark title card prewarm as started (it's running in parallel)
-    perf.end("bg_title_card", status="started", details="Running in parallel")
-    
     perf.start("bg_mystery_thread", details="Starting background thread")
+    # run_in_session: the thread serves this session (oracle, memory, tools)
     threading.Thread(
-        target=_background_generate_full_case,
-        args=(session_id, premise, voice_summary),  # Pass voice_summary!
+        target=run_in_session,
+        args=(session_id, _background_generate_full_case, session_id, premise, voice_summary),  # Pass voice_summary!
         daemon=True,
     ).start()
     perf.end("bg_mystery_thread", details="Thread launched")
@@ -1,16 +1,25 @@
 """Game state management."""
 
-from typing import Dict, Optional, List, Any, TYPE_CHECKING
+import concurrent.futures
+import logging
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional, List, Any, Tuple, TYPE_CHECKING
 from game.models import Mystery, SuspectState, AccusationAttempt, AccusationRequirements
 from mystery_config import MysteryConfig, create_validated_config
 
 if TYPE_CHECKING:
     from game.public_mystery import PublicMystery
 
+logger = logging.getLogger(__name__)
+
 
 class GameState:
     """Manages the state of a game session."""
 
+    # Contradiction notifications kept until the UI shows them (oldest dropped)
+    MAX_CONTRADICTION_NOTIFICATIONS = 20
+
     def __init__(self):
         self.mystery: Optional[Mystery] = None
         self.system_prompt: Optional[str] = None
@@ -65,6 +74,14 @@ class GameState:
         # Investigation timeline - what the player has discovered
         # Each event: {time_slot, source, event_type, description, suspect_name, is_verified, is_contradiction}
         self.discovered_timeline: List[Dict] = []
+        # Background contradiction checks for timeline events. Results land on the
+        # events themselves; the UI drains the notifications on each update.
+        self._timeline_lock = threading.Lock()
+        self._timeline_generation: int = 0
+        self._contradiction_checks: List[concurrent.futures.Future] = []
+        self._contradiction_notifications: Deque[Dict] = deque(
+            maxlen=self.MAX_CONTRADICTION_NOTIFICATIONS
+        )
         
         # SECURE ARCHITECTURE: Public view of mystery for GM agent
         # The full mystery is in MysteryOracle - GM only sees this sanitized view
@@ -110,8 +127,12 @@ class GameState:
         # Reset early suspect display
         self.suspect_previews = []
         self.skeleton = None
-        # Reset investigation timeline
-        self.discovered_timeline = []
+        # Reset investigation timeline (in-flight checks for the old game are ignored)
+        with self._timeline_lock:
+            self.discovered_timeline = []
+            self._timeline_generation += 1
+            self._contradiction_checks = []
+            self._contradiction_notifications.clear()
 
     def add_clue(self, clue_id: str, clue_description: str):
         """Add a discovered clue."""
@@ -127,6 +148,8 @@ class GameState:
         suspect_name: str,
         source: str,
         is_verified: bool = False,
+        location: Optional[str] = None,
+        time_range: Optional[str] = None,
     ) -> bool:
         """Add a discovered event to the investigation timeline.
         
@@ -137,60 +160,146 @@ class GameState:
             suspect_name: Who this event is about
             source: Where this info came from (e.g., "Interview with Marcus", "Found at Library")
             is_verified: Whether this is corroborated by another source
+            location: Optional location the event places the suspect in
+            time_range: Optional full time range (e.g., "8:00 PM - 9:30 PM") when
+                time_slot only shows its start
             
         Returns:
-            True if a new contradiction was detected
+            True if the event is an explicit contradiction. Alibi claims and witness
+            sightings are checked against earlier statements in the background;
+            those results are delivered via pop_contradiction_notifications().
         """
-        # Check for contradictions using AI
+        event = {
+            "time_slot": time_slot,
+            "event_type": event_type,
+            "description": description,
+            "suspect_name": suspect_name,
+            "source": source,
+            "is_verified": is_verified,
+            "location": location,
+            "time_range": time_range,
+        }
+
         # Explicit contradiction types are always marked
         is_contradiction = event_type == "contradiction"
-        contradiction_detected = is_contradiction
+        event["is_contradiction"] = is_contradiction
         
         # For alibi claims and witness sightings, use LLM to check for contradictions
         # Only compare statements about the SAME suspect
+        candidates: List[Dict] = []
         if event_type in ["alibi_claim", "witness_sighting"] and suspect_name:
-            from game.contradiction_detector import check_contradiction_sync
+            from game.contradiction_detector import prefilter_contradiction_candidates
             
-            for existing in self.discovered_timeline:
-                # Only compare with statements about the same suspect
-                if (existing.get("suspect_name") == suspect_name and 
-                    existing.get("event_type") in ["alibi_claim", "witness_sighting"]):
-                    
-                    existing_desc = existing.get("description", "")
-                    
-                    # Skip if descriptions are too similar (same statement)
-                    if existing_desc.lower().strip() == description.lower().strip():
-                        continue
-                    
-                    # Use LLM to check if they contradict
-                    try:
-                        result = check_contradiction_sync(
-                            existing_desc, description, suspect_name
-                        )
-                        if result.is_contradiction and result.confidence > 0.7:
-                            is_contradiction = True
-                            contradiction_detected = True
-                            existing["is_contradiction"] = True
-                            existing["contradiction_explanation"] = result.explanation
-                            break  # One contradiction is enough
-                    except Exception as e:
-                        # On error, don't mark as contradiction
-                        import logging
-                        logging.getLogger(__name__).warning(
-                            "[TIMELINE] Contradiction check failed: %s", e
-                        )
-        
-        self.discovered_timeline.append({
-            "time_slot": time_slot,
-            "event_type": event_type,
-            "description": description,
-            "suspect_name": suspect_name,
-            "source": source,
-            "is_verified": is_verified,
-            "is_contradiction": is_contradiction,
-        })
+            # Only compare with statements about the same suspect
+            candidates = [
+                existing for existing in self.discovered_timeline
+                if existing.get("suspect_name") == suspect_name
+                and existing.get("event_type") in ["alibi_claim", "witness_sighting"]
+                # Skip if descriptions are too similar (same statement)
+                and existing.get("description", "").lower().strip() != description.lower().strip()
+            ]
+            # Drop pairs about disjoint times
+            candidates = prefilter_contradiction_candidates(event, candidates)
+            if candidates:
+                event["contradiction_check"] = "pending"
         
-        return contradiction_detected
+        with self._timeline_lock:
+            self.discovered_timeline.append(event)
+            generation = self._timeline_generation
+        
+        if candidates:
+            self._start_contradiction_check(event, candidates, generation)
+        
+        return is_contradiction
+    
+    # -------------------------------------------------------------------------
+    # Background contradiction checks
+    # -------------------------------------------------------------------------
+    
+    def _start_contradiction_check(self, event: Dict, candidates: List[Dict], generation: int):
+        """Check a new timeline event against earlier ones without blocking the turn."""
+        from game.contradiction_detector import submit_contradictions_batch
+        
+        try:
+            future = submit_contradictions_batch(
+                event["description"],
+                [existing.get("description", "") for existing in candidates],
+                event["suspect_name"],
+            )
+        except Exception as e:
+            logger.warning("[TIMELINE] Could not start contradiction check: %s", e)
+            event["contradiction_check"] = "failed"
+            return
+        
+        with self._timeline_lock:
+            self._contradiction_checks.append(future)
+        future.add_done_callback(
+            lambda f: self._apply_contradiction_results(event, candidates, generation, f)
+        )
+    
+    def _apply_contradiction_results(
+        self,
+        event: Dict,
+        candidates: List[Dict],
+        generation: int,
+        future: concurrent.futures.Future,
+    ):
+        notification = None
+        with self._timeline_lock:
+            if future in self._contradiction_checks:
+                self._contradiction_checks.remove(future)
+            if generation != self._timeline_generation:
+                return  # Game was reset while the check was running
+            try:
+                results = future.result()
+            except Exception as e:
+                # On error, don't mark as contradiction
+                logger.warning("[TIMELINE] Contradiction check failed: %s", e)
+                event["contradiction_check"] = "failed"
+                return
+            
+            event["contradiction_check"] = "done"
+            for existing, result in zip(candidates, results):
+                if result.is_contradiction and result.confidence > 0.7:
+                    event["is_contradiction"] = True
+                    existing["is_contradiction"] = True
+                    existing["contradiction_explanation"] = result.explanation
+                    notification = {
+                        "suspect_name": event["suspect_name"],
+                        "time_slot": event["time_slot"],
+                        "description": event["description"],
+                        "contradicts": existing.get("description", ""),
+                        "explanation": result.explanation,
+                        "confidence": result.confidence,
+                    }
+                    self._contradiction_notifications.append(notification)
+                    break  # One contradiction is enough
+        
+        if notification is not None:
+            logger.info(
+                "[TIMELINE] Contradiction detected for %s: %s",
+                notification["suspect_name"], notification["explanation"]
+            )
+    
+    def pop_contradiction_notifications(self) -> List[Dict]:
+        """Return (and clear) contradictions found since the last poll."""
+        with self._timeline_lock:
+            notifications = list(self._contradiction_notifications)
+            self._contradiction_notifications.clear()
+        return notifications
+    
+    @property
+    def pending_contradiction_checks(self) -> int:
+        """Number of background contradiction checks still running."""
+        with self._timeline_lock:
+            return len(self._contradiction_checks)
+    
+    def wait_for_contradiction_checks(self, timeout: Optional[float] = None) -> bool:
+        """Block until in-flight contradiction checks finish. Returns False on timeout."""
+        with self._timeline_lock:
+            pending = list(self._contradiction_checks)
+        _, not_done = concurrent.futures.wait(pending, timeout=timeout)
+        return not not_done
     
     def get_timeline_for_suspect(self, suspect_name: str) -> List[Dict]:
         """Get all timeline events related to a specific suspect."""
@@ -632,92 +741,60 @@ class GameState:
         - Suspect public info (role, personality, alibi)
         - Suspect secrets are passed to the interrogate tool, NOT shown here
         """
-        # If we have a mystery, include suspect profiles so they're always accessible
-        if self.mystery:
-            # Build enhanced suspect profiles with conversation history and emotional state
-            # NOTE: We do NOT include secrets or clue_they_know in the visible prompt
-            # Those are passed directly to the interrogate_suspect tool to guide roleplay
-            suspect_profiles_list = []
-            for s in self.mystery.suspects:
-                # Get emotional state and history from Game Master's memory
-                suspect_state = self.get_suspect_state(s.name)
-                conversation_history = self.format_conversation_history(s.name)
-                emotional_instructions = self.get_emotional_instructions(s.name)
-                
-                # Only include guilt flag for tool usage (not displayed to player)
-                # Alibi is only revealed after interrogation
-                alibi_display = f'"{s.alibi}"' if s.name in self.suspects_talked_to else "(Not yet revealed - interrogate this suspect to learn their alibi)"
-                profile = f"""
-### {s.name}
-Role: {s.role}
-Personality: {s.personality}
-Alibi: {alibi_display}
-Voice ID: {s.voice_id or 'None'}
+        static_prompt, turn_context = self.get_prompt_parts()
+        return f"{static_prompt}\n\n{turn_context}" if turn_context else static_prompt
 
-EMOTIONAL STATE (pass to tool):
-- Trust: {suspect_state.trust}%
-- Nervousness: {suspect_state.nervousness}%
-- Contradictions caught: {suspect_state.contradictions_caught}
+    def get_prompt_parts(self) -> Tuple[str, str]:
+        """Split the continue prompt into (static prefix, per-turn context).
 
-CONVERSATION HISTORY (pass to tool):
-{conversation_history}
-{f'''
-BEHAVIORAL INSTRUCTIONS (pass to tool):
-{emotional_instructions}''' if emotional_instructions else ''}"""
-                suspect_profiles_list.append(profile)
-            
-            suspect_profiles = "\n".join(suspect_profiles_list)
+        The static prefix only depends on the case and stays byte-identical
+        for the whole game, so the provider can cache it; everything that
+        changes between turns (progress, discovered evidence, alibis, suspect
+        emotions and history) is in the per-turn context, which process_message
+        sends after the conversation history.
+        """
+        if not self.mystery:
+            # Fallback if no mystery (shouldn't happen in normal flow)
+            return """You are the Game Master for an ongoing murder mystery game.
 
-            suspect_list = "\n".join(
-                [f"- {s.name} ({s.role})" for s in self.mystery.suspects]
-            )
-            
-            # CRITICAL: Split clues into discovered vs undiscovered
-            # - Discovered: show full details (player earned this info)
-            # - Locations: ONLY show locations the player has UNLOCKED via suspects
-            discovered_clues: List[str] = []
-            for c in self.mystery.clues:
-                if c.id in self.clue_ids_found:
-                    discovered_clues.append(
-                        f'- ✓ "{c.id}": {c.description} [Found at: {c.location}]'
-                    )
-
-            # Locations shown to the GM are ONLY those the player has unlocked
-            # via suspect interrogation (state.unlocked_locations).
-            unlocked_locations_list: List[str] = []
-            for loc in self.unlocked_locations:
-                unlocked_locations_list.append(f'- "{loc}" (searchable)')
-            
-            clue_section = ""
-            if discovered_clues:
-                clue_section += (
-                    "## DISCOVERED EVIDENCE\n"
-                    + "\n".join(discovered_clues)
-                    + "\n\n"
-                )
-            if unlocked_locations_list:
-                clue_section += (
-                    "## UNLOCKED LOCATIONS (clue details hidden until searched)\n"
-                    + "\n".join(unlocked_locations_list)
-                )
+The game is in progress. Story details are in your conversation memory.
+
+## YOUR ROLE
+1. TALK to suspect → Use "Interrogate Suspect" tool with full profile
+2. SEARCH location → Describe findings based on clues in memory
+3. ACCUSATION → Check against the murderer from memory
+
+## GAME RULES  
+- 3 wrong accusations = lose
+- Win = name murderer + provide evidence
+- Never reveal murderer until correct accusation
 
-            tone_block = ""
-            if self.tone_instruction:
-                tone_block = f"""
+Continue the investigation based on the player's message.""", ""
+
+        return self._static_prompt(), self._turn_context()
+
+    def _static_prompt(self) -> str:
+        """Case content and GM instructions that never change during a game."""
+        suspect_list = "\n".join(
+            [f"- {s.name} ({s.role})" for s in self.mystery.suspects]
+        )
+        suspect_profiles = "\n".join(
+            f"""
+### {s.name}
+Role: {s.role}
+Personality: {s.personality}"""
+            for s in self.mystery.suspects
+        )
+
+        tone_block = ""
+        if self.tone_instruction:
+            tone_block = f"""
 
 ## TONE
 {self.tone_instruction}
-"""
-            
-            # Build progress summary
-            progress_summary = f"""
-## INVESTIGATION PROGRESS
-- Clues found: {len(self.clue_ids_found)}/{len(self.mystery.clues)}
-- Suspects interviewed: {len(self.suspects_talked_to)}/{len(self.mystery.suspects)}
-- Wrong accusations: {self.wrong_accusations}/3
 """
 
-            return f"""You are the Game Master for an ongoing murder mystery game.
+        return f"""You are the Game Master for an ongoing murder mystery game.
 
 ## THE CASE
 {self.mystery.setting}
@@ -728,13 +805,12 @@ BEHAVIORAL INSTRUCTIONS (pass to tool):
 ## SUSPECTS (public info only)
 {suspect_list}
 
-{clue_section}
-
-{progress_summary}
-
 ## SUSPECT PROFILES (for interrogate_suspect tool)
 {suspect_profiles}
 
+(Alibis, emotional state and conversation history for each suspect are in
+the CURRENT INVESTIGATION STATE message, which is updated every turn.)
+
 ## YOUR ROLE AS GAME MASTER
 
 CRITICAL RULE: You can ONLY reveal information the player has EARNED through investigation!
@@ -792,23 +868,80 @@ Example redirects:
 - Be concise - 2-4 paragraphs max
 - ASK for clarification rather than guessing wrong
 - Build suspense, don't spoil the mystery!
-- If unsure what the player wants, offer 2-3 specific options
+- If unsure what the player wants, offer 2-3 specific options"""
+
+    def _turn_context(self) -> str:
+        """Investigation state that changes from turn to turn."""
+        # Build suspect status with conversation history and emotional state
+        # NOTE: We do NOT include secrets or clue_they_know in the visible prompt
+        # Those are passed directly to the interrogate_suspect tool to guide roleplay
+        suspect_status_list = []
+        for s in self.mystery.suspects:
+            # Get emotional state and history from Game Master's memory
+            suspect_state = self.get_suspect_state(s.name)
+            conversation_history = self.format_conversation_history(s.name)
+            emotional_instructions = self.get_emotional_instructions(s.name)
+
+            # Alibi is only revealed after interrogation
+            alibi_display = f'"{s.alibi}"' if s.name in self.suspects_talked_to else "(Not yet revealed - interrogate this suspect to learn their alibi)"
+            status = f"""
+### {s.name}
+Alibi: {alibi_display}
+Voice ID: {s.voice_id or 'None'}
 
-Continue the investigation based on the player's message."""
-        else:
-            # Fallback if no mystery (shouldn't happen in normal flow)
-            return """You are the Game Master for an ongoing murder mystery game.
+EMOTIONAL STATE (pass to tool):
+- Trust: {suspect_state.trust}%
+- Nervousness: {suspect_state.nervousness}%
+- Contradictions caught: {suspect_state.contradictions_caught}
 
-The game is in progress. Story details are in your conversation memory.
+CONVERSATION HISTORY (pass to tool):
+{conversation_history}
+{f'''
+BEHAVIORAL INSTRUCTIONS (pass to tool):
+{emotional_instructions}''' if emotional_instructions else ''}"""
+            suspect_status_list.append(status)
+
+        suspect_status = "\n".join(suspect_status_list)
+
+        # CRITICAL: Split clues into discovered vs undiscovered
+        # - Discovered: show full details (player earned this info)
+        # - Locations: ONLY show locations the player has UNLOCKED via suspects
+        discovered_clues: List[str] = []
+        for c in self.mystery.clues:
+            if c.id in self.clue_ids_found:
+                discovered_clues.append(
+                    f'- ✓ "{c.id}": {c.description} [Found at: {c.location}]'
+                )
 
-## YOUR ROLE
-1. TALK to suspect → Use "Interrogate Suspect" tool with full profile
-2. SEARCH location → Describe findings based on clues in memory
-3. ACCUSATION → Check against the murderer from memory
+        # Locations shown to the GM are ONLY those the player has unlocked
+        # via suspect interrogation (state.unlocked_locations).
+        unlocked_locations_list: List[str] = []
+        for loc in self.unlocked_locations:
+            unlocked_locations_list.append(f'- "{loc}" (searchable)')
+
+        clue_section = ""
+        if discovered_clues:
+            clue_section += (
+                "## DISCOVERED EVIDENCE\n"
+                + "\n".join(discovered_clues)
+                + "\n\n"
+            )
+        if unlocked_locations_list:
+            clue_section += (
+                "## UNLOCKED LOCATIONS (clue details hidden until searched)\n"
+                + "\n".join(unlocked_locations_list)
+            )
 
-## GAME RULES  
-- 3 wrong accusations = lose
-- Win = name murderer + provide evidence
-- Never reveal murderer until correct accusation
+        return f"""# CURRENT INVESTIGATION STATE
+
+{clue_section}
+
+## INVESTIGATION PROGRESS
+- Clues found: {len(self.clue_ids_found)}/{len(self.mystery.clues)}
+- Suspects interviewed: {len(self.suspects_talked_to)}/{len(self.mystery.suspects)}
+- Wrong accusations: {self.wrong_accusations}/3
+
+## SUSPECT STATUS (for interrogate_suspect tool)
+{suspect_status}
 
 Continue the investigation based on the player's message."""
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 
 from game.state import GameState
 
@@ -98,7 +100,7 @@ _tool_outputs: Dict[str, ToolOutputStore] = {}
 
 def get_tool_output_store(session_id: Optional[str] = None) -> ToolOutputStore:
     """Get the tool output store for a session."""
-    sid = session_id or _current_session_id or "_default"
+    sid = session_id or get_current_session_id() or "_default"
     if sid not in _tool_outputs:
         _tool_outputs[sid] = ToolOutputStore()
     return _tool_outputs[sid]
@@ -167,29 +169,69 @@ def _get_scene_mood_for_state(state: GameState) -> str:
     return "mysterious"
 
 
-# Thread-local storage for current session context
-_current_session_id: Optional[str] = None
+# Session being served by the current turn. A ContextVar rather than a global,
+# so concurrent turns (and the tool threads they spawn with a copied context)
+# each see their own session.
+_current_session_id: ContextVar[Optional[str]] = ContextVar(
+    "current_session_id", default=None
+)
 
 
 def set_current_session(session_id: str):
-    """Set the current session ID for tool context."""
-    global _current_session_id
-    _current_session_id = session_id
+    """Set the current session ID for tool context (in the caller's context)."""
+    _current_session_id.set(session_id)
+
+
+@contextmanager
+def session_context(session_id: Optional[str]) -> Iterator[None]:
+    """Serve `session_id` for the duration of the block, then restore the previous one."""
+    token = _current_session_id.set(session_id)
+    try:
+        yield
+    finally:
+        _current_session_id.reset(token)
+
+
+def run_in_session(session_id: Optional[str], fn, *args, **kwargs):
+    """Call fn while serving `session_id` (e.g. as a threading.Thread target,
+    since new threads start without the caller's context)."""
+    with session_context(session_id):
+        return fn(*args, **kwargs)
+
+
+def get_current_session_id() -> Optional[str]:
+    """Get the session ID tools are currently serving, if any.
+
+    Falls back to the "session_id" in the LangGraph config of the running
+    graph (process_message puts it there), for code running on threads that
+    did not inherit the caller's context.
+    """
+    session_id = _current_session_id.get()
+    if session_id:
+        return session_id
+    try:
+        from langgraph.config import get_config
+
+        return get_config().get("configurable", {}).get("session_id")
+    except Exception:
+        return None  # Not inside a graph run
 
 
 def get_game_state() -> Optional[GameState]:
     """Get the current game state for tool access.
     
-    Returns the state for the current session, or the most recent state if none set.
+    Returns the state for the current session. Only when no session is being
+    served at all (scripts, single-player debugging) does it fall back to the
+    most recent state - never to another player's game during a turn.
     Tools use this to securely access game data without exposing it in prompts.
     """
-    # First try the explicitly set current session
-    if _current_session_id and _current_session_id in game_states:
-        return game_states[_current_session_id]
+    session_id = get_current_session_id()
+    if session_id:
+        return game_states.get(session_id)
     
-    # Fall back to most recent state (usually just one active game)
+    # No session context - fall back to most recent state (usually just one active game)
     if game_states:
-        # Return the most recently accessed state
+        logger.debug("[GAME] get_game_state() called without a session; using latest state")
         return list(game_states.values())[-1]
     
     return None
@@ -24,6 +24,7 @@ The structured approach replaces these regex markers:
 - [AUDIO:path] -> (handled separately in TTS)
 """
 
+import importlib.util
 import os
 import json
 import logging
@@ -245,18 +246,13 @@ def get_structured_llm(model: str = None):
         llm = get_structured_llm()
         response: GameMasterResponse = llm.invoke(messages)
     """
-    try:
-        from langchain_openai import ChatOpenAI
-    except ImportError:
+    if importlib.util.find_spec("langchain_openai") is None:
         raise ImportError("langchain-openai required. Run: pip install langchain-openai")
+    from services.llm_clients import get_chat_model
     
     model_name = model or os.getenv("GAME_MASTER_MODEL", "gpt-4o-mini")
     
-    llm = ChatOpenAI(
-        model=model_name,
-        max_tokens=800,
-        api_key=os.getenv("OPENAI_API_KEY")
-    )
+    llm = get_chat_model(model_name, max_tokens=800)
     
     return llm.with_structured_output(GameMasterResponse)
 
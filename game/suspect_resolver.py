@@ -0,0 +1,290 @@
+"""Map free-form player messages to the suspect they address.
+
+Custom messages used to run a few substring checks and then ask gpt-4o-mini
+which suspect was meant, costing a network round trip on most turns.
+The local resolver scores the message against an alias index built once per
+cast (full names, name pairs, unique first names/surnames, roles) plus
+second-person cues bound to the last suspect who spoke. Tokens are
+matched fuzzily so speech-to-text typos ("Ada Sintax") still resolve.
+
+Only when the best local match is below SUSPECT_RESOLVER_MIN_CONFIDENCE is
+the LLM asked; if that fails too, the message is treated as a follow-up to
+the last speaker, as before.
+
+Usage:
+    from game.suspect_resolver import resolve_suspect_mention
+
+    match = resolve_suspect_mention(message, state.mystery.suspects, last_speaker)
+    if match:
+        print(match.name, match.confidence, match.reason, match.is_follow_up)
+"""
+
+import logging
+import os
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from services.perf_tracker import perf
+
+logger = logging.getLogger(__name__)
+
+# Local matches at or above this score skip the LLM resolver
+SUSPECT_RESOLVER_MIN_CONFIDENCE = float(os.getenv("SUSPECT_RESOLVER_MIN_CONFIDENCE", "0.7"))
+# Similarity needed for a misspelled word to count as a name part
+SUSPECT_RESOLVER_FUZZY_RATIO = float(os.getenv("SUSPECT_RESOLVER_FUZZY_RATIO", "0.8"))
+
+# Alias scores, strongest first
+_FULL_NAME = 1.0
+_NAME_PAIR = 0.95
+_ADDRESSED = 0.9  # "you"/follow-up phrasing, bound to the last speaker
+_NAME_PART = 0.85
+_ROLE = 0.8
+_ROLE_NOUN = 0.65  # Single role words ("partner") are often generic; let the LLM confirm
+_AMBIGUOUS = 0.5  # Name part or role noun shared by several suspects
+_LAST_SPEAKER = 0.4  # No cue at all; the conversation just continues
+
+# Honorifics and particles are never aliases on their own
+_NAME_STOPWORDS = {
+    "mr", "mrs", "ms", "miss", "dr", "doctor", "sir", "lady", "lord", "madam",
+    "father", "mother", "sister", "brother", "professor", "prof", "captain",
+    "detective", "the", "of", "and", "von", "van", "de", "del", "la", "le",
+}
+# Role descriptions drop only articles and particles: "the doctor" or "the
+# captain" is exactly how a player refers to a suspect by role
+_ROLE_STOPWORDS = {
+    "a", "an", "the", "of", "and", "to", "for", "at", "in", "on", "von", "van",
+    "de", "del", "la", "le",
+}
+_SECOND_PERSON = {"you", "you're", "youre", "your", "yours", "yourself"}
+_FOLLOW_UP_PHRASES = (
+    "tell me more", "what about", "why did you", "what do you", "how did you",
+    "where were you", "go on", "continue", "and then", "really", "are you sure",
+    "explain", "what else",
+)
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+
+@dataclass
+class SuspectMatch:
+    """The suspect a message is aimed at, and how sure we are."""
+
+    name: str
+    confidence: float
+    reason: str
+    is_follow_up: bool = False
+
+
+def _tokenize(text: str) -> List[str]:
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if token.endswith("'s"):
+            token = token[:-2]
+        token = token.strip("'")
+        if token:
+            tokens.append(token)
+    return tokens
+
+
+@lru_cache(maxsize=64)
+def _build_alias_index(cast: Tuple[Tuple[str, str], ...]) -> Dict[str, List[Tuple[str, float, str]]]:
+    """alias -> [(suspect name, score, kind)] for one cast of (name, role) pairs."""
+    candidates: Dict[str, List[Tuple[str, float, str]]] = {}
+
+    def add(alias: str, name: str, score: float, kind: str):
+        entries = candidates.setdefault(alias, [])
+        if all(n != name for n, _, _ in entries):
+            entries.append((name, score, kind))
+
+    for name, role in cast:
+        parts = _tokenize(name)
+        add(" ".join(parts), name, _FULL_NAME, "full name")
+        for i in range(len(parts) - 1):
+            add(f"{parts[i]} {parts[i + 1]}", name, _NAME_PAIR, "name pair")
+        for part in parts:
+            if len(part) >= 3 and part not in _NAME_STOPWORDS:
+                add(part, name, _NAME_PART, "name part")
+        role_words = [w for w in _tokenize(role or "") if w not in _ROLE_STOPWORDS]
+        if role_words:
+            add(" ".join(role_words), name, _ROLE, "role")
+            if len(role_words[-1]) >= 3:
+                add(role_words[-1], name, _ROLE_NOUN, "role")
+
+    # An alias that points at several suspects can't decide on its own
+    index: Dict[str, List[Tuple[str, float, str]]] = {}
+    for alias, entries in candidates.items():
+        if len(entries) == 1:
+            index[alias] = entries
+        else:
+            index[alias] = [(n, min(score, _AMBIGUOUS), kind) for n, score, kind in entries]
+    return index
+
+
+def _cast_key(suspects: Sequence) -> Tuple[Tuple[str, str], ...]:
+    return tuple((s.name, getattr(s, "role", "") or "") for s in suspects)
+
+
+def resolve_suspect(
+    message: str, suspects: Sequence, last_speaker: Optional[str] = None
+) -> Optional[SuspectMatch]:
+    """Best local guess at the suspect a message addresses (no network calls).
+
+    A full name always wins. Second-person wording or a follow-up phrase
+    binds to the last speaker when no other suspect is mentioned. If another
+    suspect's name part or role also matched, the message could address them
+    ("Ada, where were you?") or refer to them ("Did you see Ada?"), so every
+    score is capped below the confidence threshold and the LLM decides.
+    """
+    if not message or not suspects:
+        return None
+
+    index = _build_alias_index(_cast_key(suspects))
+    tokens = _tokenize(message)
+    scores: Dict[str, Tuple[float, str]] = {}
+
+    def offer(name: str, score: float, reason: str):
+        if score > scores.get(name, (0.0, ""))[0]:
+            scores[name] = (score, reason)
+
+    matched_tokens = set()
+    longest = max(len(alias.split()) for alias in index)
+    for n in range(longest, 0, -1):
+        for i in range(len(tokens) - n + 1):
+            alias = " ".join(tokens[i:i + n])
+            for name, score, kind in index.get(alias, ()):
+                offer(name, score, f"{kind} '{alias}'")
+                matched_tokens.update(range(i, i + n))
+
+    # Misspelled single words (speech-to-text, typos) against name parts and roles
+    single_aliases = [a for a in index if " " not in a and len(a) >= 4]
+    for i, token in enumerate(tokens):
+        if i in matched_tokens or len(token) < 4:
+            continue
+        for alias in single_aliases:
+            ratio = SequenceMatcher(None, token, alias).ratio()
+            if ratio >= SUSPECT_RESOLVER_FUZZY_RATIO:
+                for name, score, kind in index[alias]:
+                    offer(name, score * ratio, f"fuzzy {kind} '{token}'~'{alias}'")
+
+    cue = None
+    if last_speaker:
+        if _SECOND_PERSON.intersection(tokens):
+            cue = "second person"
+        elif any(phrase in message.lower() for phrase in _FOLLOW_UP_PHRASES):
+            cue = "follow-up phrase"
+    if cue:
+        others = {score for name, (score, _) in scores.items() if name != last_speaker}
+        if not others:
+            offer(last_speaker, _ADDRESSED, cue)
+        elif max(others) < _FULL_NAME:
+            # Partial (or fuzzy) mention of someone else: addressee or reference?
+            for name, (score, reason) in list(scores.items()):
+                scores[name] = (min(score, _AMBIGUOUS), reason)
+            offer(last_speaker, _AMBIGUOUS, cue)
+
+    if not scores:
+        return None
+    name, (score, reason) = max(scores.items(), key=lambda item: item[1][0])
+    is_follow_up = reason in ("second person", "follow-up phrase")
+    return SuspectMatch(name, round(score, 3), reason, is_follow_up)
+
+
+def _resolve_with_llm(message: str, suspects: Sequence) -> Optional[str]:
+    """Ask a small LLM which suspect is meant; None if it can't tell."""
+    model = os.getenv("SUSPECT_RESOLVER_MODEL", "gpt-4o-mini")
+    perf.start("suspect_resolver", details=model)
+    try:
+        from services.llm_clients import get_chat_model
+        from langchain_core.prompts import ChatPromptTemplate
+
+        suspects_summary = "\n".join(f"- {s.name} ({s.role})" for s in suspects)
+        prompt = ChatPromptTemplate.from_messages(
+            [
+                (
+                    "system",
+                    (
+                        "You map a player's message to ONE suspect from a list.\n"
+                        "You MUST answer with exactly one suspect name from the list, "
+                        "or the word NONE if no suspect clearly matches.\n"
+                        "Do not add any explanation."
+                    ),
+                ),
+                (
+                    "human",
+                    (
+                        "Suspects:\n"
+                        "{suspect_list}\n\n"
+                        "Player message:\n"
+                        "{player_message}\n\n"
+                        "Answer with exactly one suspect name from the list above, "
+                        "or NONE if you are not sure."
+                    ),
+                ),
+            ]
+        )
+        chain = prompt | get_chat_model(model, temperature=0)
+        result = chain.invoke({"suspect_list": suspects_summary, "player_message": message})
+        perf.end("suspect_resolver", details="resolved")
+    except Exception:
+        perf.end("suspect_resolver", status="error", details="exception")
+        logger.exception("Error resolving suspect name via AI; falling back to heuristics only")
+        return None
+
+    choice = (result.content or "").strip()
+    first_line = choice.splitlines()[0].strip() if choice else ""
+    first_line = first_line.lstrip("-• ").strip().strip('"').strip("'")
+    if not first_line or first_line.upper() == "NONE":
+        logger.info("AI suspect resolver chose NONE for message: %s", message)
+        return None
+    for s in suspects:
+        if s.name.lower() == first_line.lower():
+            logger.info("AI-resolved suspect mention: %s (from '%s')", s.name, message)
+            return s.name
+    logger.info(
+        "AI suspect resolver returned '%s', which did not match any known suspect", first_line
+    )
+    return None
+
+
+def resolve_suspect_mention(
+    message: str, suspects: Sequence, last_speaker: Optional[str] = None
+) -> Optional[SuspectMatch]:
+    """Resolve locally, ask the LLM only below the confidence threshold.
+
+    If neither finds anyone, the message is taken as a follow-up to the last
+    suspect who spoke (unless it names a different suspect in full).
+    """
+    if not message or not suspects:
+        return None
+
+    match = resolve_suspect(message, suspects, last_speaker)
+    if match and match.confidence >= SUSPECT_RESOLVER_MIN_CONFIDENCE:
+        logger.info(
+            "[GAME] Suspect resolved locally: %s (%.2f, %s)",
+            match.name, match.confidence, match.reason
+        )
+        return match
+
+    logger.info(
+        "[GAME] Local suspect match below %.2f (%s) - asking %s",
+        SUSPECT_RESOLVER_MIN_CONFIDENCE,
+        f"{match.name} {match.confidence:.2f}" if match else "none",
+        os.getenv("SUSPECT_RESOLVER_MODEL", "gpt-4o-mini"),
+    )
+    name = _resolve_with_llm(message, suspects)
+    if name:
+        return SuspectMatch(name, SUSPECT_RESOLVER_MIN_CONFIDENCE, "llm")
+
+    if last_speaker and any(s.name == last_speaker for s in suspects):
+        message_lower = message.lower()
+        if not any(
+            s.name != last_speaker and s.name.lower() in message_lower for s in suspects
+        ):
+            logger.info(
+                "🔄 [FOLLOW-UP] Detected follow-up question to last suspect speaker: %s",
+                last_speaker,
+            )
+            return SuspectMatch(last_speaker, _LAST_SPEAKER, "last speaker", is_follow_up=True)
+    return None
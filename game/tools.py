@@ -8,7 +8,7 @@ import tempfile
 from typing import Annotated, Optional, List
 from pydantic import BaseModel, Field
 from langchain_core.tools import tool
-from langchain_openai import ChatOpenAI
+from services.llm_clients import get_chat_model
 from langchain_core.prompts import ChatPromptTemplate
 from services.tts_service import text_to_speech
 from services.game_memory import get_game_memory
@@ -344,17 +344,20 @@ def interrogate_suspect(
     relevant_statements = ""
     
     if memory.is_available:
-        # Get ALL past conversations with this suspect (chronological)
-        history = memory.get_suspect_history(suspect.name)
+        # Get the most recent past conversations with this suspect (chronological)
+        history = memory.get_recent_exchanges(suspect.name, n=5)  # Last 5 exchanges max
         if history:
             past_convos = []
-            for conv in history[-5:]:  # Last 5 exchanges max
+            for conv in history:
                 q = conv.get("question", "")[:100]
                 a = conv.get("answer", "")[:150]
                 turn = conv.get("turn", "?")
                 past_convos.append(f"Turn {turn}: Player asked: \"{q}\" → You said: \"{a}\"")
             past_conversations = "\n".join(past_convos)
-            logger.info("[RAG] Found %d past conversations with %s", len(history), suspect.name)
+            logger.info(
+                "[RAG] Found %d past conversations with %s",
+                memory.count_exchanges(suspect.name), suspect.name
+            )
         
         # Search for statements RELATED to current question (semantic search)
         related = memory.search_by_suspect(suspect.name, player_question, k=3)
@@ -480,8 +483,8 @@ You may have said something about this before - stay consistent:
         # Build conversation history from memory
         conversation_history = []
         if memory.is_available:
-            history = memory.get_suspect_history(suspect.name)
-            for conv in history[-5:]:
+            history = memory.get_recent_exchanges(suspect.name, n=5)
+            for conv in history:
                 conversation_history.append({
                     "question": conv.get("question", ""),
                     "answer": conv.get("answer", ""),
@@ -499,23 +502,8 @@ You may have said something about this before - stay consistent:
         
         # Oracle generates response internally using full truth
         # Returns ONLY the response text + game state deltas
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        oracle.generate_suspect_response(request)
-                    )
-                    oracle_result = future.result()
-            else:
-                oracle_result = loop.run_until_complete(
-                    oracle.generate_suspect_response(request)
-                )
-        except RuntimeError:
-            oracle_result = asyncio.run(oracle.generate_suspect_response(request))
+        from services.llm_clients import run_async
+        oracle_result = run_async(oracle.generate_suspect_response(request))
         
         text_response = oracle_result.response_text
         
@@ -549,9 +537,7 @@ You may have said something about this before - stay consistent:
     
     # Placeholder to maintain code structure
     if False:  # Never executed - keeping for reference only
-        llm = ChatOpenAI(
-            model="gpt-4o", temperature=0.8, api_key=os.getenv("OPENAI_API_KEY")
-        )
+        llm = get_chat_model("gpt-4o", temperature=0.8)
 
         # Legacy code removed for security - see comment above
         pass
@@ -638,6 +624,8 @@ You may have said something about this before - stay consistent:
                 suspect_name=suspect.name,
                 source=f"Interview with {suspect.name}",
                 is_verified=False,  # Not verified until corroborated
+                location=alibi.location_claimed,
+                time_range=alibi.time_claimed,
             )
             logger.info("📅 [TIMELINE] Added alibi claim for %s: %s", suspect.name, alibi.location_claimed)
         
@@ -794,11 +782,7 @@ def describe_scene_for_image(
     suggested_camera = camera_guidance.get(clue_type, camera_guidance["object"])
 
     # Use LangChain's structured output - no regex needed!
-    llm = ChatOpenAI(
-        model="gpt-4o-mini",
-        temperature=0.7,
-        api_key=os.getenv("OPENAI_API_KEY"),
-    )
+    llm = get_chat_model("gpt-4o-mini", temperature=0.7)
     
     # with_structured_output ensures we get a Pydantic model back
     structured_llm = llm.with_structured_output(SceneToolOutput)
@@ -1025,10 +1009,11 @@ def search_past_statements(
         return "No past conversations indexed yet. This is the first interrogation."
     
     try:
+        # Hybrid: player queries often hinge on names, places and times
         if suspect_name:
-            results = memory.search_by_suspect(suspect_name, query, k=5)
+            results = memory.search_by_suspect(suspect_name, query, k=5, mode="hybrid")
         else:
-            results = memory.search(query, k=5, filter_type="conversation")
+            results = memory.search(query, k=5, filter_type="conversation", mode="hybrid")
         
         if not results:
             if suspect_name:
@@ -1084,11 +1069,7 @@ def find_contradictions(
             return f"No previous statements from {suspect_name} found to compare against."
         
         # Use LLM to analyze for contradictions
-        llm = ChatOpenAI(
-            model="gpt-4o-mini",
-            temperature=0,
-            api_key=os.getenv("OPENAI_API_KEY")
-        )
+        llm = get_chat_model("gpt-4o-mini", temperature=0)
         
         prompt = ChatPromptTemplate.from_messages([
             (
@@ -1204,14 +1185,8 @@ def get_investigation_hint(
     hints = []
     
     # Check what's been covered
-    total_docs = len(memory.documents) if memory.is_available else 0
-    conversations = [d for d in memory.documents if d.get("metadata", {}).get("type") == "conversation"] if memory.is_available else []
-    
-    suspects_talked = set()
-    for doc in conversations:
-        suspect = doc.get("metadata", {}).get("suspect")
-        if suspect:
-            suspects_talked.add(suspect)
+    total_docs = memory.count_documents() if memory.is_available else 0
+    suspects_talked = set(memory.interviewed_suspects()) if memory.is_available else set()
     
     # Generate contextual hints
     if total_docs == 0:
@@ -1390,11 +1365,7 @@ def make_accusation(
         logger.error("[ORACLE] Not initialized - cannot validate accusation")
     
     # Use LangChain's structured output
-    llm = ChatOpenAI(
-        model="gpt-4o-mini", 
-        temperature=0.8, 
-        api_key=os.getenv("OPENAI_API_KEY")
-    )
+    llm = get_chat_model("gpt-4o-mini", temperature=0.8)
     
     structured_llm = llm.with_structured_output(AccusationToolOutput)
     
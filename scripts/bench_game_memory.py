@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Benchmark the GameMemory RAG stack offline.
+
+Uses the deterministic local hashing embeddings, so it needs FAISS but no
+network access or API keys, and produces the same index on every run.
+
+Usage:
+    python scripts/bench_game_memory.py --sessions 8 --turns 200
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import services
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("GAME_MEMORY_EMBEDDINGS", "hashing")
+
+from services.game_memory import get_game_memory, get_memory_registry, get_embedding_cache  # noqa: E402
+
+SUSPECTS = ["Lady Ashford", "Colonel Mustard", "Dr. Finch", "Miss Scarlet", "Reverend Green"]
+LOCATIONS = ["library", "conservatory", "ballroom", "kitchen", "study", "garden"]
+TIMES = ["at nine", "around midnight", "after dinner", "before the storm", "at half past ten"]
+
+
+def _statement(rng: random.Random) -> tuple[str, str]:
+    question = f"Where were you {rng.choice(TIMES)}?"
+    answer = (
+        f"I was in the {rng.choice(LOCATIONS)} {rng.choice(TIMES)}, "
+        f"and I saw {rng.choice(SUSPECTS)} near the {rng.choice(LOCATIONS)}."
+    )
+    return question, answer
+
+
+def _percentiles(samples: list[float]) -> str:
+    samples = sorted(samples)
+    p50 = statistics.median(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    return f"p50 {p50:.2f}ms  p95 {p95:.2f}ms  max {samples[-1]:.2f}ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    add_ms, flush_ms, search_ms, history_ms = [], [], [], []
+
+    for s in range(args.sessions):
+        memory = get_game_memory(f"bench-{s}")
+        if not memory.initialize():
+            print("Error: GameMemory unavailable (is faiss-cpu installed?)")
+            sys.exit(1)
+
+        for turn in range(args.turns):
+            suspect = rng.choice(SUSPECTS)
+            question, answer = _statement(rng)
+
+            t0 = time.perf_counter()
+            memory.add_conversation(suspect, question, answer, turn)
+            add_ms.append((time.perf_counter() - t0) * 1000)
+
+            t0 = time.perf_counter()
+            memory.flush(timeout=None)
+            flush_ms.append((time.perf_counter() - t0) * 1000)
+
+            t0 = time.perf_counter()
+            memory.search_by_suspect(suspect, question, k=3)
+            memory.search("alibi claimed said they were", k=3, filter_type="conversation")
+            search_ms.append((time.perf_counter() - t0) * 1000)
+
+            t0 = time.perf_counter()
+            memory.get_recent_exchanges(suspect, n=5)
+            history_ms.append((time.perf_counter() - t0) * 1000)
+
+    print("=" * 60)
+    print(f"GameMemory benchmark: {args.sessions} sessions x {args.turns} turns")
+    print("=" * 60)
+    print(f"add_conversation      {_percentiles(add_ms)}")
+    print(f"flush                 {_percentiles(flush_ms)}")
+    print(f"search (2 queries)    {_percentiles(search_ms)}")
+    print(f"recent exchanges      {_percentiles(history_ms)}")
+    print(f"registry              {get_memory_registry().stats()}")
+    print(f"embedding cache       {get_embedding_cache().stats()}")
+
+
+if __name__ == "__main__":
+    main()
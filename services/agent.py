@@ -1,9 +1,15 @@
 """LangGraph agent for the game master."""
 
 import os
+import time
 import logging
-from typing import Annotated, TypedDict, List
-from langchain_openai import ChatOpenAI
+import threading
+import contextvars
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Annotated, Callable, Dict, Optional, Set, Tuple, TypedDict, List
+from services.llm_clients import get_chat_model, prompt_token_usage
+from services.perf_tracker import perf
 from langchain_core.messages import (
     HumanMessage,
     AIMessage,
@@ -11,10 +17,17 @@ from langchain_core.messages import (
     BaseMessage,
     ToolMessage,
 )
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
-from langgraph.prebuilt import ToolNode
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from game.tools import interrogate_suspect, get_all_tools
+from game.state_manager import session_context
+from services.checkpoint_store import get_checkpointer
+from services.agent_history import (
+    AGENT_HISTORY_TURNS,
+    get_conversation_history,
+    window_history,
+)
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -26,11 +39,339 @@ class AgentState(TypedDict):
 
     messages: Annotated[List[BaseMessage], "The conversation messages"]
     system_prompt: str
+    # Rolling summary of turns that left the history window, plus any folded
+    # turns not summarized yet (see agent_history)
+    history_summary: str
+    history_epoch: str
+
+
+# =============================================================================
+# MESSAGE SANITATION
+# =============================================================================
+# OpenAI requires every AIMessage with tool_calls to be answered by ToolMessages
+# that immediately follow it. Interrupted turns and partial checkpoints can
+# break that, so agent_node repairs the history in a single pass: unanswered
+# calls get placeholder ToolMessages and ToolMessages without a matching call
+# are turned into context the LLM can read. Clean prefixes are remembered per
+# thread (by message count), so only newly appended messages are checked.
+
+# Tools whose output should be used directly as the response
+DIRECT_OUTPUT_TOOLS = {"interrogate_suspect", "describe_scene_for_image"}
+
+# Threads whose validated prefix is remembered
+_SANITIZED_CACHE_SIZE = 256
+
+
+def _tool_call_field(tc, key: str, default=None):
+    return tc.get(key, default) if isinstance(tc, dict) else getattr(tc, key, default)
+
+
+def _orphan_tool_message(msg: ToolMessage) -> HumanMessage:
+    """Convert a ToolMessage with no matching tool call into context the LLM accepts."""
+    tool_name = getattr(msg, "name", "") or getattr(msg, "tool_name", "")
+    tool_content = getattr(msg, "content", str(msg))
+    logger.warning(
+        "ToolMessage id %s (tool='%s') has no matching AIMessage - converting for LLM consumption",
+        getattr(msg, "tool_call_id", None),
+        tool_name or "(unknown)",
+    )
+
+    if tool_name == "interrogate_suspect":
+        # Treat as a suspect speaking directly.
+        return HumanMessage(content=f"[The suspect responds:] {tool_content}")
+    if tool_name == "describe_scene_for_image":
+        # Treat as an internal scene brief the GM should use, not
+        # something to read out verbatim to the player.
+        return HumanMessage(
+            content=(
+                "[SCENE BRIEF FOR IMAGE GENERATION]\n"
+                "Use this JSON to color your description of the location, "
+                "then speak naturally to the player and append a single "
+                "[SCENE_BRIEF{...}] marker with the SAME JSON at the very "
+                "end of your response (on its own line).\n"
+                f"{tool_content}"
+            )
+        )
+    # Generic tool output – expose to the LLM as context.
+    return HumanMessage(
+        content=f"[Tool result from {tool_name or 'unknown_tool'}]: {tool_content}"
+    )
+
+
+class _SanitizerState:
+    """Tool-call block still being answered at the end of a validated prefix."""
+
+    __slots__ = ("open_calls", "answered")
+
+    def __init__(self, open_calls: Optional[Dict[str, str]] = None, answered: Optional[Set[str]] = None):
+        self.open_calls: Dict[str, str] = open_calls or {}  # tool_call_id -> tool name
+        self.answered: Set[str] = answered or set()
+
+    def copy(self) -> "_SanitizerState":
+        return _SanitizerState(dict(self.open_calls), set(self.answered))
+
+    def close(self, out: List[BaseMessage]) -> bool:
+        """Append placeholders for unanswered calls; True if any were needed."""
+        missing = [(i, n) for i, n in self.open_calls.items() if i not in self.answered]
+        for tc_id, tc_name in missing:
+            out.append(
+                ToolMessage(
+                    content=f"[Tool '{tc_name}' did not complete - please try again]",
+                    tool_call_id=tc_id,
+                    name=tc_name,
+                )
+            )
+        if missing:
+            logger.warning(
+                "AIMessage had %d unanswered tool_call(s) - added placeholder responses",
+                len(missing)
+            )
+        self.open_calls, self.answered = {}, set()
+        return bool(missing)
+
+
+def sanitize_messages(
+    messages: List[BaseMessage], state: Optional[_SanitizerState] = None
+) -> Tuple[List[BaseMessage], _SanitizerState, bool]:
+    """Single-pass repair of tool_calls/ToolMessage pairing.
+
+    Returns (messages, state at the end, whether anything was changed). The
+    final tool-call block is left open in ``state``; call ``state.close()`` to
+    add its placeholders once no more messages will be appended.
+    """
+    state = state or _SanitizerState()
+    out: List[BaseMessage] = []
+    changed = False
+    for msg in messages:
+        if isinstance(msg, ToolMessage):
+            tc_id = getattr(msg, "tool_call_id", None)
+            if tc_id in state.open_calls and tc_id not in state.answered:
+                state.answered.add(tc_id)
+                out.append(msg)
+            else:
+                out.append(_orphan_tool_message(msg))
+                changed = True
+            continue
+
+        changed = state.close(out) or changed
+        if isinstance(msg, AIMessage) and msg.tool_calls:
+            state.open_calls = {
+                tc_id: _tool_call_field(tc, "name", "unknown")
+                for tc in msg.tool_calls
+                if (tc_id := _tool_call_field(tc, "id"))
+            }
+        out.append(msg)
+    return out, state, changed
+
+
+def _message_signature(msg: BaseMessage) -> tuple:
+    content = msg.content if isinstance(msg.content, str) else str(msg.content)
+    return (type(msg).__name__, getattr(msg, "id", None), getattr(msg, "tool_call_id", None), hash(content))
+
+
+class _SanitizedPrefixCache:
+    """Per-thread memory of the longest history prefix known to be clean."""
+
+    def __init__(self, max_threads: int = _SANITIZED_CACHE_SIZE):
+        self.max_threads = max_threads
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def sanitize(self, thread_id: Optional[str], messages: List[BaseMessage]) -> List[BaseMessage]:
+        """Sanitize ``messages``, re-checking only what was appended since last time."""
+        entry = None
+        if thread_id is not None:
+            with self._lock:
+                entry = self._entries.get(thread_id)
+
+        if (
+            entry is not None
+            and 0 < entry[0] <= len(messages)
+            and _message_signature(messages[0]) == entry[1]
+            and _message_signature(messages[entry[0] - 1]) == entry[2]
+        ):
+            count, state = entry[0], entry[3].copy()
+            tail, state, changed = sanitize_messages(messages[count:], state)
+            out = list(messages[:count]) + tail
+        else:
+            out, state, changed = sanitize_messages(messages)
+
+        if thread_id is not None and messages and not changed:
+            with self._lock:
+                self._entries[thread_id] = (
+                    len(messages),
+                    _message_signature(messages[0]),
+                    _message_signature(messages[-1]),
+                    state.copy(),
+                )
+                self._entries.move_to_end(thread_id)
+                while len(self._entries) > self.max_threads:
+                    self._entries.popitem(last=False)
+
+        state.close(out)
+        return out
+
+
+def _log_messages(messages: List[BaseMessage]):
+    """Debug dump of what is sent to the LLM."""
+    for i, msg in enumerate(messages):
+        content = msg.content if isinstance(msg.content, str) else str(msg.content)
+        if isinstance(msg, AIMessage) and msg.tool_calls:
+            ids = [_tool_call_field(tc, "id") for tc in msg.tool_calls]
+            logger.debug("  [%d] AI: %s | tool_call_ids=%s", i, content[:60], ids)
+        elif isinstance(msg, ToolMessage):
+            logger.debug("  [%d] Tool[%s]: %s...", i, msg.tool_call_id, content[:60])
+        else:
+            logger.debug("  [%d] %s: %s...", i, type(msg).__name__, content[:100])
+
+
+# =============================================================================
+# TOOL EXECUTION
+# =============================================================================
+# When the model asks for several tools in one message they are independent of
+# each other, and all of them are blocking network calls. They run on a shared
+# bounded pool so a multi-tool turn takes as long as its slowest tool; results
+# are returned in the order the model requested them.
+
+AGENT_TOOL_WORKERS = int(os.getenv("AGENT_TOOL_WORKERS", "4"))
+AGENT_TOOL_TIMEOUT = float(os.getenv("AGENT_TOOL_TIMEOUT", "60"))
+
+# Per-tool overrides (seconds). Interrogation includes the suspect's LLM reply
+# and TTS; the RAG lookups are local searches and should return quickly.
+TOOL_TIMEOUTS = {
+    "interrogate_suspect": 90.0,
+    "search_past_statements": 20.0,
+    "find_contradictions": 30.0,
+    "get_cross_references": 20.0,
+    "get_investigation_hint": 20.0,
+}
+
+# Tools that change game state are never timed out: a timed-out accusation
+# would keep running in the background and could end the game after the model
+# was told it failed. They run inline on the agent's thread, to completion.
+UNTIMED_TOOLS = frozenset({"make_accusation"})
+
+_tool_executor: Optional[ThreadPoolExecutor] = None
+_tool_executor_lock = threading.Lock()
+
+
+def _get_tool_executor() -> ThreadPoolExecutor:
+    global _tool_executor
+    with _tool_executor_lock:
+        if _tool_executor is None:
+            _tool_executor = ThreadPoolExecutor(
+                max_workers=AGENT_TOOL_WORKERS, thread_name_prefix="agent-tool"
+            )
+        return _tool_executor
 
 
-def create_game_master_agent():
+def _tool_error_message(tc, content: str) -> ToolMessage:
+    return ToolMessage(
+        content=content,
+        name=_tool_call_field(tc, "name", ""),
+        tool_call_id=_tool_call_field(tc, "id", ""),
+        status="error",
+    )
+
+
+def _run_tool_call(tools_by_name: Dict, tc) -> ToolMessage:
+    name = _tool_call_field(tc, "name", "")
+    tool = tools_by_name.get(name)
+    if tool is None:
+        return _tool_error_message(
+            tc,
+            f"Error: {name} is not a valid tool, try one of [{', '.join(tools_by_name)}].",
+        )
+    call = {
+        "name": name,
+        "args": _tool_call_field(tc, "args", {}) or {},
+        "id": _tool_call_field(tc, "id"),
+        "type": "tool_call",
+    }
+    try:
+        result = tool.invoke(call)
+    except Exception as e:
+        logger.exception("[AGENT] Tool %s failed", name)
+        return _tool_error_message(tc, f"Error: {e!r}\n Please fix your mistakes.")
+    if isinstance(result, ToolMessage):
+        return result
+    return ToolMessage(content=str(result), name=name, tool_call_id=call["id"])
+
+
+class _ToolStart:
+    """Set by the pool worker when a queued tool call actually begins."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.at = 0.0
+
+
+def _run_pooled_tool_call(start: _ToolStart, tools_by_name: Dict, tc) -> ToolMessage:
+    start.at = time.monotonic()
+    start.event.set()
+    return _run_tool_call(tools_by_name, tc)
+
+
+def _await_tool_call(tc, future, start: _ToolStart) -> ToolMessage:
+    """Wait for a pooled call; its timeout runs from when a worker picked it up.
+
+    A call still queued after AGENT_TOOL_TIMEOUT (every worker busy) is
+    cancelled before it runs. A call that overruns its timeout once running is
+    answered with an error; the worker finishes it in the background.
+    """
+    name = _tool_call_field(tc, "name", "")
+    timeout = TOOL_TIMEOUTS.get(name, AGENT_TOOL_TIMEOUT)
+    if not start.event.wait(AGENT_TOOL_TIMEOUT) and future.cancel():
+        logger.warning("[AGENT] Tool %s never started; cancelled", name)
+        return _tool_error_message(
+            tc, f"Error: {name} could not start, the tool pool is busy."
+        )
+    start.event.wait()
+    remaining = start.at + timeout - time.monotonic()
+    try:
+        return future.result(timeout=max(0.0, remaining))
+    except FutureTimeoutError:
+        future.cancel()
+        logger.warning("[AGENT] Tool %s timed out after %.0fs", name, timeout)
+        return _tool_error_message(tc, f"Error: {name} timed out after {timeout:.0f}s.")
+
+
+def run_tool_calls(tools_by_name: Dict, tool_calls: List) -> List[ToolMessage]:
+    """Run a message's tool calls concurrently; ToolMessages keep the call order.
+
+    Read-only tools go to the shared pool and are answered with an error
+    ToolMessage if they exceed their timeout, so the turn can continue.
+    UNTIMED_TOOLS run inline, after the pooled calls are submitted, and are
+    always awaited to completion.
+    """
+    executor = _get_tool_executor()
+    pending = []
+    for tc in tool_calls:
+        if _tool_call_field(tc, "name", "") in UNTIMED_TOOLS:
+            pending.append((tc, None, None))
+            continue
+        start = _ToolStart()
+        future = executor.submit(
+            contextvars.copy_context().run, _run_pooled_tool_call, start, tools_by_name, tc
+        )
+        pending.append((tc, future, start))
+
+    results = []
+    for tc, future, start in pending:
+        if future is None:
+            results.append(_run_tool_call(tools_by_name, tc))
+        else:
+            results.append(_await_tool_call(tc, future, start))
+    return results
+
+
+def create_game_master_agent(checkpointer: BaseCheckpointSaver | str | None = None):
     """Create a game master agent with tools.
     
+    Args:
+        checkpointer: A LangGraph checkpointer, or "sqlite"/"memory" to pick a
+            shared one (see services.checkpoint_store). Defaults to AGENT_CHECKPOINTER.
+    
     Tools include:
     - interrogate_suspect: Always available
     - search_past_statements: Available if RAG memory is initialized
@@ -42,104 +383,39 @@ def create_game_master_agent():
     # Using gpt-4o-mini for speed (~2s) vs gpt-4o (~5s) vs gpt-4 (~10s)
     model_name = os.getenv("GAME_MASTER_MODEL", "gpt-4o-mini")
     logger.info("🤖 Creating Game Master agent with model: %s", model_name)
-    llm = ChatOpenAI(
-        model=model_name,
-        max_tokens=600,
-        api_key=os.getenv("OPENAI_API_KEY")
-    )
+    llm = get_chat_model(model_name, max_tokens=600)
 
     # Bind tools to the LLM - use get_all_tools() to include RAG tools if available
     tools = get_all_tools()
     logger.info("Creating agent with %d tool(s): %s", len(tools), [t.name for t in tools])
     llm_with_tools = llm.bind_tools(tools)
 
-    # Create tool node with logging wrapper
-    base_tool_node = ToolNode(tools)
+    # Tool calls from one message run concurrently (see run_tool_calls)
+    tools_by_name = {t.name: t for t in tools}
 
     def tool_node(state: AgentState):
         logger.info("=== TOOL NODE CALLED ===")
         messages = state.get("messages", [])
-        if messages:
-            last_msg = messages[-1]
-            if hasattr(last_msg, "tool_calls") and last_msg.tool_calls:
-                logger.info("Executing %d tool call(s)", len(last_msg.tool_calls))
-                for i, tc in enumerate(last_msg.tool_calls):
-                    tool_name = (
-                        tc.get("name", "unknown")
-                        if isinstance(tc, dict)
-                        else getattr(tc, "name", "unknown")
-                    )
-                    logger.info("  Tool %d: %s", i + 1, tool_name)
-        result = base_tool_node.invoke(state)
-        logger.info("=== TOOL NODE COMPLETE ===")
+        last_msg = messages[-1] if messages else None
+        tool_calls = getattr(last_msg, "tool_calls", None) or []
+        if not isinstance(last_msg, AIMessage) or not tool_calls:
+            raise ValueError("No AIMessage with tool calls found in input.")
+        logger.info("Executing %d tool call(s)", len(tool_calls))
+        for i, tc in enumerate(tool_calls):
+            logger.info("  Tool %d: %s", i + 1, _tool_call_field(tc, "name", "unknown"))
+        t0 = time.perf_counter()
+        result = {"messages": run_tool_calls(tools_by_name, tool_calls)}
+        logger.info("=== TOOL NODE COMPLETE (%.2fs) ===", time.perf_counter() - t0)
         return result
 
     # Define the agent node
-    def agent_node(state: AgentState):
+    sanitized_prefixes = _SanitizedPrefixCache()
+
+    def agent_node(state: AgentState, config: RunnableConfig):
         messages = state["messages"]
         system_prompt = state.get("system_prompt", "")
 
-        logger.info("=== AGENT NODE CALLED ===")
-        logger.info("Number of messages in state: %d", len(messages))
-
-        # Log message types for debugging
-        msg_types = [type(m).__name__ for m in messages]
-        logger.info("Message types: %s", msg_types)
-
-        # FIX: Handle incomplete tool calls from corrupted checkpoints
-        # OpenAI requires that AIMessage with tool_calls must be followed by ToolMessages
-        # If we find an AIMessage with tool_calls but no following ToolMessage, we need to
-        # either remove it or add placeholder responses
-        cleaned_messages = []
-        for i, msg in enumerate(messages):
-            if isinstance(msg, AIMessage) and hasattr(msg, "tool_calls") and msg.tool_calls:
-                # Check if the next messages are ToolMessages for these tool_calls
-                tool_call_ids = set()
-                for tc in msg.tool_calls:
-                    tc_id = tc.get("id") if isinstance(tc, dict) else getattr(tc, "id", None)
-                    if tc_id:
-                        tool_call_ids.add(tc_id)
-                
-                # Look for responding ToolMessages
-                responded_ids = set()
-                for j in range(i + 1, len(messages)):
-                    next_msg = messages[j]
-                    if isinstance(next_msg, ToolMessage):
-                        tc_id = getattr(next_msg, "tool_call_id", None)
-                        if tc_id in tool_call_ids:
-                            responded_ids.add(tc_id)
-                    elif isinstance(next_msg, (HumanMessage, AIMessage)):
-                        # Stop looking once we hit a non-ToolMessage
-                        break
-                
-                missing_ids = tool_call_ids - responded_ids
-                if missing_ids:
-                    logger.warning(
-                        "Found AIMessage with %d incomplete tool_calls (missing responses for: %s) - adding placeholder responses",
-                        len(missing_ids), missing_ids
-                    )
-                    # Add the AI message
-                    cleaned_messages.append(msg)
-                    # Add placeholder ToolMessages for missing responses
-                    for tc in msg.tool_calls:
-                        tc_id = tc.get("id") if isinstance(tc, dict) else getattr(tc, "id", None)
-                        tc_name = tc.get("name") if isinstance(tc, dict) else getattr(tc, "name", "unknown")
-                        if tc_id in missing_ids:
-                            placeholder = ToolMessage(
-                                content=f"[Tool '{tc_name}' did not complete - please try again]",
-                                tool_call_id=tc_id,
-                                name=tc_name
-                            )
-                            cleaned_messages.append(placeholder)
-                            logger.info("Added placeholder ToolMessage for incomplete call %s", tc_id)
-                else:
-                    cleaned_messages.append(msg)
-            else:
-                cleaned_messages.append(msg)
-        
-        if len(cleaned_messages) != len(messages):
-            logger.info("Cleaned message list: %d -> %d messages", len(messages), len(cleaned_messages))
-            messages = cleaned_messages
+        logger.info("=== AGENT NODE CALLED (%d messages in state) ===", len(messages))
 
         # SPECIAL CASE: If we only have a ToolMessage, LangGraph didn't preserve full history.
         # For certain tools (interrogate_suspect, describe_scene_for_image) the ToolMessage
@@ -152,9 +428,7 @@ def create_game_master_agent():
             )
             tool_content = getattr(tool_msg, "content", str(tool_msg))
 
-            # Tools whose output should be used directly as the response
-            direct_output_tools = {"interrogate_suspect", "describe_scene_for_image"}
-            if tool_name in direct_output_tools:
+            if tool_name in DIRECT_OUTPUT_TOOLS:
                 logger.info(
                     "Only ToolMessage in state for %s – returning tool result directly",
                     tool_name,
@@ -170,199 +444,30 @@ def create_game_master_agent():
                 tool_name or "(unknown)",
             )
 
-        # Ensure system message is present
-        if not any(isinstance(msg, SystemMessage) for msg in messages):
-            if system_prompt:
-                messages = [SystemMessage(content=system_prompt)] + list(messages)
-                logger.info("Added system message from state")
-
-        # Build clean message list for LLM
-        # OpenAI requires: SystemMessage, then alternating Human/AI,
-        # with ToolMessages after AI tool_calls
-        filtered_messages = []
-
-        for i, msg in enumerate(messages):
-            if isinstance(msg, ToolMessage):
-                # Find the AIMessage this tool result belongs to
-                # Look backwards through ALL messages (not just filtered) to find the matching AIMessage
-                tool_call_id = getattr(msg, "tool_call_id", None)
-                has_matching_ai = False
-                matching_ai_msg = None
-
-                # Look backwards to find the AIMessage with matching tool_call
-                for j in range(i - 1, -1, -1):
-                    prev_msg = messages[j]
-                    if (
-                        isinstance(prev_msg, AIMessage)
-                        and hasattr(prev_msg, "tool_calls")
-                        and prev_msg.tool_calls
-                    ):
-                        for tc in prev_msg.tool_calls:
-                            tc_id = (
-                                tc.get("id")
-                                if isinstance(tc, dict)
-                                else getattr(tc, "id", None)
-                            )
-                            if tc_id == tool_call_id:
-                                has_matching_ai = True
-                                matching_ai_msg = prev_msg
-                                break
-                    if has_matching_ai:
-                        break
-
-                if has_matching_ai:
-                    # Make sure the AIMessage is in filtered_messages before adding ToolMessage
-                    if matching_ai_msg not in filtered_messages:
-                        # Insert after the last HumanMessage before this ToolMessage
-                        insert_idx = len(filtered_messages)
-                        for k in range(len(filtered_messages) - 1, -1, -1):
-                            if isinstance(filtered_messages[k], HumanMessage):
-                                insert_idx = k + 1
-                                break
-                        filtered_messages.insert(insert_idx, matching_ai_msg)
-                        logger.info(
-                            "Inserted matching AIMessage with tool_calls before ToolMessage"
-                        )
-                    filtered_messages.append(msg)
-                else:
-                    # CRITICAL FIX: If we can't find the matching AIMessage, LangGraph
-                    # only passed the ToolMessage without full history. Convert it to
-                    # a HumanMessage format the LLM can understand.
-                    tool_name = getattr(msg, "name", "") or getattr(
-                        msg, "tool_name", ""
-                    )
-                    tool_content = getattr(msg, "content", str(msg))
+        # Repair tool_calls/ToolMessage pairing (only new messages are re-checked)
+        thread_id = (config or {}).get("configurable", {}).get("thread_id")
+        filtered_messages = sanitized_prefixes.sanitize(thread_id, list(messages))
 
-                    logger.warning(
-                        "ToolMessage id %s (tool='%s') has no matching AIMessage - "
-                        "converting for LLM consumption",
-                        tool_call_id,
-                        tool_name or "(unknown)",
-                    )
+        # Ensure system message is present
+        if system_prompt and not any(isinstance(msg, SystemMessage) for msg in filtered_messages):
+            filtered_messages = [SystemMessage(content=system_prompt)] + filtered_messages
+            logger.info("Added system message from state")
 
-                    if tool_name == "interrogate_suspect":
-                        # Treat as a suspect speaking directly.
-                        human_msg = HumanMessage(
-                            content=f"[The suspect responds:] {tool_content}"
-                        )
-                    elif tool_name == "describe_scene_for_image":
-                        # Treat as an internal scene brief the GM should use, not
-                        # something to read out verbatim to the player.
-                        human_msg = HumanMessage(
-                            content=(
-                                "[SCENE BRIEF FOR IMAGE GENERATION]\n"
-                                "Use this JSON to color your description of the location, "
-                                "then speak naturally to the player and append a single "
-                                "[SCENE_BRIEF{...}] marker with the SAME JSON at the very "
-                                "end of your response (on its own line).\n"
-                                f"{tool_content}"
-                            )
-                        )
-                    else:
-                        # Generic tool output – expose to the LLM as context.
-                        human_msg = HumanMessage(
-                            content=f"[Tool result from {tool_name or 'unknown_tool'}]: "
-                            f"{tool_content}"
-                        )
+        logger.info("Invoking LLM with %d messages", len(filtered_messages))
+        if logger.isEnabledFor(logging.DEBUG):
+            _log_messages(filtered_messages)
 
-                    filtered_messages.append(human_msg)
-                    logger.info(
-                        "Converted ToolMessage for tool '%s' to HumanMessage: %s...",
-                        tool_name or "(unknown)",
-                        tool_content[:80],
-                    )
-            else:
-                filtered_messages.append(msg)
-
-        logger.info("Invoking LLM with %d messages (before final validation)", len(filtered_messages))
-
-        # FINAL VALIDATION: Ensure every AIMessage with tool_calls has ALL its responses
-        # OpenAI will reject the request if any tool_call_id is missing a response
-        final_messages = []
-        i = 0
-        while i < len(filtered_messages):
-            msg = filtered_messages[i]
-            if isinstance(msg, AIMessage) and hasattr(msg, "tool_calls") and msg.tool_calls:
-                # Get all tool_call_ids from this AIMessage
-                expected_ids = set()
-                for tc in msg.tool_calls:
-                    tc_id = tc.get("id") if isinstance(tc, dict) else getattr(tc, "id", None)
-                    if tc_id:
-                        expected_ids.add(tc_id)
-                
-                # Collect all ToolMessages that immediately follow
-                tool_messages = []
-                j = i + 1
-                while j < len(filtered_messages) and isinstance(filtered_messages[j], ToolMessage):
-                    tool_messages.append(filtered_messages[j])
-                    j += 1
-                
-                # Check which IDs have responses
-                responded_ids = set()
-                for tm in tool_messages:
-                    tc_id = getattr(tm, "tool_call_id", None)
-                    if tc_id:
-                        responded_ids.add(tc_id)
-                
-                missing_ids = expected_ids - responded_ids
-                if missing_ids:
-                    logger.warning(
-                        "FINAL VALIDATION: AIMessage at index %d has %d missing tool responses: %s",
-                        i, len(missing_ids), missing_ids
-                    )
-                    # Add placeholders for missing tool responses
-                    final_messages.append(msg)
-                    for tm in tool_messages:
-                        final_messages.append(tm)
-                    for tc in msg.tool_calls:
-                        tc_id = tc.get("id") if isinstance(tc, dict) else getattr(tc, "id", None)
-                        tc_name = tc.get("name") if isinstance(tc, dict) else getattr(tc, "name", "unknown")
-                        if tc_id in missing_ids:
-                            placeholder = ToolMessage(
-                                content=f"[Tool '{tc_name}' response unavailable]",
-                                tool_call_id=tc_id,
-                                name=tc_name
-                            )
-                            final_messages.append(placeholder)
-                            logger.info("FINAL VALIDATION: Added placeholder for tool_call_id %s", tc_id)
-                    i = j  # Skip past the tool messages we just processed
-                else:
-                    final_messages.append(msg)
-                    for tm in tool_messages:
-                        final_messages.append(tm)
-                    i = j
-            else:
-                final_messages.append(msg)
-                i += 1
-        
-        filtered_messages = final_messages
-        logger.info("After final validation: %d messages", len(filtered_messages))
-
-        # Log what we're sending
-        for i, msg in enumerate(filtered_messages):
-            if isinstance(msg, SystemMessage):
-                logger.info("  [%d] System: %s...", i, msg.content[:100])
-            elif isinstance(msg, HumanMessage):
-                logger.info("  [%d] Human: %s...", i, msg.content[:100])
-            elif isinstance(msg, AIMessage):
-                has_tools = hasattr(msg, "tool_calls") and msg.tool_calls
-                tc_ids = []
-                if has_tools:
-                    for tc in msg.tool_calls:
-                        tc_id = tc.get("id") if isinstance(tc, dict) else getattr(tc, "id", None)
-                        tc_ids.append(tc_id[:12] + "..." if tc_id and len(tc_id) > 12 else tc_id)
-                logger.info(
-                    "  [%d] AI: %s | tools=%s ids=%s",
-                    i,
-                    msg.content[:60] if msg.content else "(no content)",
-                    has_tools,
-                    tc_ids if has_tools else "[]",
-                )
-            elif isinstance(msg, ToolMessage):
-                tc_id = getattr(msg, "tool_call_id", "?")
-                logger.info("  [%d] Tool[%s]: %s...", i, tc_id[:12] + "..." if len(tc_id) > 12 else tc_id, msg.content[:60])
+        # Pass config through so stream_mode="messages" sees the model's tokens
+        response = llm_with_tools.invoke(filtered_messages, config)
 
-        response = llm_with_tools.invoke(filtered_messages)
+        # How much of the prompt the provider served from its prefix cache
+        prompt_tokens, cached_tokens = prompt_token_usage(response)
+        if prompt_tokens:
+            perf.record_prompt_tokens("game_master", prompt_tokens, cached_tokens)
+            logger.info(
+                "[LLM] Game Master prompt: %d tokens, %d cached (%.0f%%)",
+                prompt_tokens, cached_tokens, 100 * cached_tokens / prompt_tokens
+            )
 
         # Log the response
         if isinstance(response, AIMessage):
@@ -422,63 +527,224 @@ def create_game_master_agent():
     # After tools, go back to agent
     workflow.add_edge("tools", "agent")
 
-    # Compile with memory saver
-    memory = MemorySaver()
-    app = workflow.compile(checkpointer=memory)
+    # Compile with a bounded checkpointer (latest checkpoint per thread)
+    if checkpointer is None or isinstance(checkpointer, str):
+        checkpointer = get_checkpointer(checkpointer)
+    app = workflow.compile(checkpointer=checkpointer)
 
     return app
 
 
+_shared_agent = None
+_shared_agent_lock = threading.Lock()
+
+
+def get_game_master_agent():
+    """Get the process-wide compiled Game Master graph (built on first use).
+
+    A compiled graph holds no per-turn state - conversations live in the
+    shared checkpointer under each session's thread_id - so one instance can
+    serve concurrent turns from every session.
+    """
+    global _shared_agent
+    with _shared_agent_lock:
+        if _shared_agent is None:
+            _shared_agent = create_game_master_agent()
+        return _shared_agent
+
+
+def _stream_values(agent_app, state: dict, config: dict, on_token=None):
+    """Yield the graph's "values" events, forwarding agent tokens to on_token.
+
+    With on_token set, the graph also streams in "messages" mode and every text
+    chunk the Game Master model produces is passed on as it is generated,
+    together with its message id.
+    """
+    if on_token is None:
+        yield from agent_app.stream(state, config, stream_mode="values")
+        return
+
+    for mode, payload in agent_app.stream(
+        state, config, stream_mode=["values", "messages"]
+    ):
+        if mode == "values":
+            yield payload
+            continue
+        chunk, metadata = payload
+        if metadata.get("langgraph_node") != "agent" or not isinstance(chunk, AIMessage):
+            continue
+        if isinstance(chunk.content, str) and chunk.content:
+            try:
+                on_token(chunk.content, chunk.id)
+            except Exception as e:
+                logger.warning("[AGENT] Token callback failed: %s", e)
+
+
+def _load_history_window(agent_app, config: dict, thread_id: str):
+    """Load the thread's transcript and window it.
+
+    Returns (messages kept verbatim, turns folded into the summary, epoch).
+    """
+    checkpoint_state = agent_app.get_state(config)
+    values = checkpoint_state.values or {}
+    history = get_conversation_history()
+    if history.resume(
+        thread_id, values.get("history_epoch"), values.get("history_summary", "")
+    ):
+        loaded_messages = list(values.get("messages", []))
+    else:
+        # Conversation was reset (new game) - ignore the old transcript
+        loaded_messages = []
+    epoch = history.epoch(thread_id)
+    logger.info("Loaded %d messages from checkpoint", len(loaded_messages))
+
+    # Keep the last N turns verbatim; older turns go to the rolling summary.
+    # Cuts only happen between turns, so tool_calls/ToolMessage pairs stay intact.
+    kept_messages, folded_turns = window_history(loaded_messages, AGENT_HISTORY_TURNS)
+    history.fold(thread_id, folded_turns)
+    return kept_messages, folded_turns, epoch
+
+
+def _checkpoint_turn(
+    agent_app,
+    config: dict,
+    thread_id: str,
+    kept_messages: List[BaseMessage],
+    epoch: str,
+    user_message: str,
+    reply: str,
+):
+    """Checkpoint the bounded transcript for the next turn.
+
+    Only the player's message and the final reply are kept, so no tool_calls
+    are left dangling.
+    """
+    try:
+        agent_app.update_state(
+            config,
+            {
+                "messages": kept_messages + [
+                    HumanMessage(content=user_message),
+                    AIMessage(content=reply or ""),
+                ],
+                # Folded turns whose summary update is still running are
+                # saved as transcript, so a restart or eviction can't lose them
+                "history_summary": get_conversation_history().context_for(thread_id),
+                "history_epoch": epoch,
+            },
+            as_node="agent",
+        )
+    except Exception as e:
+        logger.warning("[AGENT] Could not checkpoint conversation window: %s", e)
+
+
+def record_turn(
+    agent_app,
+    user_message: str,
+    reply: str,
+    session_id: str,
+    thread_id: str = "default",
+):
+    """Add a turn that was handled without the agent to its conversation.
+
+    Structured actions can be dispatched straight to a tool; recording them
+    here keeps the Game Master's memory of the game complete.
+    """
+    config = {"configurable": {"thread_id": thread_id, "session_id": session_id}}
+    kept_messages, _folded, epoch = _load_history_window(agent_app, config, thread_id)
+    _checkpoint_turn(agent_app, config, thread_id, kept_messages, epoch, user_message, reply)
+
+
 def process_message(
     agent_app,
     user_message: str,
     system_prompt: str,
-    _session_id: str,
+    session_id: str,
     thread_id: str = "default",
+    on_token: Optional[Callable[[str, Optional[str]], None]] = None,
+    turn_context: str = "",
+    on_reply_end: Optional[Callable[[], None]] = None,
 ) -> tuple[str, str | None]:
     """Process a user message through the agent.
 
+    The compiled agent is shared by all sessions: per-turn data lives in the
+    thread's checkpoint, and tools resolve the session from the current
+    context (or the graph config), so concurrent turns don't see each other.
+
+    system_prompt should stay identical across turns so the provider can
+    serve it (and the history after it) from its prompt cache. Anything that
+    changes every turn belongs in turn_context, which is sent as a system
+    message right before the player's message and is not checkpointed.
+
+    If on_token is given, it is called with (text, message_id) for each token
+    of the Game Master's reply while the agent is still generating (used for
+    streaming TTS, see services.speech_stream). Tokens stop once a suspect is
+    interrogated, since the reply then carries the suspect's words.
+    on_reply_end is called as soon as the Game Master's final message (one
+    without tool calls) has finished streaming, before the turn wraps up;
+    it is not called when the reply is a suspect's.
+
     Returns:
         Tuple of (response, speaker_name) where speaker_name is:
         - Suspect name if response is from a suspect
         - None if response is from Game Master
     """
+    with session_context(session_id):
+        return _process_message(
+            agent_app,
+            user_message,
+            system_prompt,
+            session_id,
+            thread_id,
+            on_token,
+            turn_context,
+            on_reply_end,
+        )
+
+
+def _process_message(
+    agent_app,
+    user_message: str,
+    system_prompt: str,
+    session_id: str,
+    thread_id: str,
+    on_token: Optional[Callable[[str, Optional[str]], None]],
+    turn_context: str,
+    on_reply_end: Optional[Callable[[], None]],
+) -> tuple[str, str | None]:
     logger.info("\n%s", "=" * 60)
     logger.info("PROCESSING MESSAGE: %s", user_message)
     logger.info("Thread ID: %s", thread_id)
     logger.info("%s", "=" * 60)
 
-    config = {"configurable": {"thread_id": thread_id}}
+    # session_id lets tools find their game state from the graph config too
+    config = {"configurable": {"thread_id": thread_id, "session_id": session_id}}
 
     # Get current state from checkpoint
-    checkpoint_state = agent_app.get_state(config)
-    current_messages = (
-        list(checkpoint_state.values.get("messages", []))
-        if checkpoint_state.values
-        else []
+    kept_messages, folded_turns, epoch = _load_history_window(agent_app, config, thread_id)
+    history = get_conversation_history()
+
+    current_messages: List[BaseMessage] = [SystemMessage(content=system_prompt)]
+    summary = history.context_for(thread_id)
+    if summary:
+        current_messages.append(
+            SystemMessage(content=f"SUMMARY OF THE EARLIER CONVERSATION:\n{summary}")
+        )
+    current_messages.extend(kept_messages)
+    logger.info(
+        "[AGENT] History window: %d message(s) kept, %d turn(s) folded, summary %d chars",
+        len(kept_messages), len(folded_turns), len(summary)
     )
-    logger.info("Loaded %d messages from checkpoint", len(current_messages))
-
-    # Update or add system message
-    system_msg_index = None
-    for i, msg in enumerate(current_messages):
-        if isinstance(msg, SystemMessage):
-            system_msg_index = i
-            break
-
-    if system_msg_index is not None:
-        current_messages[system_msg_index] = SystemMessage(content=system_prompt)
-        logger.info("Updated existing system message")
-    else:
-        current_messages.insert(0, SystemMessage(content=system_prompt))
-        logger.info("Added new system message")
+
+    # Per-turn game state goes last so the prefix before it stays cacheable
+    if turn_context:
+        current_messages.append(SystemMessage(content=turn_context))
 
     # Add user message
     current_messages.append(HumanMessage(content=user_message))
     logger.info("Added user message. Total messages: %d", len(current_messages))
 
-    # IMPORTANT: Pass the FULL message history, not just new messages
-    # This ensures the agent always has complete context
+    # Pass the windowed history (plus summary), not just new messages
     full_state = {"messages": current_messages, "system_prompt": system_prompt}
 
     # Store a reference to the checkpoint state before streaming
@@ -492,7 +758,15 @@ def process_message(
     suspect_name = None
     tool_message_content = None
 
-    for event in agent_app.stream(full_state, config, stream_mode="values"):
+    def forward_token(text: str, message_id: Optional[str]):
+        # Once a suspect is interrogated, the final message echoes their words
+        # and is voiced by the tool, so stop streaming it to TTS
+        if suspect_name is None:
+            on_token(text, message_id)
+
+    for event in _stream_values(
+        agent_app, full_state, config, forward_token if on_token else None
+    ):
         # In "values" mode, we get the full state after each node
         if "messages" in event:
             messages = event["messages"]
@@ -533,6 +807,11 @@ def process_message(
                         # AIMessage with content but no tool_calls - this is a final response
                         final_response = last_msg.content
                         logger.info("Got AI response: %s...", final_response[:100])
+                        if on_reply_end is not None and suspect_name is None:
+                            try:
+                                on_reply_end()
+                            except Exception as e:
+                                logger.warning("[AGENT] Reply-end callback failed: %s", e)
                 elif isinstance(last_msg, ToolMessage):
                     # Store tool message content and extract suspect name
                     tool_message_content = getattr(last_msg, "content", str(last_msg))
@@ -777,6 +1056,10 @@ def process_message(
         # No tool call found - this is Game Master narration
         logger.info("No suspect tool call found - Game Master response")
 
+    _checkpoint_turn(
+        agent_app, config, thread_id, kept_messages, epoch, user_message, final_response
+    )
+
     logger.info("Returning: %s...", final_response[:200] if final_response else "Empty")
     logger.info("Speaker: %s", suspect_name or "Game Master")
     logger.info("%s\n", "=" * 60)
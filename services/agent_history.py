@@ -0,0 +1,295 @@
+"""Bounded conversation window and rolling summary for the Game Master agent.
+
+Sending the whole conversation on every turn makes prompt tokens and latency
+grow linearly over a game. Instead, process_message keeps the last
+AGENT_HISTORY_TURNS turns verbatim and folds older turns into a running
+summary that a background worker updates incrementally.
+
+A turn starts at a HumanMessage, and the window is only ever cut between
+turns, so an AIMessage with tool_calls is never separated from its
+ToolMessages.
+
+Usage:
+    from services.agent_history import get_conversation_history, window_history
+
+    kept, folded = window_history(messages, max_turns=6)
+    history = get_conversation_history()
+    history.fold(thread_id, folded)
+    summary = history.context_for(thread_id)
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+
+logger = logging.getLogger(__name__)
+
+# Turns kept verbatim in the prompt; older turns are summarized
+AGENT_HISTORY_TURNS = int(os.getenv("AGENT_HISTORY_TURNS", "6"))
+# Set to false to use a cheap extractive summary instead of an LLM
+AGENT_HISTORY_SUMMARY = os.getenv("AGENT_HISTORY_SUMMARY", "true").lower() == "true"
+AGENT_SUMMARY_MODEL = os.getenv("AGENT_SUMMARY_MODEL", "gpt-4o-mini")
+
+# Rough cap on the summary so it cannot grow without bound either
+SUMMARY_MAX_CHARS = 2000
+
+# Threads kept in memory; idle or least recently used ones are dropped and
+# resume from their checkpoint like after a restart (same defaults as the
+# checkpoint store)
+AGENT_HISTORY_MAX_THREADS = int(os.getenv("AGENT_HISTORY_MAX_THREADS", "1000"))
+AGENT_HISTORY_IDLE_TTL = float(os.getenv("AGENT_HISTORY_IDLE_TTL", str(24 * 3600)))
+
+Turn = List[BaseMessage]
+
+
+def split_turns(messages: List[BaseMessage]) -> List[Turn]:
+    """Group non-system messages into turns, each starting at a HumanMessage.
+
+    Messages before the first HumanMessage (e.g. a lone AIMessage from an
+    older checkpoint) form their own leading turn.
+    """
+    turns: List[Turn] = []
+    for msg in messages:
+        if isinstance(msg, SystemMessage):
+            continue
+        if isinstance(msg, HumanMessage) or not turns:
+            turns.append([msg])
+        else:
+            turns[-1].append(msg)
+    return turns
+
+
+def window_history(
+    messages: List[BaseMessage], max_turns: int = AGENT_HISTORY_TURNS
+) -> Tuple[List[BaseMessage], List[Turn]]:
+    """Split history into (messages to keep verbatim, older turns to fold)."""
+    turns = split_turns(messages)
+    if max_turns <= 0:
+        return [], turns
+    folded, kept = turns[:-max_turns], turns[-max_turns:]
+    return [msg for turn in kept for msg in turn], folded
+
+
+def render_turn(turn: Turn) -> str:
+    """Plain-text transcript of a turn (tool traffic omitted)."""
+    lines = []
+    for msg in turn:
+        content = msg.content if isinstance(msg.content, str) else str(msg.content)
+        if not content.strip():
+            continue
+        if isinstance(msg, HumanMessage):
+            lines.append(f"Player: {content.strip()}")
+        elif isinstance(msg, AIMessage):
+            lines.append(f"Game Master: {content.strip()}")
+    return "\n".join(lines)
+
+
+def _extractive_summary(summary: str, turns: List[Turn]) -> str:
+    """Fallback: append clipped transcript lines and keep the most recent text."""
+    lines = [summary] if summary else []
+    for turn in turns:
+        for line in render_turn(turn).splitlines():
+            lines.append(line if len(line) <= 200 else line[:197] + "...")
+    text = "\n".join(lines)
+    return text[-SUMMARY_MAX_CHARS:]
+
+
+@dataclass
+class _ThreadHistory:
+    summary: str = ""
+    pending: List[Turn] = field(default_factory=list)  # folded, not yet summarized
+    epoch: str = ""  # Per-game id, stored with each checkpoint
+    lock: threading.Lock = field(default_factory=threading.Lock)  # serializes updates
+    future: Optional[Future] = None
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class ConversationHistory:
+    """Per-thread rolling summaries, updated on a background worker.
+
+    Bounded like the checkpoint store: threads idle for longer than
+    ``idle_ttl`` seconds, then the least recently used beyond ``max_threads``,
+    are forgotten. Threads with folded turns still waiting to be summarized
+    are kept. A forgotten thread picks its epoch and summary back up from its
+    checkpoint (see resume()).
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_threads: int = AGENT_HISTORY_MAX_THREADS,
+        idle_ttl: float = AGENT_HISTORY_IDLE_TTL,
+    ):
+        self.max_threads = max_threads
+        self.idle_ttl = idle_ttl
+        # thread id -> history, least recently used first
+        self._threads: "OrderedDict[str, _ThreadHistory]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="agent-summary"
+        )
+
+    def _get(self, thread_id: str) -> _ThreadHistory:
+        with self._lock:
+            history = self._threads.get(thread_id)
+            if history is None:
+                history = self._threads[thread_id] = _ThreadHistory()
+            else:
+                self._threads.move_to_end(thread_id)
+            history.last_used = time.monotonic()
+            self._evict_locked(keep=thread_id)
+            return history
+
+    def _evict_locked(self, keep: str):
+        """Forget idle threads, then the least recently used beyond max_threads."""
+        now = time.monotonic()
+        evicted = []
+        for thread_id, history in list(self._threads.items()):
+            if (
+                len(self._threads) <= max(1, self.max_threads)
+                and now - history.last_used <= self.idle_ttl
+            ):
+                break  # Everything after this was used more recently
+            if thread_id == keep or history.pending:
+                continue
+            del self._threads[thread_id]
+            evicted.append(thread_id)
+        if evicted:
+            logger.info(
+                "[AGENT] Forgot history for %d idle thread(s) (%d active)",
+                len(evicted), len(self._threads)
+            )
+
+    def epoch(self, thread_id: str) -> str:
+        """Id of the thread's current game; replaced by reset()."""
+        return self._get(thread_id).epoch
+
+    def summary(self, thread_id: str) -> str:
+        return self._get(thread_id).summary
+
+    def resume(self, thread_id: str, epoch: Optional[str], summary: str) -> bool:
+        """Accept a checkpoint written under `epoch`; False if it is stale.
+
+        A thread this process has not reset yet (e.g. after a restart) adopts
+        the checkpoint's epoch and summary, so the saved game carries on. The
+        checkpointed summary is context_for() at the time, so it also covers
+        folded turns that had not been summarized yet.
+        Once reset() starts a new game, older checkpoints no longer match.
+        """
+        epoch = str(epoch or "")
+        history = self._get(thread_id)
+        with self._lock:
+            if not history.epoch:
+                history.epoch = epoch
+            if epoch != history.epoch:
+                return False
+            if summary and not history.summary and not history.pending:
+                history.summary = summary
+        return True
+
+    def context_for(self, thread_id: str) -> str:
+        """Summary plus any folded turns still waiting to be summarized."""
+        history = self._get(thread_id)
+        with self._lock:
+            parts = [history.summary] if history.summary else []
+            parts.extend(render_turn(turn) for turn in history.pending)
+        return "\n".join(p for p in parts if p)
+
+    def fold(self, thread_id: str, turns: List[Turn]):
+        """Queue turns that left the window and update the summary in the background."""
+        if not turns:
+            return
+        history = self._get(thread_id)
+        with self._lock:
+            history.pending.extend(turns)
+            epoch = history.epoch
+        history.future = self._executor.submit(self._update, thread_id, history, epoch)
+
+    def _update(self, thread_id: str, history: _ThreadHistory, epoch: str):
+        with history.lock:
+            with self._lock:
+                if history.epoch != epoch or not history.pending:
+                    return
+                summary, turns = history.summary, list(history.pending)
+
+            new_summary = self._summarize(summary, turns)
+
+            with self._lock:
+                if history.epoch != epoch:
+                    return  # Conversation was reset while we were summarizing
+                history.summary = new_summary
+                del history.pending[:len(turns)]
+        logger.info(
+            "[AGENT] Folded %d turn(s) into summary for %s (%d chars)",
+            len(turns), thread_id, len(new_summary)
+        )
+
+    def _summarize(self, summary: str, turns: List[Turn]) -> str:
+        if not AGENT_HISTORY_SUMMARY:
+            return _extractive_summary(summary, turns)
+        transcript = "\n\n".join(render_turn(turn) for turn in turns)
+        prompt = f"""You maintain the running summary of a murder mystery game session.
+Update the summary with the new exchanges below. Keep every fact the player learned:
+who was questioned, what they claimed (times, places), clues found, accusations made,
+and open leads. Drop greetings and atmosphere. Write terse bullet points, at most
+{SUMMARY_MAX_CHARS} characters.
+
+CURRENT SUMMARY:
+{summary or "(empty)"}
+
+NEW EXCHANGES:
+{transcript}
+
+UPDATED SUMMARY:"""
+        try:
+            from services.llm_clients import get_chat_model
+
+            response = get_chat_model(AGENT_SUMMARY_MODEL, temperature=0).invoke(prompt)
+            text = (response.content or "").strip()
+            if text:
+                return text[:SUMMARY_MAX_CHARS]
+        except Exception as e:
+            logger.warning("[AGENT] Summary update failed, using extractive fallback: %s", e)
+        return _extractive_summary(summary, turns)
+
+    def flush(self, thread_id: str, timeout: Optional[float] = None):
+        """Wait for the thread's pending summary update (scripts and shutdown)."""
+        future = self._get(thread_id).future
+        if future is not None:
+            future.result(timeout=timeout)
+
+    def reset(self, thread_id: str):
+        """Forget a thread's summary; checkpointed history from before is ignored."""
+        history = self._get(thread_id)
+        with self._lock:
+            history.summary = ""
+            history.pending = []
+            history.epoch = uuid.uuid4().hex
+
+
+_conversation_history: Optional[ConversationHistory] = None
+_history_lock = threading.Lock()
+
+
+def get_conversation_history() -> ConversationHistory:
+    """Get the process-wide conversation history store."""
+    global _conversation_history
+    with _history_lock:
+        if _conversation_history is None:
+            _conversation_history = ConversationHistory(
+                max_workers=int(os.getenv("AGENT_SUMMARY_WORKERS", "2"))
+            )
+        return _conversation_history
+
+
+def reset_conversation_history(thread_id: str):
+    """Start a fresh conversation for a thread (new game in the same session)."""
+    get_conversation_history().reset(thread_id)
@@ -105,8 +105,11 @@ def set_session_key(
         keys.openai_key = key_value if key_value else None
         keys._user_provided["openai"] = bool(key_value)
         # Update environment for this session's processes
-        if key_value:
+        if key_value and os.environ.get("OPENAI_API_KEY") != key_value:
             os.environ["OPENAI_API_KEY"] = key_value
+            # Pooled chat clients are keyed by API key; the old key's are dead weight
+            from services.llm_clients import clear_clients
+            clear_clients()
         logger.info("OpenAI key %s for session %s", 
                    "set" if key_value else "cleared", 
                    session_id[:8])
@@ -0,0 +1,431 @@
+"""Bounded, persistent LangGraph checkpointer for the Game Master agent.
+
+``MemorySaver`` keeps every checkpoint of every thread in RAM for the life of
+the process. The Game Master only ever resumes from the latest checkpoint of
+a thread, so ``LatestCheckpointSaver`` stores just that one per thread (plus
+its pending writes) in SQLite, and evicts threads that have been idle for
+longer than ``idle_ttl`` or exceed ``max_threads``.
+
+With a file path, agent threads survive a server restart. With ``":memory:"``
+the store is still bounded but process-local.
+
+Usage:
+    from services.checkpoint_store import get_checkpointer
+
+    app = workflow.compile(checkpointer=get_checkpointer())       # AGENT_CHECKPOINTER
+    app = workflow.compile(checkpointer=get_checkpointer("memory"))
+"""
+
+import asyncio
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    parent_id TEXT,
+    checkpoint_type TEXT NOT NULL,
+    checkpoint BLOB NOT NULL,
+    metadata_type TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns)
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    version TEXT NOT NULL,
+    value_type TEXT NOT NULL,
+    value BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, channel)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    value_type TEXT NOT NULL,
+    value BLOB,
+    task_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+CREATE INDEX IF NOT EXISTS checkpoints_updated ON checkpoints (updated_at);
+"""
+
+# How often (in puts) idle threads are swept
+_EVICT_EVERY = 50
+
+
+class LatestCheckpointSaver(BaseCheckpointSaver[str]):
+    """SQLite checkpointer that keeps only the latest checkpoint per thread."""
+
+    def __init__(
+        self,
+        db_path: str = ":memory:",
+        max_threads: int = 1000,
+        idle_ttl: float = 24 * 3600,
+        *,
+        serde=None,
+    ):
+        super().__init__(serde=serde)
+        self.db_path = db_path
+        self.max_threads = max_threads
+        self.idle_ttl = idle_ttl
+        self._lock = threading.Lock()
+        self._puts = 0
+
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        with self._lock:
+            row = self._db.execute(
+                "SELECT checkpoint_id, parent_id, checkpoint_type, checkpoint, "
+                "metadata_type, metadata FROM checkpoints "
+                "WHERE thread_id = ? AND checkpoint_ns = ?",
+                (thread_id, checkpoint_ns),
+            ).fetchone()
+            if row is None:
+                return None
+            checkpoint_id, parent_id = row[0], row[1]
+            requested_id = get_checkpoint_id(config)
+            if requested_id and requested_id != checkpoint_id:
+                return None  # Older checkpoints are not retained
+            blobs = self._db.execute(
+                "SELECT channel, version, value_type, value FROM blobs "
+                "WHERE thread_id = ? AND checkpoint_ns = ?",
+                (thread_id, checkpoint_ns),
+            ).fetchall()
+            writes = self._db.execute(
+                "SELECT task_id, channel, value_type, value FROM writes "
+                "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? "
+                "ORDER BY task_path, task_id, idx",
+                (thread_id, checkpoint_ns, checkpoint_id),
+            ).fetchall()
+
+        checkpoint: Checkpoint = self.serde.loads_typed((row[2], row[3]))
+        versions = checkpoint["channel_versions"]
+        checkpoint["channel_values"] = {
+            channel: self.serde.loads_typed((value_type, value))
+            for channel, version, value_type, value in blobs
+            if value_type != "empty" and versions.get(channel) == version
+        }
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=checkpoint,
+            metadata=self.serde.loads_typed((row[4], row[5])),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_id,
+                    }
+                }
+                if parent_id
+                else None
+            ),
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed((value_type, value)))
+                for task_id, channel, value_type, value in writes
+            ],
+        )
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        if config:
+            keys = [(config["configurable"]["thread_id"], config["configurable"].get("checkpoint_ns"))]
+        else:
+            with self._lock:
+                keys = self._db.execute(
+                    "SELECT thread_id, checkpoint_ns FROM checkpoints ORDER BY updated_at DESC"
+                ).fetchall()
+
+        before_id = get_checkpoint_id(before) if before else None
+        count = 0
+        for thread_id, checkpoint_ns in keys:
+            if checkpoint_ns is None:
+                with self._lock:
+                    namespaces = [
+                        ns for (ns,) in self._db.execute(
+                            "SELECT checkpoint_ns FROM checkpoints WHERE thread_id = ?",
+                            (thread_id,),
+                        ).fetchall()
+                    ]
+            else:
+                namespaces = [checkpoint_ns]
+            for ns in namespaces:
+                lookup = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ns}}
+                if config and get_checkpoint_id(config):
+                    lookup["configurable"]["checkpoint_id"] = get_checkpoint_id(config)
+                checkpoint_tuple = self.get_tuple(lookup)
+                if checkpoint_tuple is None:
+                    continue
+                if before_id and checkpoint_tuple.checkpoint["id"] >= before_id:
+                    continue
+                if filter and not all(
+                    checkpoint_tuple.metadata.get(k) == v for k, v in filter.items()
+                ):
+                    continue
+                yield checkpoint_tuple
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        parent_id = config["configurable"].get("checkpoint_id")
+
+        c = checkpoint.copy()
+        values: Dict[str, Any] = c.pop("channel_values")  # type: ignore[misc]
+        checkpoint_type, checkpoint_blob = self.serde.dumps_typed(c)
+        metadata_type, metadata_blob = self.serde.dumps_typed(
+            get_checkpoint_metadata(config, metadata)
+        )
+        blob_rows = []
+        for channel, version in new_versions.items():
+            value_type, value = (
+                self.serde.dumps_typed(values[channel]) if channel in values else ("empty", b"")
+            )
+            blob_rows.append((thread_id, checkpoint_ns, channel, str(version), value_type, value))
+
+        with self._lock:
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        thread_id, checkpoint_ns, checkpoint["id"], parent_id,
+                        checkpoint_type, checkpoint_blob, metadata_type, metadata_blob,
+                        time.time(),
+                    ),
+                )
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?, ?)", blob_rows
+                )
+                # Writes of superseded checkpoints are never read again
+                self._db.execute(
+                    "DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? "
+                    "AND checkpoint_id != ?",
+                    (thread_id, checkpoint_ns, checkpoint["id"]),
+                )
+            self._puts += 1
+            if self._puts % _EVICT_EVERY == 0:
+                self._evict_locked()
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            value_type, blob = self.serde.dumps_typed(value)
+            rows.append((
+                thread_id, checkpoint_ns, checkpoint_id, task_id,
+                WRITES_IDX_MAP.get(channel, idx), channel, value_type, blob, task_path,
+            ))
+        # Special writes (errors, interrupts...) replace; regular writes keep the first
+        verb = "REPLACE" if all(channel in WRITES_IDX_MAP for channel, _ in writes) else "IGNORE"
+        with self._lock:
+            with self._db:
+                self._db.executemany(
+                    f"INSERT OR {verb} INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            with self._db:
+                for table in ("checkpoints", "blobs", "writes"):
+                    self._db.execute(f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+
+    def _evict_locked(self):
+        """Drop idle threads and the least recently used ones beyond max_threads."""
+        cutoff = time.time() - self.idle_ttl
+        stale = [
+            thread_id for (thread_id,) in self._db.execute(
+                "SELECT DISTINCT thread_id FROM checkpoints WHERE updated_at < ?", (cutoff,)
+            ).fetchall()
+        ]
+        overflow = [
+            thread_id for (thread_id,) in self._db.execute(
+                "SELECT thread_id FROM checkpoints GROUP BY thread_id "
+                "ORDER BY MAX(updated_at) DESC LIMIT -1 OFFSET ?",
+                (self.max_threads,),
+            ).fetchall()
+        ]
+        evicted = set(stale) | set(overflow)
+        if not evicted:
+            return
+        with self._db:
+            for table in ("checkpoints", "blobs", "writes"):
+                self._db.executemany(
+                    f"DELETE FROM {table} WHERE thread_id = ?", [(t,) for t in evicted]
+                )
+        logger.info("[AGENT] Evicted %d idle checkpoint thread(s)", len(evicted))
+
+    def get_next_version(self, current: Optional[str], channel: None = None) -> str:
+        # Same scheme as InMemorySaver: zero-padded counter + random suffix
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    # -------------------------------------------------------------------------
+    # Async API (SQLite calls are short; run them off the event loop)
+    # -------------------------------------------------------------------------
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+
+_checkpointers: Dict[str, BaseCheckpointSaver] = {}
+_checkpointers_lock = threading.Lock()
+
+
+def get_checkpointer(kind: Optional[str] = None) -> BaseCheckpointSaver:
+    """Get the shared checkpointer for the Game Master agent.
+
+    Args:
+        kind: "sqlite" (latest checkpoint per thread, persistent and bounded) or
+            "memory" (LangGraph MemorySaver, unbounded). Defaults to the
+            AGENT_CHECKPOINTER environment variable, then "sqlite".
+
+    All agents share one instance per kind, so a session's thread resumes no
+    matter which cached agent handles the turn.
+    """
+    kind = (kind or os.getenv("AGENT_CHECKPOINTER", "sqlite")).lower()
+    with _checkpointers_lock:
+        saver = _checkpointers.get(kind)
+        if saver is not None:
+            return saver
+
+        if kind == "memory":
+            from langgraph.checkpoint.memory import MemorySaver
+            saver = MemorySaver()
+        elif kind == "sqlite":
+            db_path = os.getenv("AGENT_CHECKPOINT_DB", ".cache/agent_checkpoints.sqlite")
+            kwargs = {
+                "max_threads": int(os.getenv("AGENT_CHECKPOINT_MAX_THREADS", "1000")),
+                "idle_ttl": float(os.getenv("AGENT_CHECKPOINT_IDLE_TTL", str(24 * 3600))),
+            }
+            try:
+                saver = LatestCheckpointSaver(db_path, **kwargs)
+                logger.info("[AGENT] Checkpoints stored in %s", db_path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(
+                    "[AGENT] Checkpoint file unavailable (%s): %s - keeping them in memory",
+                    db_path, e
+                )
+                saver = LatestCheckpointSaver(":memory:", **kwargs)
+        else:
+            raise ValueError(f"Unknown AGENT_CHECKPOINTER '{kind}' (use 'sqlite' or 'memory')")
+
+        _checkpointers[kind] = saver
+        return saver
@@ -0,0 +1,252 @@
+"""Content-hashed embedding cache and request micro-batcher for GameMemory.
+
+Every add/search in GameMemory needs an embedding. Many of those texts repeat
+(fixed hint queries, re-asked questions), and concurrent sessions often need
+embeddings at the same moment. This module sits between the vector store and
+the embedding provider:
+
+- ``EmbeddingCache``: in-memory LRU keyed by sha256(model + text), with an
+  optional SQLite store so vectors survive restarts.
+- ``EmbeddingBatcher``: coalesces texts requested by different threads within
+  a few milliseconds into a single embeddings API call.
+- ``CachedEmbeddings``: LangChain-compatible ``Embeddings`` that combines both.
+
+Usage:
+    from services.embedding_cache import CachedEmbeddings
+
+    embeddings = CachedEmbeddings(OpenAIEmbeddings(model=...), model=...)
+    FAISS.from_texts(texts, embeddings)
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+Vector = List[float]
+
+
+def embedding_key(model: str, text: str) -> str:
+    """Stable content hash for a (model, text) pair."""
+    return hashlib.sha256(f"{model}\x00{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Thread-safe LRU of embedding vectors with an optional SQLite backing store."""
+
+    def __init__(self, max_entries: int = 20000, db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self._entries: "OrderedDict[str, Vector]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+        if db_path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+                self._db = sqlite3.connect(db_path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)"
+                )
+                self._db.commit()
+                logger.info("[RAG] Embedding disk cache at %s", db_path)
+            except sqlite3.Error as e:
+                logger.warning("[RAG] Embedding disk cache unavailable (%s): %s", db_path, e)
+                self._db = None
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Vector]:
+        """Look up several keys, returning only the ones that are cached."""
+        found: Dict[str, Vector] = {}
+        missing: List[str] = []
+        with self._lock:
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = vector
+                else:
+                    missing.append(key)
+
+            if missing and self._db is not None:
+                for key in missing:
+                    row = self._db.execute(
+                        "SELECT vector FROM embeddings WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row:
+                        vector = array("f", row[0]).tolist()
+                        found[key] = vector
+                        self._put_locked(key, vector)
+
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, items: Dict[str, Vector]):
+        """Store freshly computed vectors in memory and on disk."""
+        if not items:
+            return
+        with self._lock:
+            for key, vector in items.items():
+                self._put_locked(key, vector)
+            if self._db is not None:
+                try:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                        [(k, array("f", v).tobytes()) for k, v in items.items()],
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning("[RAG] Failed to persist embeddings: %s", e)
+
+    def _put_locked(self, key: str, vector: Vector):
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters for logging."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+            }
+
+
+class EmbeddingBatcher:
+    """Coalesce concurrent embedding requests into one provider call.
+
+    Callers block on ``embed(texts)``. A single worker thread waits up to
+    ``max_wait_ms`` after the first pending request for more texts to arrive,
+    then sends everything (deduplicated, up to ``max_batch``) in one call.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[List[str]], List[Vector]],
+        max_batch: int = 64,
+        max_wait_ms: float = 5.0,
+    ):
+        self._embed_fn = embed_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: "queue.Queue[tuple[str, Future]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.batches = 0
+
+    def embed(self, texts: Sequence[str]) -> List[Vector]:
+        """Embed texts, sharing the request with any other pending callers."""
+        if not texts:
+            return []
+        self._ensure_worker()
+        futures = []
+        for text in texts:
+            future: Future = Future()
+            self._queue.put((text, future))
+            futures.append(future)
+        return [f.result() for f in futures]
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._start_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="embedding-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            pending = [self._queue.get()]
+            while len(pending) < self.max_batch:
+                try:
+                    pending.append(self._queue.get(timeout=self.max_wait))
+                except queue.Empty:
+                    break
+
+            unique = list(dict.fromkeys(text for text, _ in pending))
+            try:
+                vectors = dict(zip(unique, self._embed_fn(unique)))
+                self.batches += 1
+                if len(pending) > 1:
+                    logger.debug(
+                        "[RAG] Embedded batch of %d texts (%d requests)",
+                        len(unique), len(pending)
+                    )
+                for text, future in pending:
+                    future.set_result(vectors[text])
+            except Exception as e:  # noqa: BLE001
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+
+
+class CachedEmbeddings:
+    """LangChain ``Embeddings`` wrapper adding a content-hash cache and batching.
+
+    Registered as a virtual subclass of ``langchain_core.embeddings.Embeddings``
+    by ``register_with_langchain()`` so vector stores treat it as a native
+    embeddings object without this module importing LangChain eagerly.
+    """
+
+    def __init__(
+        self,
+        embeddings,
+        model: str,
+        cache: Optional[EmbeddingCache] = None,
+        batcher: Optional[EmbeddingBatcher] = None,
+    ):
+        self.embeddings = embeddings
+        self.model = model
+        self.cache = cache or EmbeddingCache()
+        self.batcher = batcher or EmbeddingBatcher(embeddings.embed_documents)
+
+    def embed_documents(self, texts: List[str]) -> List[Vector]:
+        keys = [embedding_key(self.model, t) for t in texts]
+        cached = self.cache.get_many(keys)
+
+        missing = {k: t for k, t in zip(keys, texts) if k not in cached}
+        if missing:
+            fresh = dict(zip(missing.keys(), self.batcher.embed(list(missing.values()))))
+            self.cache.put_many(fresh)
+            cached.update(fresh)
+
+        return [cached[k] for k in keys]
+
+    def embed_query(self, text: str) -> Vector:
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[Vector]:
+        return await asyncio.to_thread(self.embed_documents, texts)
+
+    async def aembed_query(self, text: str) -> Vector:
+        return await asyncio.to_thread(self.embed_query, text)
+
+
+_registered = False
+
+
+def register_with_langchain():
+    """Make ``CachedEmbeddings`` pass LangChain's ``isinstance(x, Embeddings)`` checks."""
+    global _registered
+    if _registered:
+        return
+    from langchain_core.embeddings import Embeddings
+    Embeddings.register(CachedEmbeddings)
+    _registered = True
@@ -7,33 +7,46 @@ the structured state in GameState. The Game Master uses this to:
 - Retrieve cross-references (what other suspects said about someone)
 """
 
+import bisect
+import hashlib
+import json
 import logging
+import math
+import os
+import re
+import shutil
+import sys
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from pydantic import BaseModel, Field
 
+from services.embedding_cache import CachedEmbeddings, EmbeddingCache, register_with_langchain
+from services.lexical_index import BM25Index
+
 logger = logging.getLogger(__name__)
 
 # Lazy imports for optional dependencies
 _faiss_available = None
-_embeddings = None
 _vectorstore_class = None
 
 
 def _check_faiss():
     """Check if FAISS is available and import dependencies."""
-    global _faiss_available, _embeddings, _vectorstore_class
+    global _faiss_available, _vectorstore_class
     
     if _faiss_available is not None:
         return _faiss_available
     
     try:
         from langchain_community.vectorstores import FAISS
-        from langchain_openai import OpenAIEmbeddings
+        register_with_langchain()
         _vectorstore_class = FAISS
-        _embeddings = OpenAIEmbeddings
         _faiss_available = True
-        logger.info("[RAG] FAISS and embeddings available")
+        logger.info("[RAG] FAISS available")
     except ImportError as e:
         _faiss_available = False
         logger.warning("[RAG] FAISS not available: %s", e)
@@ -41,6 +54,196 @@ def _check_faiss():
     return _faiss_available
 
 
+# Shared executor for write-behind indexing across all sessions
+_index_executor: Optional[ThreadPoolExecutor] = None
+_index_executor_lock = threading.Lock()
+
+
+def _get_index_executor() -> ThreadPoolExecutor:
+    """Get the bounded pool that embeds and inserts documents in the background."""
+    global _index_executor
+    if _index_executor is None:
+        with _index_executor_lock:
+            if _index_executor is None:
+                _index_executor = ThreadPoolExecutor(
+                    max_workers=int(os.getenv("GAME_MEMORY_INDEX_WORKERS", "4")),
+                    thread_name_prefix="rag-index",
+                )
+    return _index_executor
+
+
+# ============================================================================
+# Embedding providers
+# ============================================================================
+# A provider is a factory returning (client, model_name). The client only needs
+# ``embed_documents(texts) -> List[List[float]]``. Select one with the
+# GAME_MEMORY_EMBEDDINGS environment variable ("openai" by default, "hashing"
+# for a deterministic offline backend used in tests and benchmarks).
+
+# Use a small, fast embedding model optimized for speed and cost.
+# text-embedding-3-small is sufficient for our RAG needs here.
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+
+class HashingEmbeddings:
+    """Deterministic local embeddings using the hashing trick.
+
+    Words, word bigrams and character trigrams are hashed (blake2b, so results
+    are stable across processes) into a fixed number of signed buckets and
+    L2-normalized. No network, no model weights - quality is lexical rather
+    than semantic, which is enough to exercise and benchmark the RAG stack.
+    """
+
+    def __init__(self, dimensions: int = 384):
+        self.dimensions = dimensions
+
+    @property
+    def model(self) -> str:
+        return f"local-hashing-{self.dimensions}"
+
+    def _features(self, text: str) -> List[Tuple[str, float]]:
+        words = re.findall(r"[a-z0-9']+", text.lower())
+        features = [(w, 1.0) for w in words]
+        features += [(f"{a} {b}", 0.5) for a, b in zip(words, words[1:])]
+        for word in words:
+            padded = f"#{word}#"
+            features += [(padded[i:i + 3], 0.25) for i in range(len(padded) - 2)]
+        return features
+
+    def embed_query(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimensions
+        for feature, weight in self._features(text):
+            digest = int.from_bytes(
+                hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little"
+            )
+            sign = 1.0 if digest & 1 else -1.0
+            vector[(digest >> 1) % self.dimensions] += sign * weight
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_query(text) for text in texts]
+
+
+def _create_openai_embeddings():
+    from langchain_openai import OpenAIEmbeddings
+    return OpenAIEmbeddings(model=EMBEDDING_MODEL), EMBEDDING_MODEL
+
+
+def _create_hashing_embeddings():
+    client = HashingEmbeddings(int(os.getenv("GAME_MEMORY_HASHING_DIM", "384")))
+    return client, client.model
+
+
+_embedding_providers: Dict[str, Callable[[], Tuple[object, str]]] = {
+    "openai": _create_openai_embeddings,
+    "hashing": _create_hashing_embeddings,
+}
+
+
+def register_embedding_provider(name: str, factory: Callable[[], Tuple[object, str]]):
+    """Register an embedding backend selectable via GAME_MEMORY_EMBEDDINGS.
+
+    Args:
+        name: Provider name (case-insensitive)
+        factory: Callable returning (client, model_name); the client must
+            implement ``embed_documents(texts)``.
+    """
+    _embedding_providers[name.lower()] = factory
+
+
+def get_embedding_provider_name() -> str:
+    """Name of the configured embedding provider."""
+    return os.getenv("GAME_MEMORY_EMBEDDINGS", "openai").strip().lower()
+
+
+# One cache shared by every session (content-hashed, so safe to share) and one
+# cached/batched client per provider and API key, since players may supply
+# their own keys.
+_embedding_cache: Optional[EmbeddingCache] = None
+_cached_embeddings: Dict[Tuple[str, Optional[str]], CachedEmbeddings] = {}
+_embeddings_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the process-wide embedding cache (created on first use)."""
+    global _embedding_cache
+    with _embeddings_lock:
+        if _embedding_cache is None:
+            _embedding_cache = EmbeddingCache(
+                max_entries=int(os.getenv("GAME_MEMORY_EMBEDDING_CACHE_SIZE", "20000")),
+                db_path=os.getenv("GAME_MEMORY_EMBEDDING_CACHE") or None,
+            )
+        return _embedding_cache
+
+
+def _get_embeddings() -> CachedEmbeddings:
+    """Get the cached, batched embeddings client for the configured provider."""
+    cache = get_embedding_cache()
+    provider = get_embedding_provider_name()
+    if provider not in _embedding_providers:
+        raise ValueError(
+            f"Unknown GAME_MEMORY_EMBEDDINGS provider '{provider}' "
+            f"(available: {', '.join(sorted(_embedding_providers))})"
+        )
+    key = (provider, os.getenv("OPENAI_API_KEY"))
+    with _embeddings_lock:
+        embeddings = _cached_embeddings.get(key)
+        if embeddings is None:
+            client, model = _embedding_providers[provider]()
+            embeddings = CachedEmbeddings(client, model=model, cache=cache)
+            _cached_embeddings[key] = embeddings
+            logger.info("[RAG] Using %s embeddings (%s)", provider, model)
+        return embeddings
+
+
+# Partition keys. Each suspect's statements live in their own FAISS index so a
+# suspect-scoped search only scans that suspect's history; clues share one index
+# and any other document type lands in the system partition.
+CLUE_PARTITION = "clues"
+SYSTEM_PARTITION = "system"
+_SUSPECT_PREFIX = "suspect:"
+
+
+def suspect_partition(suspect: str) -> str:
+    """Partition key holding a suspect's conversation history."""
+    return f"{_SUSPECT_PREFIX}{suspect.strip().lower()}"
+
+
+def _partition_for(metadata: Dict) -> str:
+    """Choose the partition a document is stored in from its metadata."""
+    doc_type = metadata.get("type")
+    if doc_type == "conversation" and metadata.get("suspect"):
+        return suspect_partition(metadata["suspect"])
+    if doc_type == "clue":
+        return CLUE_PARTITION
+    return SYSTEM_PARTITION
+
+
+def _lexical_text(text: str, metadata: Dict) -> str:
+    """Text indexed by BM25 for a document.
+
+    Conversations use the full question and answer (the embedded text is a
+    truncated snippet that also names the speaker, which would make every
+    statement look like a mention of its own speaker).
+    """
+    if metadata.get("type") == "conversation":
+        return f"{metadata.get('question', '')} {metadata.get('answer', '')}"
+    return f"{text} {metadata.get('location', '')}"
+
+
+def _rrf_fuse(ranked_lists: List[List[Tuple[str, Dict]]], k: int) -> List[Tuple[str, Dict]]:
+    """Reciprocal rank fusion of several (text, metadata) result lists."""
+    scores: Dict[str, float] = {}
+    items: Dict[str, Tuple[str, Dict]] = {}
+    for results in ranked_lists:
+        for rank, item in enumerate(results):
+            scores[item[0]] = scores.get(item[0], 0.0) + 1.0 / (60 + rank)
+            items.setdefault(item[0], item)
+    ranked = sorted(scores, key=scores.get, reverse=True)
+    return [items[text] for text in ranked[:k]]
+
+
 class ContradictionResult(BaseModel):
     """Result of contradiction analysis."""
     is_contradiction: bool = False
@@ -63,18 +266,90 @@ class GameMemory:
     assemble rich context for stateless suspect agents.
     """
     
+    # Rough per-document cost of a text-embedding-3-small vector (1536 x float32)
+    _EMBEDDING_BYTES = 1536 * 4
+    # On-disk layout version for save()/load()
+    SNAPSHOT_VERSION = 1
+    # Max cached search results per session
+    RESULT_CACHE_SIZE = 128
+
     def __init__(self):
-        self.vectorstore = None
+        self.partitions: Dict[str, object] = {}  # partition key -> FAISS store
         self.documents: List[Dict] = []  # Backup of all indexed docs
+        # Secondary indexes maintained on insert so lookups never scan documents
+        self._history_by_suspect: Dict[str, List[Dict]] = {}  # turn-ordered metadata
+        self._docs_by_type: Dict[str, List[Dict]] = {}
+        self._documents_by_id: Dict[str, Dict] = {}
+        # BM25 over names/locations/times; updated synchronously, no embeddings
+        self._lexical = BM25Index()
+        # Guards documents, the secondary indexes and the BM25 index, which
+        # concurrent tool calls may write and search at the same time
+        self._records_lock = threading.RLock()
+        # Vector search results keyed by (query, partitions, k). Entries are
+        # tagged with the index version and ignored once any insert bumps it.
+        self._index_version = 0
+        self._result_cache: "OrderedDict[Tuple, Tuple[int, List]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        self.result_cache_hits = 0
+        self.result_cache_misses = 0
         self._initialized = False
-        
+        self._approx_bytes = 0
+        self.last_used = time.monotonic()
+        self._embeddings: Optional[CachedEmbeddings] = None
+        # Vector inserts run on the shared index executor (write-behind).
+        # _store_lock guards the FAISS store; _pending tracks queued inserts
+        # so flush() can act as a read-your-writes barrier.
+        self._store_lock = threading.RLock()
+        self._pending: Set[Future] = set()
+        self._pending_lock = threading.Lock()
+        self._generation = 0
+
+    def touch(self):
+        """Record that this memory was just used (for idle eviction)."""
+        self.last_used = time.monotonic()
+
+    def estimated_bytes(self) -> int:
+        """Approximate RAM held by this memory (vectors + document text)."""
+        return self._approx_bytes
+
+    def _record_document(self, text: str, metadata: Dict, doc_id: Optional[str] = None) -> Dict:
+        """Keep a backup copy of an indexed document and update the size estimate.
+
+        The document id is shared with the vector store so snapshots can match
+        stored vectors back to their documents.
+        """
+        document = {"id": doc_id or uuid.uuid4().hex, "text": text, "metadata": metadata}
+        lexical_text = _lexical_text(text, metadata)
+        with self._records_lock:
+            self._bump_index_version()
+            self.documents.append(document)
+            self._documents_by_id[document["id"]] = document
+            self._lexical.add(document["id"], lexical_text)
+            self._docs_by_type.setdefault(metadata.get("type"), []).append(document)
+            if metadata.get("type") == "conversation" and metadata.get("suspect"):
+                # Turns almost always arrive in order, so this is an O(1) append
+                history = self._history_by_suspect.setdefault(metadata["suspect"], [])
+                bisect.insort_right(history, metadata, key=lambda m: m.get("turn", 0))
+            self._approx_bytes += self._EMBEDDING_BYTES + sys.getsizeof(text) + sum(
+                sys.getsizeof(v) for v in metadata.values() if isinstance(v, str)
+            )
+        return document
+
+    @property
+    def is_initialized(self) -> bool:
+        """True once initialize() (or load()) has run for the current game."""
+        return self._initialized
+
     @property
     def is_available(self) -> bool:
         """Check if RAG functionality is available."""
         return _check_faiss() and self._initialized
     
     def initialize(self) -> bool:
-        """Initialize empty vectorstore.
+        """Prepare the memory for a new game.
+        
+        No network call is made here: partitions are created lazily on their
+        first insert, and searches over an empty memory return immediately.
         
         Returns:
             True if initialization succeeded, False otherwise.
@@ -84,15 +359,8 @@ class GameMemory:
             return False
         
         try:
-            # Use a small, fast embedding model optimized for speed and cost.
-            # text-embedding-3-small is sufficient for our RAG needs here.
-            embeddings = _embeddings(model="text-embedding-3-small")
-            # Initialize with a placeholder document (FAISS requires at least one)
-            self.vectorstore = _vectorstore_class.from_texts(
-                ["Game memory initialized. No conversations recorded yet."],
-                embeddings,
-                metadatas=[{"type": "system", "suspect": None, "turn": -1}]
-            )
+            self._embeddings = _get_embeddings()
+            self.partitions = {}
             self._initialized = True
             logger.info("[RAG] GameMemory initialized successfully")
             return True
@@ -111,6 +379,9 @@ class GameMemory:
     ) -> bool:
         """Index a conversation exchange for semantic search.
         
+        The exchange is recorded immediately and embedded on a background
+        worker; searches call flush() first so they still see it.
+        
         Args:
             suspect: Name of the suspect
             question: Player's question
@@ -119,7 +390,7 @@ class GameMemory:
             metadata: Optional additional metadata
             
         Returns:
-            True if indexing succeeded, False otherwise.
+            True if the exchange was accepted for indexing, False otherwise.
         """
         if not self.is_available:
             logger.debug("[RAG] Skipping indexing - not available")
@@ -162,14 +433,11 @@ class GameMemory:
                 **(metadata or {})
             }
             
-            t0 = time.perf_counter()
-            self.vectorstore.add_texts([doc], metadatas=[doc_metadata])
-            embed_ms = (time.perf_counter() - t0) * 1000
-            self.documents.append({"text": doc, "metadata": doc_metadata})
+            self._enqueue_index(self._record_document(doc, doc_metadata))
             
             logger.info(
-                "[RAG] [PERF] Indexed conversation with %s (turn %d, %d total docs) – embed %.0fms, doc %d chars",
-                suspect, turn, len(self.documents), embed_ms, len(doc)
+                "[RAG] Queued conversation with %s for indexing (turn %d, %d total docs, doc %d chars)",
+                suspect, turn, len(self.documents), len(doc)
             )
             return True
             
@@ -213,49 +481,311 @@ class GameMemory:
                 "turn": turn
             }
             
-            self.vectorstore.add_texts([doc], metadatas=[doc_metadata])
-            self.documents.append({"text": doc, "metadata": doc_metadata})
+            self._enqueue_index(self._record_document(doc, doc_metadata))
             
-            logger.info("[RAG] Indexed clue %s from %s", clue_id, location)
+            logger.info("[RAG] Queued clue %s from %s for indexing", clue_id, location)
             return True
             
         except Exception as e:
             logger.error("[RAG] Failed to index clue: %s", e)
             return False
     
+    def _enqueue_index(self, document: Dict):
+        """Embed and insert a document on the background index executor.
+
+        The caller returns immediately; use flush() to wait for the insert.
+        """
+        generation = self._generation
+        future = _get_index_executor().submit(self._index_document, document, generation)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard_pending)
+
+    def _discard_pending(self, future: Future):
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    def _insert_vectors(self, key: str, documents: List[Dict], vectors):
+        """Insert precomputed vectors into a partition, creating it if needed.
+
+        Caller must hold ``_store_lock``.
+        """
+        self._bump_index_version()
+        text_embeddings = [(d["text"], v) for d, v in zip(documents, vectors)]
+        metadatas = [d["metadata"] for d in documents]
+        ids = [d["id"] for d in documents]
+        store = self.partitions.get(key)
+        if store is None:
+            # Partitions are created on first insert from the precomputed vector
+            self.partitions[key] = _vectorstore_class.from_embeddings(
+                text_embeddings, self._embeddings, metadatas=metadatas, ids=ids
+            )
+        else:
+            store.add_embeddings(text_embeddings, metadatas=metadatas, ids=ids)
+
+    def _index_document(self, document: Dict, generation: int):
+        """Background job: embed outside the store lock, then insert the vector."""
+        if generation != self._generation or self._embeddings is None:
+            return
+        metadata = document["metadata"]
+        try:
+            t0 = time.perf_counter()
+            vector = self._embeddings.embed_documents([document["text"]])[0]
+            embed_ms = (time.perf_counter() - t0) * 1000
+            with self._store_lock:
+                # Memory was cleared while we were embedding - drop the write
+                if generation != self._generation or not self._initialized:
+                    return
+                self._insert_vectors(_partition_for(metadata), [document], [vector])
+            logger.info(
+                "[RAG] [PERF] Indexed %s doc (turn %s) in background – embed %.0fms",
+                metadata.get("type"), metadata.get("turn"), embed_ms
+            )
+        except Exception as e:
+            logger.error("[RAG] Background indexing failed: %s", e)
+
+    @property
+    def pending_writes(self) -> int:
+        """Number of documents accepted but not yet inserted into the index."""
+        with self._pending_lock:
+            return len(self._pending)
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until every queued document is searchable.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            True if all pending writes completed within the timeout.
+        """
+        with self._pending_lock:
+            pending = list(self._pending)
+        if not pending:
+            return True
+        t0 = time.perf_counter()
+        _, not_done = wait(pending, timeout=timeout)
+        wait_ms = (time.perf_counter() - t0) * 1000
+        if not_done:
+            logger.warning(
+                "[RAG] flush() timed out after %.0fms with %d writes pending",
+                wait_ms, len(not_done)
+            )
+            return False
+        logger.info("[RAG] [PERF] flush() waited %.0fms for %d writes", wait_ms, len(pending))
+        return True
+
+    def _partitions_for_type(self, filter_type: Optional[str]) -> List[str]:
+        """Partition keys that can contain documents of the given type.
+
+        Callers flush first so partitions created by pending writes are included.
+        """
+        with self._store_lock:
+            keys = list(self.partitions.keys())
+        if filter_type is None:
+            return keys
+        if filter_type == "conversation":
+            return [key for key in keys if key.startswith(_SUSPECT_PREFIX)]
+        if filter_type == "clue":
+            return [key for key in keys if key == CLUE_PARTITION]
+        return [key for key in keys if key == SYSTEM_PARTITION]
+
+    @property
+    def index_version(self) -> int:
+        """Monotonic counter bumped on every insert; used to invalidate cached results."""
+        return self._index_version
+
+    def _bump_index_version(self):
+        with self._result_cache_lock:
+            self._index_version += 1
+
+    def _fan_out_search(
+        self, query: str, keys: List[str], k: int, filter_type: Optional[str] = None
+    ):
+        """Search several partitions with one query embedding and merge by distance.
+
+        Returns the k closest documents overall, only of ``filter_type`` if
+        given (the system partition mixes types). Results are cached until the
+        next insert, so repeated queries between turns cost nothing. Callers
+        flush pending writes once before searching.
+        """
+        if not keys or not self.partitions:
+            # Empty-index fast path: nothing to search, so skip the query embedding
+            return []
+        cache_key = (query, tuple(sorted(set(keys))), k, filter_type or None)
+        with self._result_cache_lock:
+            version = self._index_version
+            cached = self._result_cache.get(cache_key)
+            if cached is not None and cached[0] == version:
+                self._result_cache.move_to_end(cache_key)
+                self.result_cache_hits += 1
+                return list(cached[1])
+            self.result_cache_misses += 1
+
+        results = self._fan_out_search_uncached(query, keys, k, filter_type)
+
+        with self._result_cache_lock:
+            self._result_cache[cache_key] = (version, results)
+            self._result_cache.move_to_end(cache_key)
+            while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return list(results)
+
+    def _fan_out_search_uncached(
+        self, query: str, keys: List[str], k: int, filter_type: Optional[str] = None
+    ):
+        with self._store_lock:
+            stores = [self.partitions[key] for key in keys if key in self.partitions]
+        if not stores:
+            return []
+
+        vector = self._embeddings.embed_query(query)
+        search_kwargs = {"filter": {"type": filter_type}} if filter_type else {}
+        scored = []
+        with self._store_lock:
+            for store in stores:
+                scored.extend(
+                    store.similarity_search_with_score_by_vector(vector, k=k, **search_kwargs)
+                )
+        # All partitions share the same distance strategy (L2), lower is closer
+        scored.sort(key=lambda item: item[1])
+        return [doc for doc, _ in scored[:k]]
+
+    def search_partitions(
+        self,
+        query: str,
+        suspects: Optional[List[str]] = None,
+        include_clues: bool = False,
+        k: int = 5
+    ) -> List[Tuple[str, Dict]]:
+        """Semantic search across several suspects' partitions at once.
+        
+        Args:
+            query: Search query
+            suspects: Suspects whose statements to search (None = all suspects)
+            include_clues: Also search the shared clue partition
+            k: Number of merged results to return
+            
+        Returns:
+            List of (document_text, metadata) tuples, closest first.
+        """
+        if not self.is_available:
+            return []
+        self.flush()
+        
+        if suspects is None:
+            keys = self._partitions_for_type("conversation")
+        else:
+            keys = [suspect_partition(name) for name in suspects]
+        if include_clues:
+            keys.append(CLUE_PARTITION)
+        
+        try:
+            t0 = time.perf_counter()
+            results = self._fan_out_search(query, keys, k)
+            search_ms = (time.perf_counter() - t0) * 1000
+            logger.info(
+                "[RAG] [PERF] search_partitions() %d partitions k=%d – %.0fms, %d results",
+                len(keys), k, search_ms, len(results)
+            )
+            return [(r.page_content, r.metadata) for r in results]
+            
+        except Exception as e:
+            logger.error("[RAG] Partition search failed: %s", e)
+            return []
+
+    def search_lexical(
+        self,
+        query: str,
+        k: int = 5,
+        filter_type: Optional[str] = None,
+        suspect: Optional[str] = None,
+        exclude_suspect: Optional[str] = None
+    ) -> List[Tuple[str, Dict]]:
+        """Keyword (BM25) search over names, locations and times. No embedding call.
+        
+        Args:
+            query: Search query
+            k: Number of results to return
+            filter_type: Optional filter by document type ("conversation", "clue")
+            suspect: Only statements made by this suspect
+            exclude_suspect: Skip statements made by this suspect
+            
+        Returns:
+            List of (document_text, metadata) tuples, best match first.
+        """
+        if not self.is_available:
+            return []
+        
+        def predicate(doc_id: str) -> bool:
+            metadata = self._documents_by_id[doc_id]["metadata"]
+            if filter_type and metadata.get("type") != filter_type:
+                return False
+            if suspect and metadata.get("suspect") != suspect:
+                return False
+            if exclude_suspect and metadata.get("suspect") == exclude_suspect:
+                return False
+            return True
+        
+        try:
+            t0 = time.perf_counter()
+            with self._records_lock:
+                hits = self._lexical.search(query, k=k, predicate=predicate)
+                results = [
+                    (self._documents_by_id[doc_id]["text"], self._documents_by_id[doc_id]["metadata"])
+                    for doc_id, _ in hits
+                ]
+            logger.info(
+                "[RAG] [PERF] search_lexical() k=%d filter=%s – %.1fms, %d results",
+                k, filter_type, (time.perf_counter() - t0) * 1000, len(results)
+            )
+            return results
+            
+        except Exception as e:
+            logger.error("[RAG] Lexical search failed: %s", e)
+            return []
+    
     def search(
         self,
         query: str,
         k: int = 5,
-        filter_type: Optional[str] = None
+        filter_type: Optional[str] = None,
+        mode: str = "vector"
     ) -> List[Tuple[str, Dict]]:
-        """Semantic search across all indexed content.
+        """Search across all indexed content.
         
         Args:
             query: Search query
             k: Number of results to return
             filter_type: Optional filter by document type ("conversation", "clue")
+            mode: "vector" (semantic), "lexical" (BM25, no embedding call) or
+                "hybrid" (both, fused by reciprocal rank)
             
         Returns:
             List of (document_text, metadata) tuples.
         """
         if not self.is_available:
             return []
+        if mode == "lexical":
+            return self.search_lexical(query, k=k, filter_type=filter_type)
+        self.flush()
         
         try:
             t0 = time.perf_counter()
-            if filter_type:
-                results = self.vectorstore.similarity_search(
-                    query, k=k, filter={"type": filter_type}
-                )
-            else:
-                results = self.vectorstore.similarity_search(query, k=k)
+            fetch_k = k * 2 if mode == "hybrid" else k
+            docs = self._fan_out_search(
+                query, self._partitions_for_type(filter_type), fetch_k, filter_type
+            )
+            results = [(r.page_content, r.metadata) for r in docs]
+            if mode == "hybrid":
+                lexical = self.search_lexical(query, k=fetch_k, filter_type=filter_type)
+                results = _rrf_fuse([results, lexical], k)
             search_ms = (time.perf_counter() - t0) * 1000
             logger.info(
-                "[RAG] [PERF] search() k=%d filter=%s – %.0fms, %d results",
-                k, filter_type, search_ms, len(results)
+                "[RAG] [PERF] search() k=%d filter=%s mode=%s – %.0fms, %d results",
+                k, filter_type, mode, search_ms, len(results)
             )
-            return [(r.page_content, r.metadata) for r in results]
+            return results
             
         except Exception as e:
             logger.error("[RAG] Search failed: %s", e)
@@ -265,7 +795,8 @@ class GameMemory:
         self,
         suspect: str,
         query: str,
-        k: int = 3
+        k: int = 3,
+        mode: str = "vector"
     ) -> List[Tuple[str, Dict]]:
         """Search statements from a specific suspect.
         
@@ -273,24 +804,33 @@ class GameMemory:
             suspect: Suspect name to filter by
             query: Search query
             k: Number of results
+            mode: "vector", "lexical" or "hybrid" (see search())
             
         Returns:
             List of (document_text, metadata) tuples from this suspect.
         """
         if not self.is_available:
             return []
+        if mode == "lexical":
+            return self.search_lexical(query, k=k, filter_type="conversation", suspect=suspect)
+        self.flush()
         
         try:
             t0 = time.perf_counter()
-            results = self.vectorstore.similarity_search(
-                query, k=k, filter={"suspect": suspect}
-            )
+            fetch_k = k * 2 if mode == "hybrid" else k
+            docs = self._fan_out_search(query, [suspect_partition(suspect)], fetch_k)
+            results = [(r.page_content, r.metadata) for r in docs]
+            if mode == "hybrid":
+                lexical = self.search_lexical(
+                    query, k=fetch_k, filter_type="conversation", suspect=suspect
+                )
+                results = _rrf_fuse([results, lexical], k)
             search_ms = (time.perf_counter() - t0) * 1000
             logger.info(
-                "[RAG] [PERF] search_by_suspect(%s) k=%d – %.0fms, %d results",
-                suspect, k, search_ms, len(results)
+                "[RAG] [PERF] search_by_suspect(%s) k=%d mode=%s – %.0fms, %d results",
+                suspect, k, mode, search_ms, len(results)
             )
-            return [(r.page_content, r.metadata) for r in results]
+            return results
             
         except Exception as e:
             logger.error("[RAG] Suspect search failed: %s", e)
@@ -305,13 +845,45 @@ class GameMemory:
         Returns:
             List of conversation metadata dicts, sorted by turn.
         """
-        convos = [
-            doc["metadata"]
-            for doc in self.documents
-            if doc["metadata"].get("suspect") == suspect
-            and doc["metadata"].get("type") == "conversation"
-        ]
-        return sorted(convos, key=lambda x: x.get("turn", 0))
+        with self._records_lock:
+            return list(self._history_by_suspect.get(suspect, ()))
+    
+    def get_recent_exchanges(self, suspect: str, n: int = 5) -> List[Dict]:
+        """Get the last ``n`` conversations with a suspect, oldest first.
+        
+        Args:
+            suspect: Suspect name
+            n: Maximum number of exchanges to return
+            
+        Returns:
+            List of conversation metadata dicts, sorted by turn.
+        """
+        if n <= 0:
+            return []
+        with self._records_lock:
+            return self._history_by_suspect.get(suspect, [])[-n:]
+    
+    def count_exchanges(self, suspect: str) -> int:
+        """Number of indexed conversations with a suspect."""
+        with self._records_lock:
+            return len(self._history_by_suspect.get(suspect, ()))
+    
+    def get_documents_by_type(self, doc_type: str) -> List[Dict]:
+        """Get all indexed documents of a type ("conversation", "clue"), in insert order."""
+        with self._records_lock:
+            return list(self._docs_by_type.get(doc_type, ()))
+    
+    def count_documents(self, doc_type: Optional[str] = None) -> int:
+        """Number of indexed documents, optionally of a single type."""
+        with self._records_lock:
+            if doc_type is None:
+                return len(self.documents)
+            return len(self._docs_by_type.get(doc_type, ()))
+    
+    def interviewed_suspects(self) -> List[str]:
+        """Names of suspects with at least one indexed conversation."""
+        with self._records_lock:
+            return list(self._history_by_suspect.keys())
     
     def find_related_statements(
         self,
@@ -352,11 +924,27 @@ class GameMemory:
         if not self.is_available:
             return []
         
-        # Search for mentions of this suspect in other suspects' statements
-        query = f"statements about {about_suspect} or mentions {about_suspect}"
-        results = self.search(query, k=k * 2, filter_type="conversation")
+        # This is a name lookup, so try the keyword index first - it needs no
+        # embedding call. Only fall back to semantic search (skipping the
+        # suspect's own partition) when too few statements mention the name.
+        results = self.search_lexical(
+            about_suspect, k=k, filter_type="conversation", exclude_suspect=about_suspect
+        )
+        if len(results) < k:
+            query = f"statements about {about_suspect} or mentions {about_suspect}"
+            self.flush()
+            own = suspect_partition(about_suspect)
+            others = [
+                key for key in self._partitions_for_type("conversation") if key != own
+            ]
+            try:
+                docs = self._fan_out_search(query, others, k)
+            except Exception as e:
+                logger.error("[RAG] Cross-reference search failed: %s", e)
+                docs = []
+            seen = {text for text, _ in results}
+            results += [(d.page_content, d.metadata) for d in docs if d.page_content not in seen]
         
-        # Filter out statements BY the suspect (we want statements ABOUT them)
         cross_refs = []
         for text, metadata in results:
             speaker = metadata.get("suspect")
@@ -365,44 +953,478 @@ class GameMemory:
         
         return cross_refs[:k]
     
+    def save(self, path: str) -> bool:
+        """Snapshot this memory to a directory so it can be restored without re-embedding.
+        
+        Writes ``vectors.npy`` (a float32 matrix with one row per indexed
+        document, loaded memory-mapped) and ``manifest.json`` (document text,
+        metadata, ids and the vector row of each). Pending writes are flushed
+        first; documents that never made it into the index are saved without
+        a row and re-embedded on load.
+        
+        Args:
+            path: Snapshot directory (created if missing)
+            
+        Returns:
+            True if the snapshot was written.
+        """
+        if not self.is_available:
+            return False
+        
+        try:
+            import numpy as np
+            
+            t0 = time.perf_counter()
+            self.flush(timeout=None)
+            with self._records_lock:
+                documents = list(self.documents)
+            entries = []
+            vectors = []
+            with self._store_lock:
+                rows_by_partition = {
+                    key: {doc_id: row for row, doc_id in store.index_to_docstore_id.items()}
+                    for key, store in self.partitions.items()
+                }
+                for document in documents:
+                    key = _partition_for(document["metadata"])
+                    row = rows_by_partition.get(key, {}).get(document["id"])
+                    entry = {
+                        "id": document["id"],
+                        "text": document["text"],
+                        "metadata": document["metadata"],
+                        "row": None,
+                    }
+                    if row is not None:
+                        entry["row"] = len(vectors)
+                        vectors.append(self.partitions[key].index.reconstruct(row))
+                    entries.append(entry)
+            
+            os.makedirs(path, exist_ok=True)
+            dimensions = len(vectors[0]) if vectors else 0
+            vectors_tmp = os.path.join(path, "vectors.npy.tmp")
+            if vectors:
+                matrix = np.lib.format.open_memmap(
+                    vectors_tmp, mode="w+", dtype=np.float32, shape=(len(vectors), dimensions)
+                )
+                matrix[:] = np.asarray(vectors, dtype=np.float32)
+                matrix.flush()
+                del matrix
+            else:
+                with open(vectors_tmp, "wb") as f:
+                    np.save(f, np.zeros((0, 0), dtype=np.float32))
+            
+            manifest_tmp = os.path.join(path, "manifest.json.tmp")
+            with open(manifest_tmp, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": self.SNAPSHOT_VERSION,
+                        "model": self._embeddings.model,
+                        "dimensions": dimensions,
+                        "documents": entries,
+                    },
+                    f,
+                    default=str,
+                )
+            os.replace(vectors_tmp, os.path.join(path, "vectors.npy"))
+            os.replace(manifest_tmp, os.path.join(path, "manifest.json"))
+            
+            logger.info(
+                "[RAG] [PERF] Saved GameMemory snapshot to %s (%d docs, %d vectors) – %.0fms",
+                path, len(entries), len(vectors), (time.perf_counter() - t0) * 1000
+            )
+            return True
+            
+        except Exception as e:
+            logger.error("[RAG] Failed to save GameMemory snapshot: %s", e)
+            return False
+    
+    def load(self, path: str) -> bool:
+        """Restore a snapshot written by save(), replacing current contents.
+        
+        Stored vectors are reused as-is when they were produced by the current
+        embedding model; otherwise (or for documents saved without a vector)
+        the text is re-embedded in the background.
+        
+        Args:
+            path: Snapshot directory
+            
+        Returns:
+            True if the snapshot was loaded.
+        """
+        if not _check_faiss():
+            logger.warning("[RAG] Cannot load snapshot - FAISS not available")
+            return False
+        
+        try:
+            import numpy as np
+            
+            t0 = time.perf_counter()
+            with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") != self.SNAPSHOT_VERSION:
+                logger.error("[RAG] Unsupported snapshot version: %s", manifest.get("version"))
+                return False
+            vectors = None
+            if any(entry.get("row") is not None for entry in manifest["documents"]):
+                vectors = np.load(os.path.join(path, "vectors.npy"), mmap_mode="r")
+            
+            self.clear()
+            self._embeddings = _get_embeddings()
+            self._initialized = True
+            reuse_vectors = manifest.get("model") == self._embeddings.model
+            if not reuse_vectors:
+                logger.warning(
+                    "[RAG] Snapshot model %s differs from %s – re-embedding documents",
+                    manifest.get("model"), self._embeddings.model
+                )
+            
+            by_partition: Dict[str, List[Tuple[Dict, int]]] = {}
+            to_embed = []
+            for entry in manifest["documents"]:
+                document = self._record_document(entry["text"], entry["metadata"], entry["id"])
+                if reuse_vectors and vectors is not None and entry.get("row") is not None:
+                    key = _partition_for(document["metadata"])
+                    by_partition.setdefault(key, []).append((document, entry["row"]))
+                else:
+                    to_embed.append(document)
+            
+            with self._store_lock:
+                for key, items in by_partition.items():
+                    rows = vectors[[row for _, row in items]]
+                    self._insert_vectors(key, [document for document, _ in items], rows)
+            for document in to_embed:
+                self._enqueue_index(document)
+            
+            logger.info(
+                "[RAG] [PERF] Loaded GameMemory snapshot from %s (%d docs, %d re-embedding) – %.0fms",
+                path, len(self.documents), len(to_embed), (time.perf_counter() - t0) * 1000
+            )
+            return True
+            
+        except Exception as e:
+            logger.error("[RAG] Failed to load GameMemory snapshot: %s", e)
+            self.clear()
+            return False
+    
     def clear(self):
-        """Clear all indexed documents (for game reset)."""
-        self.documents = []
+        """Clear all indexed documents (for game reset).
+
+        Queued background writes are discarded rather than awaited.
+        """
+        with self._store_lock:
+            self._generation += 1
+        with self._records_lock:
+            self.documents = []
+            self._history_by_suspect = {}
+            self._docs_by_type = {}
+            self._documents_by_id = {}
+            self._lexical.clear()
+            self._approx_bytes = 0
+        self._bump_index_version()
+        with self._result_cache_lock:
+            self._result_cache.clear()
         self._initialized = False
-        self.vectorstore = None
+        self.partitions = {}
+        self._embeddings = None
         logger.info("[RAG] GameMemory cleared")
 
 
 # ============================================================================
-# Singleton instance for game-wide memory
+# Per-session registry
 # ============================================================================
+# Each game session owns its own GameMemory so concurrent players never wipe
+# each other's index. The registry is bounded: sessions idle for longer than
+# GAME_MEMORY_IDLE_TTL seconds are dropped, and the least recently used
+# sessions are evicted once GAME_MEMORY_MAX_SESSIONS or GAME_MEMORY_MAX_MB
+# is exceeded. A session whose game was still running when it was evicted is
+# snapshotted to GAME_MEMORY_SNAPSHOT_DIR and restored on its next access (or
+# just re-initialized when snapshots are off), so RAG stays on for the rest of
+# that game. Sessions that never come back are forgotten, and their snapshots
+# deleted, after GAME_MEMORY_SNAPSHOT_TTL seconds.
+
+DEFAULT_SESSION_ID = "_default"
+
+
+class GameMemoryRegistry:
+    """Bounded LRU registry of GameMemory instances keyed by session id."""
+
+    def __init__(
+        self,
+        max_sessions: int = 64,
+        idle_ttl_seconds: float = 2 * 60 * 60,
+        max_total_bytes: int = 512 * 1024 * 1024,
+        snapshot_dir: Optional[str] = None,
+        snapshot_ttl_seconds: float = 24 * 60 * 60,
+    ):
+        self.max_sessions = max_sessions
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.max_total_bytes = max_total_bytes
+        self.snapshot_dir = snapshot_dir
+        self.snapshot_ttl_seconds = snapshot_ttl_seconds
+        self._memories: "OrderedDict[str, GameMemory]" = OrderedDict()
+        # Sessions evicted mid-game -> eviction time, oldest first; forgotten
+        # on remove() (game reset) or after snapshot_ttl_seconds
+        self._evicted: "OrderedDict[str, float]" = OrderedDict()
+        # Evicted memories whose snapshot is still being written
+        self._saving: Dict[str, GameMemory] = {}
+        # Sessions being restored outside the lock; other get()s wait on these
+        self._restoring: Dict[str, threading.Event] = {}
+        self._last_sweep = 0.0
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_env(cls) -> "GameMemoryRegistry":
+        """Build a registry using limits from environment variables."""
+        return cls(
+            max_sessions=int(os.getenv("GAME_MEMORY_MAX_SESSIONS", "64")),
+            idle_ttl_seconds=float(os.getenv("GAME_MEMORY_IDLE_TTL", str(2 * 60 * 60))),
+            max_total_bytes=int(float(os.getenv("GAME_MEMORY_MAX_MB", "512")) * 1024 * 1024),
+            snapshot_dir=os.getenv("GAME_MEMORY_SNAPSHOT_DIR", ".cache/game_memory") or None,
+            snapshot_ttl_seconds=float(
+                os.getenv("GAME_MEMORY_SNAPSHOT_TTL", str(24 * 60 * 60))
+            ),
+        )
+
+    def get(self, session_id: str) -> GameMemory:
+        """Get or create the memory for a session, marking it most recently used."""
+        restoring = None
+        while True:
+            with self._lock:
+                pending = self._restoring.get(session_id)
+                if pending is None:
+                    memory = self._memories.get(session_id)
+                    if memory is None and session_id in self._saving:
+                        # Evicted a moment ago and still in RAM - take it back as is
+                        memory = self._memories[session_id] = self._saving.pop(session_id)
+                        self._evicted.pop(session_id, None)
+                    elif memory is None and self._evicted.pop(session_id, None) is not None:
+                        # Restored outside the lock; published once it is ready
+                        memory = GameMemory()
+                        restoring = self._restoring[session_id] = threading.Event()
+                    elif memory is None:
+                        memory = GameMemory()
+                        self._memories[session_id] = memory
+                        logger.info(
+                            "[RAG] Created GameMemory for session %s (%d active)",
+                            session_id[:8], len(self._memories)
+                        )
+                    else:
+                        self._memories.move_to_end(session_id)
+                    memory.touch()
+                    to_save = self._evict(keep=session_id)
+                    break
+            pending.wait()
+
+        if restoring is not None:
+            self._recreate(session_id, memory)
+            with self._lock:
+                published = self._restoring.get(session_id) is restoring
+                if published:
+                    del self._restoring[session_id]
+                    self._memories[session_id] = memory
+                    memory.touch()
+                    to_save += self._evict(keep=session_id)
+            restoring.set()
+            if not published:
+                memory.clear()
+                memory = None
 
-_game_memory: Optional[GameMemory] = None
+        # Snapshots are written outside the lock; a get() for one of these
+        # sessions meanwhile takes the instance back from _saving.
+        for sid, evicted in to_save:
+            evicted.save(self._snapshot_path(sid))
+            with self._lock:
+                if self._saving.get(sid) is evicted:
+                    del self._saving[sid]
+        self._sweep_snapshots()
+        if memory is None:
+            # remove() ran during the restore (new game) - hand out a fresh memory
+            return self.get(session_id)
+        return memory
+
+    def remove(self, session_id: str) -> bool:
+        """Drop a session's memory entirely. Returns True if it existed."""
+        with self._lock:
+            memory = self._memories.pop(session_id, None)
+            self._evicted.pop(session_id, None)
+            memory = memory or self._saving.pop(session_id, None)
+            restoring = self._restoring.pop(session_id, None)
+        if restoring is not None:
+            restoring.set()
+        if self.snapshot_dir:
+            shutil.rmtree(self._snapshot_path(session_id), ignore_errors=True)
+        if memory is None:
+            return False
+        memory.clear()
+        return True
+
+    def total_bytes(self) -> int:
+        """Approximate memory held by all registered sessions."""
+        with self._lock:
+            return sum(m.estimated_bytes() for m in self._memories.values())
+
+    def stats(self) -> Dict[str, float]:
+        """Summary numbers for logging and the debug panel."""
+        with self._lock:
+            return {
+                "sessions": len(self._memories),
+                "documents": sum(len(m.documents) for m in self._memories.values()),
+                "megabytes": self.total_bytes() / (1024 * 1024),
+            }
+
+    def _snapshot_path(self, session_id: str) -> str:
+        """Snapshot directory for a session (ids are hashed into safe names)."""
+        name = hashlib.sha256(session_id.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.snapshot_dir, name)
+
+    def _recreate(self, session_id: str, memory: GameMemory):
+        """Bring back a session whose in-progress game was evicted.
+
+        Runs without ``_lock`` (loading reads from disk). The eviction
+        snapshot is restored when there is one; otherwise earlier statements
+        are gone, but the game keeps indexing and searching from here on.
+        """
+        if self.snapshot_dir:
+            path = self._snapshot_path(session_id)
+            if os.path.exists(os.path.join(path, "manifest.json")) and memory.load(path):
+                logger.info("[RAG] Restored evicted GameMemory for session %s", session_id[:8])
+                return
+        if memory.initialize():
+            logger.info("[RAG] Re-initialized evicted GameMemory for session %s", session_id[:8])
+
+    def _evict(self, keep: Optional[str] = None) -> List[Tuple[str, GameMemory]]:
+        """Evict idle sessions, then LRU sessions until within limits.
+
+        The session named by ``keep`` is never evicted, so the caller always
+        gets back a live instance. Evicted memories are only dropped from the
+        registry, not cleared: another thread may still be using one, and it
+        is freed once the last reference goes away.
+
+        Returns:
+            Evicted (session id, memory) pairs the caller should snapshot.
+        """
+        now = time.monotonic()
+        evicted = []
+
+        for sid, memory in list(self._memories.items()):
+            if sid != keep and now - memory.last_used > self.idle_ttl_seconds:
+                evicted.append((sid, memory))
+                del self._memories[sid]
+
+        total = sum(m.estimated_bytes() for m in self._memories.values())
+        for sid in list(self._memories.keys()):
+            if len(self._memories) <= self.max_sessions and total <= self.max_total_bytes:
+                break
+            if sid == keep:
+                continue
+            memory = self._memories.pop(sid)
+            total -= memory.estimated_bytes()
+            evicted.append((sid, memory))
+
+        # Games still in progress are brought back by the next get()
+        in_progress = [(sid, memory) for sid, memory in evicted if memory.is_initialized]
+        for sid, _ in in_progress:
+            self._evicted[sid] = now
+        # ...unless they stay away longer than the snapshot TTL
+        while self._evicted:
+            sid, evicted_at = next(iter(self._evicted.items()))
+            if now - evicted_at <= self.snapshot_ttl_seconds:
+                break
+            del self._evicted[sid]
+        if evicted:
+            logger.info(
+                "[RAG] Evicted %d GameMemory session(s): %s (%d active)",
+                len(evicted), ", ".join(sid[:8] for sid, _ in evicted), len(self._memories)
+            )
+        if not self.snapshot_dir:
+            return []
+        self._saving.update(in_progress)
+        return in_progress
+
+    def _sweep_snapshots(self):
+        """Delete snapshots older than snapshot_ttl_seconds (at most every few minutes).
+
+        Works from file ages, so snapshots left by earlier processes go too.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if not self.snapshot_dir or now - self._last_sweep < min(
+                300.0, self.snapshot_ttl_seconds
+            ):
+                return
+            self._last_sweep = now
+        try:
+            names = os.listdir(self.snapshot_dir)
+        except OSError:
+            return
+        cutoff = time.time() - self.snapshot_ttl_seconds
+        removed = 0
+        for name in names:
+            path = os.path.join(self.snapshot_dir, name)
+            try:
+                if os.path.getmtime(path) >= cutoff:
+                    continue
+            except OSError:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+        if removed:
+            logger.info("[RAG] Deleted %d expired GameMemory snapshot(s)", removed)
+
+
+_registry: Optional[GameMemoryRegistry] = None
+_registry_lock = threading.Lock()
 
 
-def get_game_memory() -> GameMemory:
-    """Get or create the singleton GameMemory instance."""
-    global _game_memory
-    if _game_memory is None:
-        _game_memory = GameMemory()
-    return _game_memory
+def get_memory_registry() -> GameMemoryRegistry:
+    """Get or create the process-wide GameMemory registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = GameMemoryRegistry.from_env()
+    return _registry
 
 
-def initialize_game_memory() -> bool:
-    """Initialize the game memory service.
+def _resolve_session_id(session_id: Optional[str]) -> str:
+    """Fall back to the session currently being served by the tools."""
+    if session_id:
+        return session_id
+    from game.state_manager import get_current_session_id
+    return get_current_session_id() or DEFAULT_SESSION_ID
+
+
+def get_game_memory(session_id: Optional[str] = None) -> GameMemory:
+    """Get or create the GameMemory for a session.
+
+    Args:
+        session_id: Session identifier. Defaults to the current tool session.
+    """
+    return get_memory_registry().get(_resolve_session_id(session_id))
+
+
+def initialize_game_memory(session_id: Optional[str] = None) -> bool:
+    """Initialize the game memory service for a session.
     
     Call this at game start to set up the vector store.
     
     Returns:
         True if initialization succeeded.
     """
-    memory = get_game_memory()
+    memory = get_game_memory(session_id)
     return memory.initialize()
 
 
-def reset_game_memory():
-    """Reset game memory for a new game."""
-    memory = get_game_memory()
-    memory.clear()
+def reset_game_memory(session_id: Optional[str] = None):
+    """Reset a session's game memory for a new game."""
+    get_memory_registry().remove(_resolve_session_id(session_id))
+
+
+def save_game_memory(path: str, session_id: Optional[str] = None) -> bool:
+    """Snapshot a session's memory to ``path`` (see GameMemory.save)."""
+    return get_game_memory(session_id).save(path)
 
 
+def load_game_memory(path: str, session_id: Optional[str] = None) -> bool:
+    """Restore a session's memory from a snapshot at ``path`` (see GameMemory.load)."""
+    return get_game_memory(session_id).load(path)
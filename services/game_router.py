@@ -283,7 +283,7 @@ class GameRouter:
             )
         else:
             from services.game_memory import get_game_memory
-            memory = get_game_memory()
+            memory = get_game_memory(self.session_id)
             
             if suspect_filter:
                 results = memory.search_by_suspect(suspect_filter, query)
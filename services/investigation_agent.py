@@ -22,6 +22,7 @@ Usage:
 
 import os
 import sys
+import importlib.util
 import json
 import logging
 from typing import Optional, List, Dict, Any
@@ -30,12 +31,13 @@ from pydantic import BaseModel, Field
 
 # Try LangChain imports
 try:
-    from langchain_openai import ChatOpenAI
     from langchain_core.messages import HumanMessage, SystemMessage
-    LANGCHAIN_AVAILABLE = True
+    LANGCHAIN_AVAILABLE = importlib.util.find_spec("langchain_openai") is not None
 except ImportError:
     LANGCHAIN_AVAILABLE = False
 
+from services.llm_clients import get_chat_model
+
 logger = logging.getLogger(__name__)
 
 
@@ -97,10 +99,8 @@ class InvestigationAssistant:
         if not LANGCHAIN_AVAILABLE:
             raise ImportError("LangChain not installed. Run: pip install langchain-openai")
         
-        self.llm = ChatOpenAI(
-            model=os.getenv("INVESTIGATION_ASSISTANT_MODEL", "gpt-4o-mini"),
-            temperature=0.3,
-            api_key=os.getenv("OPENAI_API_KEY")
+        self.llm = get_chat_model(
+            os.getenv("INVESTIGATION_ASSISTANT_MODEL", "gpt-4o-mini"), temperature=0.3
         )
         
         # LLM with structured output for reports
@@ -0,0 +1,109 @@
+"""In-process BM25 inverted index for GameMemory.
+
+Semantic search is a poor (and comparatively slow) fit for lookups that are
+really about exact tokens: suspect names, locations and times ("9pm",
+"half past ten", "the conservatory"). This index answers those without an
+embedding call and is updated synchronously on every insert, so it is always
+consistent with GameMemory.documents.
+
+Usage:
+    index = BM25Index()
+    index.add("doc-1", "I saw Lady Ashford in the library at 9 pm")
+    index.search("ashford library", k=5)  # -> [("doc-1", 2.3)]
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Times like "9pm", "9 pm", "10:30", "10.30pm" are kept as single tokens
+_TIME_RE = re.compile(r"\b(\d{1,2})(?:[:.](\d{2}))?\s*(am|pm)\b|\b(\d{1,2})[:.](\d{2})\b")
+_WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be but by did do for from had has have he her him his i in is it "
+    "its me my of on or our she so that the their them they this to was we were what when "
+    "where who why with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with normalized time expressions and no stopwords."""
+    text = (text or "").lower()
+    tokens = []
+
+    def _time_token(match: re.Match) -> str:
+        hour, minute, meridiem, hour24, minute24 = match.groups()
+        if meridiem:
+            token = f"{int(hour)}{':' + minute if minute and minute != '00' else ''}{meridiem}"
+        else:
+            token = f"{int(hour24)}:{minute24}"
+        tokens.append(token)
+        return " "
+
+    text = _TIME_RE.sub(_time_token, text)
+    for word in _WORD_RE.findall(text):
+        if word.endswith("'s"):
+            word = word[:-2]
+        if word and word not in _STOPWORDS:
+            tokens.append(word)
+    return tokens
+
+
+class BM25Index:
+    """Okapi BM25 over short documents with incremental inserts."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, int]] = {}  # term -> {doc_id: tf}
+        self._lengths: Dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(self, doc_id: str, text: str):
+        """Index a document under a unique id."""
+        terms = Counter(tokenize(text))
+        self._lengths[doc_id] = sum(terms.values())
+        self._total_length += self._lengths[doc_id]
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[doc_id] = tf
+
+    def search(
+        self,
+        query: str,
+        k: int = 5,
+        predicate: Optional[Callable[[str], bool]] = None,
+    ) -> List[Tuple[str, float]]:
+        """Return up to k (doc_id, score) pairs, best first.
+
+        Args:
+            query: Free-text query
+            k: Maximum number of results
+            predicate: Optional doc_id filter applied before ranking
+        """
+        n = len(self._lengths)
+        if n == 0:
+            return []
+        avg_length = self._total_length / n
+        scores: Dict[str, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, tf in postings.items():
+                if predicate is not None and not predicate(doc_id):
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:k]
+
+    def clear(self):
+        self._postings = {}
+        self._lengths = {}
+        self._total_length = 0
@@ -0,0 +1,196 @@
+"""Shared, pooled LangChain chat model clients.
+
+Constructing ``ChatOpenAI(...)`` per call gives every request a fresh HTTP
+connection pool, so each call repeats DNS + TCP + TLS setup. This module hands
+out long-lived clients keyed by (model, temperature, max_tokens, api key) that
+share one keep-alive connection pool.
+
+httpx async connections cannot be reused across event loops, so async work
+from sync code runs on one persistent background loop (``run_async`` /
+``submit_async``) whose clients share a single ``httpx.AsyncClient``. A client
+requested on any other loop gets its own default pool, which is dropped with
+the client instead of being cached past the loop's lifetime.
+
+Usage:
+    from services.llm_clients import get_chat_model, run_async
+
+    llm = get_chat_model("gpt-4o-mini", temperature=0)
+    structured_llm = llm.with_structured_output(MyModel)
+    result = run_async(some_coroutine(), timeout=10)
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import threading
+from typing import Any, Coroutine, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Connection pool limits (shared by every client in the process)
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "10"))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "60"))
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "60"))
+
+ClientKey = Tuple[str, Optional[float], Optional[int], Optional[str]]
+
+_lock = threading.Lock()
+_http_client = None
+_clients: Dict[ClientKey, Any] = {}
+# Shared background loop, its httpx.AsyncClient and the clients built on it
+_async_loop: Optional[asyncio.AbstractEventLoop] = None
+_async_http_client = None
+_async_clients: Dict[ClientKey, Any] = {}
+
+
+def _limits():
+    import httpx
+    return httpx.Limits(
+        max_connections=LLM_MAX_CONNECTIONS,
+        max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+    )
+
+
+def _get_http_client():
+    """Process-wide keep-alive pool for synchronous calls (httpx.Client is thread-safe)."""
+    global _http_client
+    if _http_client is None:
+        import httpx
+        _http_client = httpx.Client(limits=_limits(), timeout=LLM_TIMEOUT)
+        logger.info(
+            "[LLM] Shared HTTP pool created (max %d connections, %d keep-alive)",
+            LLM_MAX_CONNECTIONS, LLM_MAX_KEEPALIVE_CONNECTIONS
+        )
+    return _http_client
+
+
+def _get_async_loop() -> asyncio.AbstractEventLoop:
+    """The process-wide event loop for async LLM calls, started on first use."""
+    global _async_loop
+    with _lock:
+        if _async_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="llm-async", daemon=True).start()
+            _async_loop = loop
+            logger.info("[LLM] Shared async event loop started")
+        return _async_loop
+
+
+def submit_async(coro: Coroutine) -> "concurrent.futures.Future":
+    """Schedule a coroutine on the shared loop; returns a concurrent Future.
+
+    The coroutine runs in a copy of the caller's context (session id etc.).
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_async_loop())
+
+
+def run_async(coro: Coroutine, timeout: Optional[float] = None):
+    """Run a coroutine on the shared loop and wait for its result.
+
+    Safe from sync code and from threads that are running another loop; never
+    call it from a coroutine already on the shared loop (await instead).
+    """
+    loop = _get_async_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_async() would block the shared LLM loop; await the coroutine")
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
+
+
+def _build(key: ClientKey, http_async_client=None):
+    from langchain_openai import ChatOpenAI
+
+    model, temperature, max_tokens, api_key = key
+    kwargs: Dict[str, Any] = {
+        "model": model,
+        "api_key": api_key,
+        "http_client": _get_http_client(),
+        # Report token usage (incl. cached prompt tokens) on streamed calls too
+        "stream_usage": True,
+    }
+    if temperature is not None:
+        kwargs["temperature"] = temperature
+    if max_tokens is not None:
+        kwargs["max_tokens"] = max_tokens
+    if http_async_client is not None:
+        kwargs["http_async_client"] = http_async_client
+    return ChatOpenAI(**kwargs)
+
+
+def get_chat_model(
+    model: str,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+):
+    """Get a shared ``ChatOpenAI`` client for these settings.
+
+    The OpenAI key is read from the environment on every call, so saving a new
+    key in the UI transparently switches to a fresh client.
+
+    Args:
+        model: OpenAI model name (e.g., "gpt-4o-mini")
+        temperature: Sampling temperature, or None for the model default
+        max_tokens: Completion token limit, or None for no limit
+    """
+    key: ClientKey = (model, temperature, max_tokens, os.getenv("OPENAI_API_KEY"))
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    with _lock:
+        if loop is None:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = _build(key)
+                logger.debug("[LLM] New client: model=%s temperature=%s", model, temperature)
+            return client
+
+        if loop is not _async_loop:
+            # Some other (possibly short-lived) loop: don't cache a pool bound to it
+            return _build(key)
+
+        global _async_http_client
+        if _async_http_client is None:
+            import httpx
+            _async_http_client = httpx.AsyncClient(limits=_limits(), timeout=LLM_TIMEOUT)
+        client = _async_clients.get(key)
+        if client is None:
+            client = _async_clients[key] = _build(key, http_async_client=_async_http_client)
+        return client
+
+
+def clear_clients():
+    """Drop every cached client (e.g., after API keys change)."""
+    with _lock:
+        _clients.clear()
+        _async_clients.clear()
+    logger.info("[LLM] Client cache cleared")
+
+
+def prompt_token_usage(message) -> Tuple[int, int]:
+    """(prompt tokens, prompt tokens served from OpenAI's prompt cache) for a reply.
+
+    OpenAI caches prompt prefixes of 1024+ tokens automatically; the cached
+    share shows whether prompts keep a stable prefix across calls.
+    """
+    usage = getattr(message, "usage_metadata", None) or {}
+    if usage:
+        details = usage.get("input_token_details") or {}
+        return usage.get("input_tokens", 0) or 0, details.get("cache_read", 0) or 0
+    token_usage = (getattr(message, "response_metadata", None) or {}).get("token_usage") or {}
+    details = token_usage.get("prompt_tokens_details") or {}
+    return token_usage.get("prompt_tokens", 0) or 0, details.get("cached_tokens", 0) or 0
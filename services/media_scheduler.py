@@ -0,0 +1,283 @@
+"""Shared, prioritized worker pool for portrait and scene generation.
+
+Image work used to start a raw daemon thread per image, plus ad-hoc worker
+queues for prewarming. Nothing bounded the total load on the image API across
+sessions, and work for a restarted game kept running. All image jobs now
+go through one MediaScheduler:
+
+- a fixed pool of MEDIA_WORKERS threads shared by every session;
+- three priority classes, served in order: PRIORITY_NOW (on screen this turn),
+  PRIORITY_NEXT (likely next, e.g. the suspect being addressed) and
+  PRIORITY_PREWARM (speculative). Prewarm jobs never take the last
+  MEDIA_PREWARM_RESERVE workers, so urgent images don't queue behind them;
+- jobs are deduplicated per (session, key). Submitting a queued key again
+  with a higher priority moves it up instead of generating twice;
+- cancel_session() drops a session's queued jobs (game restart). Running
+  jobs can check current_job_cancelled() before storing their result;
+- queue depth and wait time per class are available from stats() and are
+  recorded in the perf summary.
+
+Usage:
+    from services.media_scheduler import PRIORITY_NOW, get_media_scheduler
+
+    future = get_media_scheduler().submit(
+        session_id, f"portrait:{name}", generate_fn, arg1, arg2, priority=PRIORITY_NOW
+    )
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from services.perf_tracker import perf
+
+logger = logging.getLogger(__name__)
+
+# Image jobs running at once across all sessions
+MEDIA_WORKERS = int(os.getenv("MEDIA_WORKERS", "4"))
+# Workers kept free of prewarm jobs for on-screen / next images
+MEDIA_PREWARM_RESERVE = int(os.getenv("MEDIA_PREWARM_RESERVE", "1"))
+
+PRIORITY_NOW = 0
+PRIORITY_NEXT = 1
+PRIORITY_PREWARM = 2
+PRIORITY_NAMES = {PRIORITY_NOW: "now", PRIORITY_NEXT: "next", PRIORITY_PREWARM: "prewarm"}
+
+_job_local = threading.local()
+
+
+@dataclass
+class _Job:
+    session_id: str
+    key: str
+    fn: Callable
+    args: Tuple
+    kwargs: Dict[str, Any]
+    priority: int
+    generation: int
+    future: Future = field(default_factory=Future)
+    submitted_at: float = field(default_factory=time.perf_counter)
+
+
+class MediaScheduler:
+    """Bounded, prioritized executor for image generation jobs."""
+
+    def __init__(self, max_workers: int = MEDIA_WORKERS, prewarm_reserve: int = MEDIA_PREWARM_RESERVE):
+        self.max_workers = max(1, max_workers)
+        # At least one worker must be allowed to run prewarm jobs
+        self.prewarm_limit = max(1, self.max_workers - max(0, prewarm_reserve))
+        self._cond = threading.Condition()
+        self._queues: Dict[int, Deque[_Job]] = {p: deque() for p in PRIORITY_NAMES}
+        self._pending: Dict[Tuple[str, str], _Job] = {}  # queued or running, by (session, key)
+        self._generations: Dict[str, int] = {}
+        self._running: Dict[int, int] = {p: 0 for p in PRIORITY_NAMES}
+        self._workers: List[threading.Thread] = []
+        # priority -> [jobs started, total wait ms, max wait ms]
+        self._waits: Dict[int, List[float]] = {p: [0, 0.0, 0.0] for p in PRIORITY_NAMES}
+        self._completed = 0
+        self._cancelled = 0
+
+    # -------------------------------------------------------------------------
+    # Submission
+    # -------------------------------------------------------------------------
+
+    def submit(
+        self,
+        session_id: str,
+        key: str,
+        fn: Callable,
+        *args,
+        priority: int = PRIORITY_PREWARM,
+        **kwargs,
+    ) -> Future:
+        """Queue fn(*args, **kwargs) for a session; returns its Future.
+
+        If the same (session, key) is already queued or running, its Future
+        is returned instead. A queued job is moved up if `priority` is higher.
+        """
+        with self._cond:
+            job = self._pending.get((session_id, key))
+            if job is not None:
+                if priority < job.priority and job in self._queues[job.priority]:
+                    self._queues[job.priority].remove(job)
+                    logger.info(
+                        "[MEDIA] Promoted %s (%s -> %s)",
+                        key, PRIORITY_NAMES[job.priority], PRIORITY_NAMES[priority]
+                    )
+                    job.priority = priority
+                    self._queues[priority].append(job)
+                    self._cond.notify()
+                return job.future
+
+            job = _Job(
+                session_id=session_id,
+                key=key,
+                fn=fn,
+                args=args,
+                kwargs=kwargs,
+                priority=priority,
+                generation=self._generations.get(session_id, 0),
+            )
+            self._pending[(session_id, key)] = job
+            self._queues[priority].append(job)
+            self._ensure_workers()
+            self._cond.notify()
+            depth = sum(len(q) for q in self._queues.values())
+        logger.info(
+            "[MEDIA] Queued %s (%s) for session %s - queue depth %d",
+            key, PRIORITY_NAMES[priority], session_id[:8], depth
+        )
+        return job.future
+
+    def promote(self, session_id: str, key: str, priority: int = PRIORITY_NOW) -> Optional[Future]:
+        """Move a queued job up (e.g. the player is about to see it); None if unknown."""
+        with self._cond:
+            job = self._pending.get((session_id, key))
+        if job is None:
+            return None
+        return self.submit(session_id, key, job.fn, *job.args, priority=priority, **job.kwargs)
+
+    def cancel_session(self, session_id: str) -> int:
+        """Drop a session's queued jobs and mark its running ones as cancelled."""
+        with self._cond:
+            self._generations[session_id] = self._generations.get(session_id, 0) + 1
+            dropped = []
+            for queue in self._queues.values():
+                keep = deque(job for job in queue if job.session_id != session_id)
+                dropped.extend(job for job in queue if job.session_id == session_id)
+                queue.clear()
+                queue.extend(keep)
+            # Running jobs are forgotten too, so new work for the session is
+            # never deduplicated onto a job that will discard its result
+            for pending_key in [k for k in self._pending if k[0] == session_id]:
+                del self._pending[pending_key]
+            self._cancelled += len(dropped)
+        for job in dropped:
+            job.future.cancel()
+        if dropped:
+            logger.info(
+                "[MEDIA] Cancelled %d queued job(s) for session %s", len(dropped), session_id[:8]
+            )
+        return len(dropped)
+
+    def is_cancelled(self, session_id: str, generation: int) -> bool:
+        return self._generations.get(session_id, 0) != generation
+
+    # -------------------------------------------------------------------------
+    # Workers
+    # -------------------------------------------------------------------------
+
+    def _ensure_workers(self):
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(
+                target=self._work,
+                name=f"media-{len(self._workers)}",
+                daemon=True,
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _next_job_locked(self) -> Optional[_Job]:
+        for priority in sorted(self._queues):
+            queue = self._queues[priority]
+            if not queue:
+                continue
+            if priority == PRIORITY_PREWARM and self._running[priority] >= self.prewarm_limit:
+                return None
+            return queue.popleft()
+        return None
+
+    def _work(self):
+        while True:
+            with self._cond:
+                job = self._next_job_locked()
+                while job is None:
+                    self._cond.wait()
+                    job = self._next_job_locked()
+                self._running[job.priority] += 1
+                priority = job.priority
+                wait_ms = (time.perf_counter() - job.submitted_at) * 1000
+                waits = self._waits[priority]
+                waits[0] += 1
+                waits[1] += wait_ms
+                waits[2] = max(waits[2], wait_ms)
+
+            perf.record_queue_wait(f"media:{PRIORITY_NAMES[priority]}", wait_ms)
+            if not job.future.set_running_or_notify_cancel():
+                self._finish(job, priority)
+                continue
+            _job_local.job = job
+            try:
+                job.future.set_result(job.fn(*job.args, **job.kwargs))
+            except BaseException as e:  # noqa: BLE001 - delivered through the Future
+                logger.error("[MEDIA] Job %s failed: %s", job.key, e)
+                job.future.set_exception(e)
+            finally:
+                _job_local.job = None
+                self._finish(job, priority)
+
+    def _finish(self, job: _Job, priority: int):
+        with self._cond:
+            self._running[priority] -= 1
+            self._completed += 1
+            if self._pending.get((job.session_id, job.key)) is job:
+                del self._pending[(job.session_id, job.key)]
+            # A freed worker may unblock a prewarm job held back by the limit
+            self._cond.notify_all()
+
+    # -------------------------------------------------------------------------
+    # Metrics
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, running jobs and wait times per priority class."""
+        with self._cond:
+            return {
+                "workers": self.max_workers,
+                "queued": {PRIORITY_NAMES[p]: len(q) for p, q in self._queues.items()},
+                "running": {PRIORITY_NAMES[p]: n for p, n in self._running.items()},
+                "wait_ms": {
+                    PRIORITY_NAMES[p]: {
+                        "jobs": int(count),
+                        "avg": total / count if count else 0.0,
+                        "max": longest,
+                    }
+                    for p, (count, total, longest) in self._waits.items()
+                },
+                "completed": self._completed,
+                "cancelled": self._cancelled,
+            }
+
+
+def current_job_cancelled() -> bool:
+    """True inside a media job whose session was cancelled after it was queued.
+
+    Jobs call this before storing results so a restarted game doesn't pick
+    up images generated for the previous one.
+    """
+    job = getattr(_job_local, "job", None)
+    if job is None:
+        return False
+    return get_media_scheduler().is_cancelled(job.session_id, job.generation)
+
+
+_scheduler: Optional[MediaScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_media_scheduler() -> MediaScheduler:
+    """Get the process-wide media scheduler."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = MediaScheduler()
+            logger.info(
+                "[MEDIA] Scheduler started: %d workers (%d for prewarm)",
+                _scheduler.max_workers, _scheduler.prewarm_limit
+            )
+        return _scheduler
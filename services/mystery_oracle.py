@@ -19,11 +19,11 @@ Architecture:
 """
 
 import logging
-import os
+import threading
 from typing import Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
-from langchain_openai import ChatOpenAI
+from services.llm_clients import get_chat_model
 from langchain_core.prompts import ChatPromptTemplate
 
 from game.models import Mystery, Suspect, SuspectState
@@ -298,11 +298,7 @@ class MysteryOracle:
         returns the narrative text. The secrets are used to inform
         the response but are not directly exposed.
         """
-        llm = ChatOpenAI(
-            model="gpt-4o",
-            temperature=0.8,
-            api_key=os.getenv("OPENAI_API_KEY"),
-        )
+        llm = get_chat_model("gpt-4o", temperature=0.8)
         
         # Build history context
         history_text = ""
@@ -495,34 +491,54 @@ RESPONSE RULES:
 
 
 # =============================================================================
-# SINGLETON INSTANCE
+# PER-SESSION INSTANCES
 # =============================================================================
+# One Oracle per game session: concurrent games must never see each other's
+# truth. Callers without an explicit session get the session currently being
+# served (see game.state_manager.session_context).
+
+DEFAULT_SESSION_ID = "_default"
+
+# The oracle holds the only copy of a game's truth, so it is never evicted on
+# a timer or count: it lives until reset_mystery_oracle() (new game / restart).
+_oracles: Dict[str, MysteryOracle] = {}
+_oracles_lock = threading.Lock()
 
-_oracle: Optional[MysteryOracle] = None
 
+def _resolve_session_id(session_id: Optional[str]) -> str:
+    if session_id:
+        return session_id
+    from game.state_manager import get_current_session_id
+    return get_current_session_id() or DEFAULT_SESSION_ID
 
-def get_mystery_oracle() -> MysteryOracle:
-    """Get the singleton MysteryOracle instance."""
-    global _oracle
-    if _oracle is None:
-        _oracle = MysteryOracle()
-    return _oracle
+
+def get_mystery_oracle(session_id: Optional[str] = None) -> MysteryOracle:
+    """Get the MysteryOracle for a session (defaults to the current session)."""
+    session_id = _resolve_session_id(session_id)
+    with _oracles_lock:
+        oracle = _oracles.get(session_id)
+        if oracle is None:
+            oracle = _oracles[session_id] = MysteryOracle()
+        return oracle
 
 
 def initialize_mystery_oracle(
     mystery: Mystery,
-    encounter_graph: Optional[EncounterGraph] = None
+    encounter_graph: Optional[EncounterGraph] = None,
+    session_id: Optional[str] = None,
 ):
     """Initialize the Oracle with the mystery truth.
     
     Call this ONCE during game setup.
     """
-    oracle = get_mystery_oracle()
+    oracle = get_mystery_oracle(session_id)
     oracle.initialize(mystery, encounter_graph)
 
 
-def reset_mystery_oracle():
-    """Reset the Oracle for a new game."""
-    oracle = get_mystery_oracle()
-    oracle.reset()
-
+def reset_mystery_oracle(session_id: Optional[str] = None):
+    """Reset the Oracle for a new game and forget the session's instance."""
+    session_id = _resolve_session_id(session_id)
+    with _oracles_lock:
+        oracle = _oracles.pop(session_id, None)
+    if oracle is not None:
+        oracle.reset()
@@ -58,11 +58,17 @@ class PerformanceTracker:
         self._active: Dict[str, TimingEntry] = {}
         self._session_start: Optional[float] = None
         self._session_id: Optional[str] = None
+        # name -> [calls, prompt tokens, cached prompt tokens]
+        self._prompt_cache: Dict[str, List[int]] = {}
+        # queue -> [jobs, total wait ms, max wait ms]
+        self._queue_waits: Dict[str, List[float]] = {}
         
     def reset(self, session_id: str = ""):
         """Reset tracker for a new session."""
         self._entries = []
         self._active = {}
+        self._prompt_cache = {}
+        self._queue_waits = {}
         self._session_start = time.perf_counter()
         self._session_id = session_id
         logger.info("[PERF] Tracker reset for session %s", session_id[:8] if session_id else "unknown")
@@ -131,6 +137,27 @@ class PerformanceTracker:
             details = f"{completed} completed" + (f", {details}" if details else "")
         self.end(name, status="success" if completed else "partial", details=details)
     
+    def record_prompt_tokens(self, name: str, prompt_tokens: int, cached_tokens: int):
+        """Record an LLM call's prompt tokens and how many were served from cache."""
+        totals = self._prompt_cache.setdefault(name, [0, 0, 0])
+        totals[0] += 1
+        totals[1] += prompt_tokens
+        totals[2] += cached_tokens
+    
+    def record_queue_wait(self, name: str, wait_ms: float):
+        """Record how long a job waited in a worker queue before it started."""
+        totals = self._queue_waits.setdefault(name, [0, 0.0, 0.0])
+        totals[0] += 1
+        totals[1] += wait_ms
+        totals[2] = max(totals[2], wait_ms)
+    
+    def get_prompt_cache_ratio(self, name: str) -> Optional[float]:
+        """Fraction of prompt tokens served from the provider's cache (None if no calls)."""
+        totals = self._prompt_cache.get(name)
+        if not totals or not totals[1]:
+            return None
+        return totals[2] / totals[1]
+    
     def get_total_time_ms(self) -> float:
         """Get total elapsed time since session start."""
         if self._session_start is None:
@@ -139,7 +166,12 @@ class PerformanceTracker:
     
     def get_summary(self) -> str:
         """Get a formatted summary of all timings."""
-        if not self._entries and not self._active:
+        if (
+            not self._entries
+            and not self._active
+            and not self._prompt_cache
+            and not self._queue_waits
+        ):
             return "No performance data captured yet."
         
         lines = []
@@ -192,6 +224,28 @@ class PerformanceTracker:
             
             lines.append("")
         
+        # Prompt caching
+        if self._prompt_cache:
+            lines.append("🧠 PROMPT CACHE:")
+            lines.append("-" * 40)
+            for name, (calls, prompt_tokens, cached_tokens) in self._prompt_cache.items():
+                ratio = cached_tokens / prompt_tokens * 100 if prompt_tokens else 0
+                lines.append(
+                    f"{name}: {cached_tokens}/{prompt_tokens} prompt tokens cached "
+                    f"({ratio:.0f}%) over {calls} call(s)"
+                )
+            lines.append("")
+        
+        # Worker queue waits
+        if self._queue_waits:
+            lines.append("⏳ QUEUE WAIT:")
+            lines.append("-" * 40)
+            for name, (jobs, total_ms, max_ms) in sorted(self._queue_waits.items()):
+                lines.append(
+                    f"{name}: avg {total_ms / jobs:.0f}ms, max {max_ms:.0f}ms over {int(jobs)} job(s)"
+                )
+            lines.append("")
+        
         # Bottleneck analysis
         if self._entries:
             lines.append("🎯 BOTTLENECK ANALYSIS:")
@@ -0,0 +1,328 @@
+"""Sentence-level streaming TTS for Game Master narration.
+
+Without streaming, TTS for a Game Master turn only starts after the agent has
+produced its whole response. With it, process_message forwards response tokens
+as the model generates them; SpeechStream cuts them into sentences and sends
+each finished sentence to TTS right away, so most of the audio already exists
+by the time the response is complete.
+
+Segments are synthesized in parallel but always delivered in sentence order.
+They are held back until finish() confirms the response is the Game Master's
+final message (narration before a tool call is discarded, and a suspect's
+reply is cancelled). process_message calls finish() the moment that message
+has streamed to its end, so the UI starts pulling finished segments with
+take_ready() while the turn is still wrapping up; most of them were
+synthesized while the model was still generating.
+
+Afterwards generate_turn_media joins the segments into a single clip (with
+offset word timestamps for subtitles) when the streamed text matches the final
+response; that clip is the replay/subtitle version, or the turn's audio if
+nothing was played live. It falls back to one-shot TTS otherwise (e.g. the
+turn ended with a suspect speaking).
+
+Usage:
+    from services.speech_stream import start_speech_stream, peek_speech_stream, pop_speech_stream
+
+    stream = start_speech_stream(session_id, voice_id)
+    process_message(..., on_token=stream.feed)
+    stream.finish()
+
+    # UI thread, meanwhile
+    for audio_path in peek_speech_stream(session_id).take_ready():
+        play(audio_path)
+
+    stream = pop_speech_stream(session_id)
+    if stream and stream.matches(text):
+        audio_path, alignment = stream.merged()
+"""
+
+import logging
+import os
+import re
+import tempfile
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Set to false to always synthesize the full response after the agent finishes
+GM_STREAM_TTS = os.getenv("GM_STREAM_TTS", "true").lower() == "true"
+# Parallel TTS requests per process for streamed sentences
+GM_STREAM_TTS_WORKERS = int(os.getenv("GM_STREAM_TTS_WORKERS", "3"))
+# Short sentences are merged with the next one so segments don't sound choppy
+GM_STREAM_TTS_MIN_CHARS = int(os.getenv("GM_STREAM_TTS_MIN_CHARS", "40"))
+
+# tts_service requests mp3_44100_128, which is constant bitrate
+_MP3_BYTES_PER_SECOND = 128_000 / 8
+
+# End of sentence: terminal punctuation, optional closing quotes, then whitespace
+_SENTENCE_END_RE = re.compile(r"[.!?…]+[\"'”’)]*\s+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+Segment = Tuple[Optional[str], Optional[List[Dict]]]
+
+
+def _clean_for_speech(text: str) -> str:
+    """Same cleanup generate_turn_media applies before TTS."""
+    text = text.replace("**", "").replace("*", "")
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+class SentenceSplitter:
+    """Incrementally split streamed text into speakable sentences.
+
+    Bracketed game markers ([SEARCHED:...], [SCENE_BRIEF{...}], ...) are
+    dropped as they stream past, so they are never spoken.
+    """
+
+    def __init__(self, min_chars: int = GM_STREAM_TTS_MIN_CHARS):
+        self.min_chars = min_chars
+        self._buffer = ""
+        self._depth = 0  # > 0 while inside a [...] marker
+
+    def _strip_markers(self, text: str) -> str:
+        out = []
+        for ch in text:
+            if ch == "[":
+                self._depth += 1
+            elif ch == "]" and self._depth:
+                self._depth -= 1
+            elif not self._depth:
+                out.append(ch)
+        return "".join(out)
+
+    def feed(self, text: str) -> List[str]:
+        """Add streamed text; return any sentences that are now complete."""
+        self._buffer += self._strip_markers(text)
+        sentences = []
+        start = 0
+        for match in _SENTENCE_END_RE.finditer(self._buffer):
+            sentence = _clean_for_speech(self._buffer[start:match.end()])
+            if len(sentence) < self.min_chars:
+                continue  # Keep accumulating into the next sentence
+            sentences.append(sentence)
+            start = match.end()
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> List[str]:
+        """Return whatever is left (an unterminated last sentence)."""
+        rest = _clean_for_speech(self._buffer)
+        self._buffer = ""
+        self._depth = 0
+        return [rest] if rest else []
+
+
+def speakable_text(text: str) -> str:
+    """The text a SpeechStream would speak for a complete response."""
+    splitter = SentenceSplitter(min_chars=0)
+    return " ".join(splitter.feed(text) + splitter.flush())
+
+
+class SpeechStream:
+    """Ordered sentence-by-sentence TTS for one Game Master response."""
+
+    def __init__(
+        self,
+        voice_id: Optional[str],
+        speaker_name: str = "Game Master",
+        executor: Optional[ThreadPoolExecutor] = None,
+    ):
+        self.voice_id = voice_id
+        self.speaker_name = speaker_name
+        self._executor = executor or _get_executor()
+        self._lock = threading.Lock()
+        self._splitter = SentenceSplitter()
+        self._message_id: Optional[str] = None
+        self._sentences: List[str] = []
+        self._futures: List[Future] = []
+        self._cursor = 0  # Next segment take_ready() hands out
+        self._cancelled = False
+        self._released = False  # Set by finish(): segments may be played live
+        self.delivered = 0  # Segments handed to the UI for live playback
+        self.merged_path: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        return " ".join(self._sentences)
+
+    def feed(self, token: str, message_id: Optional[str] = None):
+        """Add a response token; synthesize each sentence as soon as it ends.
+
+        A new message_id means the agent started another message (e.g. after a
+        tool call), so earlier narration is discarded - only the last message
+        becomes the turn's response.
+        """
+        with self._lock:
+            if self._cancelled:
+                return
+            if message_id and message_id != self._message_id:
+                if self._message_id is not None:
+                    self._discard()
+                self._message_id = message_id
+            for sentence in self._splitter.feed(token):
+                self._submit(sentence)
+
+    def finish(self):
+        """The Game Master's response is complete: synthesize the trailing
+        sentence and release the segments for live playback.
+
+        Safe to call more than once.
+        """
+        with self._lock:
+            if self._cancelled:
+                return
+            for sentence in self._splitter.flush():
+                self._submit(sentence)
+            self._released = True
+
+    def cancel(self):
+        """Drop queued segments (the turn's audio comes from elsewhere)."""
+        with self._lock:
+            self._cancelled = True
+            self._discard()
+
+    def matches(self, text: str) -> bool:
+        """True if the streamed sentences are exactly what `text` would speak."""
+        return bool(self._sentences) and self.text == speakable_text(text)
+
+    def _discard(self):
+        for future in self._futures:
+            future.cancel()
+        self._sentences = []
+        self._futures = []
+        self._cursor = 0
+        self._splitter = SentenceSplitter(self._splitter.min_chars)
+
+    def _submit(self, sentence: str):
+        from services.tts_service import text_to_speech
+
+        logger.info(
+            "[TTS] Streaming sentence %d (%d chars)", len(self._sentences) + 1, len(sentence)
+        )
+        self._sentences.append(sentence)
+        self._futures.append(
+            self._executor.submit(
+                text_to_speech, sentence, self.voice_id, speaker_name=self.speaker_name
+            )
+        )
+
+    def take_ready(self) -> List[str]:
+        """Audio paths of segments finished since the last call, in sentence order.
+
+        Never blocks: stops at the first segment still being synthesized.
+        Failed segments are skipped (the merged clip falls back to full TTS).
+        Returns nothing until finish() has released the response.
+        """
+        paths = []
+        with self._lock:
+            if not self._released:
+                return paths
+            while self._cursor < len(self._futures) and self._futures[self._cursor].done():
+                future = self._futures[self._cursor]
+                self._cursor += 1
+                if future.cancelled() or future.exception() is not None:
+                    continue
+                path, _words = future.result()
+                if path:
+                    paths.append(path)
+            self.delivered += len(paths)
+        return paths
+
+    def pending(self) -> bool:
+        """True while take_ready() still has segments to hand out."""
+        with self._lock:
+            return self._released and self._cursor < len(self._futures)
+
+    def segments(self, timeout: Optional[float] = None) -> Iterator[Segment]:
+        """Yield (audio_path, word_timestamps) per sentence, in order, as each is ready."""
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
+            yield future.result(timeout=timeout)
+
+    def merged(self, timeout: Optional[float] = None) -> Segment:
+        """Join all segments into one clip with word timestamps offset to match.
+
+        Returns (None, None) if any segment failed, so the caller can fall back
+        to synthesizing the whole response at once.
+        """
+        try:
+            segments = list(self.segments(timeout=timeout))
+        except Exception as e:
+            logger.warning("[TTS] Streamed segment failed: %s", e)
+            return None, None
+        if not segments or any(path is None for path, _ in segments):
+            return None, None
+        if len(segments) == 1:
+            self.merged_path = segments[0][0]
+            return segments[0]
+
+        audio_dir = os.path.join(tempfile.gettempdir(), "murder_mystery_audio")
+        os.makedirs(audio_dir, exist_ok=True)
+        audio_path = os.path.join(audio_dir, f"tts_{uuid.uuid4().hex[:8]}.mp3")
+
+        alignment: Optional[List[Dict]] = []
+        offset = 0.0
+        with open(audio_path, "wb") as out:
+            for path, words in segments:
+                with open(path, "rb") as f:
+                    data = f.read()
+                out.write(data)
+                if alignment is not None and words:
+                    alignment.extend(
+                        {**w, "start": w["start"] + offset, "end": w["end"] + offset}
+                        for w in words
+                    )
+                else:
+                    alignment = None  # Partial subtitles would drift; show none
+                offset += len(data) / _MP3_BYTES_PER_SECOND
+
+        logger.info(
+            "[TTS] Merged %d streamed segments (%.1fs) -> %s",
+            len(segments), offset, audio_path
+        )
+        self.merged_path = audio_path
+        return audio_path, alignment
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_streams: Dict[str, SpeechStream] = {}
+_streams_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _streams_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=GM_STREAM_TTS_WORKERS, thread_name_prefix="stream-tts"
+            )
+        return _executor
+
+
+def start_speech_stream(
+    session_id: str, voice_id: Optional[str], speaker_name: str = "Game Master"
+) -> SpeechStream:
+    """Begin streaming TTS for a session's turn (replaces any unclaimed stream)."""
+    stream = SpeechStream(voice_id, speaker_name)
+    with _streams_lock:
+        previous = _streams.pop(session_id, None)
+        _streams[session_id] = stream
+    if previous is not None:
+        previous.cancel()
+    return stream
+
+
+def peek_speech_stream(session_id: str) -> Optional[SpeechStream]:
+    """The session's current stream, without claiming it (for live playback)."""
+    with _streams_lock:
+        return _streams.get(session_id)
+
+
+def pop_speech_stream(session_id: str) -> Optional[SpeechStream]:
+    """Claim the session's streamed audio for this turn, if any."""
+    with _streams_lock:
+        return _streams.pop(session_id, None)
@@ -0,0 +1,83 @@
+"""Agent threads checkpointed by LatestCheckpointSaver survive a process restart.
+
+Each step runs in a fresh Python process against the same SQLite file, so
+nothing carries over in memory (conversation history epochs included).
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PRELUDE = """
+from services.agent import _load_history_window, create_game_master_agent, record_turn
+from services.agent_history import reset_conversation_history
+
+app = create_game_master_agent("sqlite")
+config = {"configurable": {"thread_id": "thread-1", "session_id": "session-1"}}
+
+def transcript():
+    kept, _folded, _epoch = _load_history_window(app, config, "thread-1")
+    return [m.content for m in kept]
+"""
+
+
+def _run(db_path: str, body: str) -> str:
+    """Run a snippet in a new interpreter; returns its last stdout line."""
+    env = dict(
+        os.environ,
+        AGENT_CHECKPOINT_DB=db_path,
+        AGENT_HISTORY_SUMMARY="false",
+        OPENAI_API_KEY=os.environ.get("OPENAI_API_KEY", "sk-test"),
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", _PRELUDE + textwrap.dedent(body)],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    lines = result.stdout.strip().splitlines()
+    return lines[-1] if lines else ""
+
+
+def test_thread_resumes_after_restart(tmp_path):
+    db_path = str(tmp_path / "checkpoints.sqlite")
+
+    # First process: a new game, two turns
+    _run(db_path, """
+        reset_conversation_history("thread-1")
+        record_turn(app, "Who found the body?", "The butler did.", "session-1", "thread-1")
+        record_turn(app, "Where was he?", "In the library.", "session-1", "thread-1")
+        print(transcript())
+    """)
+
+    # Second process: the same thread picks up where the first left off
+    resumed = _run(db_path, """
+        record_turn(app, "And the maid?", "Asleep upstairs.", "session-1", "thread-1")
+        print(transcript())
+    """)
+    assert resumed == str([
+        "Who found the body?", "The butler did.",
+        "Where was he?", "In the library.",
+        "And the maid?", "Asleep upstairs.",
+    ])
+
+
+def test_new_game_after_restart_starts_fresh(tmp_path):
+    db_path = str(tmp_path / "checkpoints.sqlite")
+
+    _run(db_path, """
+        reset_conversation_history("thread-1")
+        record_turn(app, "Who found the body?", "The butler did.", "session-1", "thread-1")
+    """)
+
+    fresh = _run(db_path, """
+        reset_conversation_history("thread-1")
+        print(transcript())
+    """)
+    assert fresh == "[]"
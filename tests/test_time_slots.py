@@ -0,0 +1,56 @@
+"""time_slots_for maps free-text times onto the encounter graph's TimeSlots."""
+
+import pytest
+
+from game.encounter_graph import TimeSlot, time_slots_for
+
+CRITICAL = frozenset({TimeSlot.CRITICAL_WINDOW})
+
+
+@pytest.mark.parametrize("text", ["9pm", "9 PM", "9:00 p.m.", "around 9 o'clock"])
+def test_twelve_hour_times(text):
+    assert time_slots_for(text) == CRITICAL
+
+
+@pytest.mark.parametrize("text", ["21:00", "21:05", "9:00"])
+def test_twenty_four_hour_times_match_twelve_hour(text):
+    assert time_slots_for(text) == time_slots_for("9pm")
+
+
+def test_twenty_four_hour_time_near_a_boundary():
+    assert time_slots_for("20:50") == frozenset(
+        {TimeSlot.DINNER_MAIN, TimeSlot.CRITICAL_WINDOW}
+    )
+
+
+def test_bare_twelve_means_midnight():
+    assert time_slots_for("12:30") == frozenset({TimeSlot.LATE_EVENING})
+
+
+def test_range_covers_every_slot_in_between():
+    assert time_slots_for("8:00 PM - 9:30 PM") == frozenset(
+        {TimeSlot.DINNER_MAIN, TimeSlot.CRITICAL_WINDOW, TimeSlot.POST_DISCOVERY}
+    )
+
+
+def test_partially_parsed_range_is_unknown():
+    # "8" alone is not a clock time; answering only 9 o'clock would be too narrow
+    assert time_slots_for("from 8 till 9 o'clock") == frozenset()
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("during dinner", {TimeSlot.DINNER_START, TimeSlot.DINNER_MAIN}),
+        ("at the time of the murder", {TimeSlot.CRITICAL_WINDOW}),
+        ("after the body was found", {TimeSlot.POST_DISCOVERY}),
+        ("critical_window", {TimeSlot.CRITICAL_WINDOW}),
+    ],
+)
+def test_phrases(text, expected):
+    assert time_slots_for(text) == frozenset(expected)
+
+
+@pytest.mark.parametrize("text", [None, "", "I was reading"])
+def test_no_time_is_unknown(text):
+    assert time_slots_for(text) == frozenset()